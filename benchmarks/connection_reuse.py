@@ -0,0 +1,66 @@
+"""
+Counts the TCP connections (and therefore TCP/TLS handshakes) opened per command
+when the API client talks to a local mock server, before and after pooling.
+
+Usage:
+    python benchmarks/connection_reuse.py [--pages 20]
+"""
+import argparse
+import tempfile
+import requests
+from pathlib import Path
+from idmc_cli.api import InformaticaCloudAPI
+from idmc_cli.mockserver import MockServer, MockData
+from idmc_cli.session import SessionStore
+
+
+class UnpooledSession:
+    """Reproduces the previous behaviour of calling the module level requests functions"""
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def run(api, server, command):
+    before = server.stats['connections']
+    command(api)
+    return server.stats['connections'] - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=20, help='Number of pages returned by each paginated endpoint')
+    args = parser.parse_args()
+
+    records = args.pages * 100
+    server = MockServer(data=MockData(users=records, objects=records, logs=records)).start()
+
+    api = InformaticaCloudAPI()
+    api.username = 'bench'
+    api.password = 'bench'
+    api.sessions = SessionStore('bench', path=Path(tempfile.mkdtemp()) / 'session.json')
+    api.page_size = 100
+    api.page_window = 1
+    api.login_url = server.url
+    api.base_url = server.url
+    api.login()
+
+    commands = {
+        'users get': lambda api: api.getUsers(),
+        'objects query': lambda api: api.queryObjects(),
+        'logs security': lambda api: api.getSecurityLogs(None, None, None, None, None),
+    }
+
+    print(f'{ "command":<16}{ "requests":>10}{ "before":>10}{ "after":>10}')
+    for name, command in commands.items():
+        api.session = UnpooledSession()
+        before = run(api, server, command)
+        api.session = api.createSession()
+        after = run(api, server, command)
+        print(f'{ name:<16}{ args.pages + 1:>10}{ before:>10}{ after:>10}')
+
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures how long records take to flatten into a data frame for a csv output file, a row
+at a time as before and a column at a time as now. Both encode every nested value as JSON
+in Python; the time saved comes from building the frame a column at a time. Only --unnest
+converts nested values to struct and list columns and flattens them in polars.
+
+Usage:
+    python benchmarks/flatten.py [--records 100000] [--runs 5]
+"""
+import argparse
+import json
+import time
+from statistics import median
+import polars as pl
+from idmc_cli.cli import flatten_frame, records_frame
+
+
+def makeRecords(count):
+    """This function returns object records shaped like those listed by the objects get command"""
+
+    return [{
+        'id': f'obj{ i:019d}',
+        'path': f'Project{ i % 10 }/Folder{ i % 7 }/asset{ i }',
+        'type': ['DTEMPLATE', 'MTT', 'TASKFLOW'][i % 3],
+        'description': f'Synthetic asset { i }',
+        'updatedBy': f'user{ i % 50 }@example.com',
+        'updateTime': '2024-01-01T00:00:00.000Z',
+        'tags': [f'tag{ i % 5 }', f'tag{ i % 3 }'],
+        'sourceControl': { 'checkedOutBy': None, 'lastCheckinBy': f'user{ i % 50 }@example.com', 'hash': f'{ i:040d}' },
+        'customAttributes': { 'owner': f'team{ i % 4 }', 'tier': i % 3 }
+    } for i in range(count)]
+
+
+def flattenRows(records):
+    """This function flattens the records a row and key at a time, as before"""
+
+    flat_list = []
+    for row in records:
+        flat_dict = {}
+        for key, value in row.items():
+            if isinstance(value, dict) or isinstance(value, list):
+                flat_dict[key] = json.dumps(value)
+            else:
+                flat_dict[key] = value
+        flat_list.append(flat_dict)
+    return pl.from_dicts(flat_list)
+
+
+def measure(flatten, records, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        flatten(records)
+        times.append(time.perf_counter() - start)
+    return median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=100000, help='Number of records to flatten')
+    parser.add_argument('--runs', type=int, default=5, help='Number of runs of each implementation, the median is reported')
+    args = parser.parse_args()
+
+    records = makeRecords(args.records)
+    implementations = {
+        'rows (before)': flattenRows,
+        'columns': lambda records: flatten_frame(records_frame(records, nested=False)),
+        'columns --unnest': lambda records: flatten_frame(records_frame(records), unnest=True)
+    }
+
+    print(f'{ "implementation":<20}{ "time":>10}{ "records/s":>14}')
+    for name, flatten in implementations.items():
+        seconds = measure(flatten, records, args.runs)
+        print(f'{ name:<20}{ seconds:>9.3f}s{ args.records / seconds:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main()
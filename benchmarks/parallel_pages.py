@@ -0,0 +1,63 @@
+"""
+Measures how long the paginated commands take against a local mock server with
+a simulated round trip latency, fetching pages one at a time and with a window
+of pages in flight.
+
+Usage:
+    python benchmarks/parallel_pages.py [--pages 50] [--latency 0.05] [--window 8]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from idmc_cli.api import InformaticaCloudAPI
+from idmc_cli.mockserver import MockServer, MockData
+from idmc_cli.session import SessionStore
+
+
+def run(api, command):
+    start = time.perf_counter()
+    result = command(api)
+    return time.perf_counter() - start, len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=50, help='Number of pages returned by each paginated endpoint')
+    parser.add_argument('--latency', type=float, default=0.05, help='Simulated server latency per request in seconds')
+    parser.add_argument('--window', type=int, default=8, help='Number of pages fetched in parallel')
+    args = parser.parse_args()
+
+    records = args.pages * 100
+    server = MockServer(data=MockData(users=records, objects=records, logs=records), latency=args.latency).start()
+
+    api = InformaticaCloudAPI()
+    api.username = 'bench'
+    api.password = 'bench'
+    api.sessions = SessionStore('bench', path=Path(tempfile.mkdtemp()) / 'session.json')
+    api.page_size = 100
+    api.pool_size = args.window
+    api.login_url = server.url
+    api.base_url = server.url
+    api.session = api.createSession()
+    api.login()
+
+    commands = {
+        'users get': lambda api: api.getUsers(),
+        'objects query': lambda api: api.queryObjects(),
+        'logs security': lambda api: api.getSecurityLogs(None, None, None, None, None),
+    }
+
+    print(f'{ "command":<16}{ "records":>10}{ "serial":>10}{ "parallel":>10}')
+    for name, command in commands.items():
+        api.page_window = 1
+        serial, records = run(api, command)
+        api.page_window = args.window
+        parallel, records = run(api, command)
+        print(f'{ name:<16}{ records:>10}{ serial:>9.2f}s{ parallel:>9.2f}s')
+
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
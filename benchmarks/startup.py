@@ -0,0 +1,48 @@
+"""
+Measures how long the CLI takes to start and run a command that needs no API call,
+before and after its commands were loaded lazily. The previous behaviour is reproduced
+by importing every command module and polars before running the command.
+
+Usage:
+    python benchmarks/startup.py [--runs 7]
+"""
+import argparse
+import subprocess
+import sys
+import time
+from statistics import median
+
+LAZY = 'from idmc_cli.cli import idmc; idmc()'
+EAGER = 'import importlib, polars; from idmc_cli.cli import idmc, commands; [importlib.import_module(module) for module, attribute in commands.values()]; idmc()'
+
+COMMANDS = [
+    ['--help'],
+    ['cache', 'clear', '--help'],
+    ['jobs', 'start', '--help'],
+    ['users', 'get', '--help']
+]
+
+
+def measure(code, args, runs):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code, *args], stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7, help='Number of runs of each command, the median is reported')
+    args = parser.parse_args()
+
+    print(f'{ "command":<24}{ "before":>10}{ "after":>10}')
+    for command in COMMANDS:
+        before = measure(EAGER, command, args.runs)
+        after = measure(LAZY, command, args.runs)
+        print(f'{ " ".join(command):<24}{ before:>9.3f}s{ after:>9.3f}s')
+
+
+if __name__ == '__main__':
+    main()
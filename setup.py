@@ -14,6 +14,9 @@ setup(
         'polars',
         'xlsxwriter'
     ],
+    extras_require={
+        'zstd': ['zstandard'],
+    },
     entry_points={
         'console_scripts': [
             'idmc = idmc_cli.cli:idmc',
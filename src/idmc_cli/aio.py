@@ -0,0 +1,94 @@
+import asyncio
+import contextvars
+import functools
+import inspect
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from idmc_cli.api import InformaticaCloudAPI
+
+class AsyncInformaticaCloudAPI:
+    """
+    Asyncio client exposing every InformaticaCloudAPI operation as a coroutine, and each
+    iter* operation as an async iterator of its records.
+
+    Calls run on a bounded pool of worker threads that share the pooled session of the
+    wrapped client, so at most `concurrency` API calls are in flight at once and each of
+    them has a warm keep-alive connection available.
+
+        async with AsyncInformaticaCloudAPI(concurrency=20) as client:
+            jobs = await asyncio.gather(*(client.startCdiJob(id=id, type='MTT') for id in ids))
+            async for user in client.iterUsers():
+                ...
+    """
+
+    def __init__(self, client=None, concurrency=None):
+        self.client = client or InformaticaCloudAPI()
+        self.concurrency = concurrency or self.client.pool_size
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='idmc')
+
+    async def run(self, func, *args, **kwargs):
+        """This function runs a blocking callable on the client's worker threads"""
+
+        # Run in a copy of the caller's context so that the call is traced as its child
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(contextvars.copy_context().run, func, *args, **kwargs))
+
+    async def gather(self, calls):
+        """This function runs a list of (method name, keyword arguments) calls concurrently and returns the results in order"""
+
+        return await asyncio.gather(*(getattr(self, name)(**kwargs) for name, kwargs in calls))
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+
+def asyncMethod(name):
+    """This function wraps a synchronous API method as a coroutine of the async client"""
+
+    func = getattr(InformaticaCloudAPI, name)
+
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        return await self.run(getattr(self.client, name), *args, **kwargs)
+
+    return method
+
+
+def asyncIterMethod(name):
+    """This function wraps a synchronous iter* API method as an async iterator, fetching each page of records on a worker thread"""
+
+    func = getattr(InformaticaCloudAPI, name)
+
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        records = await self.run(getattr(self.client, name), *args, **kwargs)
+
+        # Errors such as an unconfigured CLI are returned instead of a generator
+        if not isinstance(records, Iterator):
+            yield records
+            return
+
+        while batch := await self.run(lambda: list(islice(records, self.client.page_size))):
+            for record in batch:
+                yield record
+
+    return method
+
+
+# Methods used by the API operations themselves, which are not exposed
+internal_methods = ['createSession', 'sessionHeaders', 'debugRequest', 'executeRequest', 'recordAttempt', 'ensureSession', 'refreshSession', 'loginSession', 'paginate', 'runConcurrently', 'resolve', 'resolveMany']
+
+# Expose the same method surface as the synchronous client
+for name, func in inspect.getmembers(InformaticaCloudAPI, inspect.isfunction):
+    if name.startswith('iter'):
+        setattr(AsyncInformaticaCloudAPI, name, asyncIterMethod(name))
+    elif not name.startswith('_') and name not in internal_methods:
+        setattr(AsyncInformaticaCloudAPI, name, asyncMethod(name))
+
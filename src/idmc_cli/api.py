@@ -1,28 +1,420 @@
 import requests
+import contextvars
 import json
 import fnmatch
+import inspect
 import time
 import re
 import shortuuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
+from http.cookiejar import DefaultCookiePolicy
 from urllib.parse import quote
 from idmc_cli.config import config
+from idmc_cli.paginate import Paginator, PageError, SKIP_LIMIT, OFFSET_ROW_LIMIT, ODATA, PAGE_PER_PAGE
+from idmc_cli.session import SessionStore, SESSION_FILE
+from idmc_cli.cache import ResolutionCache, CACHE_FILE
+from idmc_cli.catalog import ObjectCatalog, CATALOG_FILE
+from idmc_cli.stats import RequestStats, TimedHTTPAdapter, endpointOf
+from idmc_cli.trace import tracer, traced
+from idmc_cli.retry import RetryPolicy, IDEMPOTENT, NON_IDEMPOTENT, POLLING, SESSION, policyFor
+
+# Statuses of a login that rejected the credentials, which is not tried again
+rejected_login = (400, 401, 403)
+
+# Marks the worker threads that run concurrent API calls
+workers = threading.local()
 
 class InformaticaCloudAPI:
-    def __init__(self):
+    def __init__(self, config=config):
+        self.config = config
         self.pod = config.get("pod")
         self.region = config.get("region")
         self.username = config.get("username")
-        self.password = config.get("password")
-        self.session_id = config.get("sessionId")
+        self._password = None
         self.max_attempts = config.get("maxAttempts")
         self.page_size = config.get("pageSize")
-    
+        self.pool_size = config.get("poolSize", 10)
+        self.page_window = config.get("pageWindow", 4)
+        self.page_metrics = []
+
+        # Allow the URLs to be overridden, e.g. to point at the local mock server
+        self.login_url = config.get("loginUrl") or f'https://{ self.region }.informaticacloud.com'
+        self.base_url = config.get("baseUrl") or f'https://{ self.pod }.{ self.region }.informaticacloud.com'
+
+        # Keep the session, cache and catalog next to the config file they belong to
+        directory = config.config_path.parent
+        self.sessions = SessionStore(f'{ self.username }@{ self.login_url }', config.get("sessionTimeout", 1800), path=directory / SESSION_FILE.name)
+        self.failed_login = None
+        self.session_id = self.sessions.session_id
+        self.cache = ResolutionCache(f'{ self.username }@{ self.login_url }', config.get("cacheTtl", 3600), path=directory / CACHE_FILE.name)
+        self.org_ttl = config.get("orgTtl", 86400)
+        self.lookup_batch_size = config.get("lookupBatchSize", 100)
+        self.inventory = None
+        self.catalog = ObjectCatalog(f'{ self.username }@{ self.login_url }', path=directory / CATALOG_FILE.name)
+        self.catalog_synced = False
+        self.stats = RequestStats()
+        self.session = self.createSession()
+        self.executor = None
+        self.executor_lock = threading.Lock()
+
+    @property
+    def password(self):
+        """The password, only decrypted once it is needed to log in"""
+
+        if self._password is None:
+            self._password = self.config.get("password")
+        return self._password
+
+    @password.setter
+    def password(self, value):
+        self._password = value
+
     #############################
     # Admin section
     #############################
 
+    def createSession(self):
+        """This function creates the pooled keep-alive HTTP session shared by all API calls"""
+
+        session = requests.Session()
+
+        # Never replay cookies between calls, the session ID is always sent explicitly
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        # Keep a pool of warm connections for each host (login, pod and any redirects)
+        adapter = TimedHTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    def sessionHeaders(self, authType, headers=None):
+        """This function adds the current session credentials to the request headers"""
+
+        if headers is None:
+            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json' }
+        else:
+            headers = dict(headers)
+
+        if authType == 'v3':
+            headers['INFA-SESSION-ID'] = self.session_id
+        elif authType == 'v2':
+            headers['icSessionId'] = self.session_id
+        elif authType == 'cookie':
+            xsrf = shortuuid.uuid()
+            headers['XSRF_TOKEN'] = xsrf
+            headers['Cookie'] = f'USER_SESSION={ self.session_id }; XSRF_TOKEN={ xsrf }'
+
+        return headers
+
+    def executeRequest(self, method, url, authType='v3', headers=None, policy=None, debug=False, **kwargs):
+        """
+        This function executes an API call and returns the final response.
+
+        Expired sessions are refreshed by logging in again, while throttled (429) and
+        transient server or connection failures are retried with exponential backoff
+        and jitter, honouring any Retry-After header. The policy decides which failures
+        are safe to retry, by default based on whether the HTTP method is idempotent.
+        """
+
+        policy = policy or policyFor(method)
+        maxAttempts = policy.max_attempts if policy.max_attempts is not None else self.max_attempts
+        if authType == 'basic':
+            kwargs['auth'] = (self.username, self.password)
+        attempts = 0
+
+        while True:
+
+            # Refresh the session shortly before it expires, returning the error if the login fails
+            if authType in ['v3', 'v2', 'cookie'] and policy.relogin:
+                failed = self.ensureSession(debug=debug)
+                if failed is not None:
+                    return failed
+            sessionId = self.session_id
+
+            # Execute the API call with the latest session ID
+            started = time.perf_counter()
+            self.stats.start()
+            try:
+                r = self.session.request(method, url, headers=self.sessionHeaders(authType, headers), allow_redirects=False, **kwargs)
+            except policy.errors:
+                if attempts >= maxAttempts:
+                    self.recordAttempt(method, url, started, attempts, outcome='error')
+                    raise
+                self.recordAttempt(method, url, started, attempts, outcome='retry')
+                time.sleep(policy.delay(attempts))
+                attempts = attempts + 1
+                continue
+
+            if debug:
+                self.debugRequest(r, attempts)
+
+            # Return the response after the maximum number of attempts
+            if attempts >= maxAttempts:
+                self.recordAttempt(method, url, started, attempts, r)
+                return r
+            # Check for expired session token
+            elif authType in ['v3', 'v2', 'cookie'] and r.status_code in policy.relogin:
+                self.recordAttempt(method, url, started, attempts, r, outcome='relogin')
+                failed = self.refreshSession(sessionId, debug=debug)
+                if failed is not None:
+                    return failed
+                attempts = attempts + 1
+                continue
+            # Back off when throttled or when there is a transient failure
+            elif r.status_code in policy.statuses:
+                self.recordAttempt(method, url, started, attempts, r, outcome='retry')
+                time.sleep(policy.delay(attempts, r))
+                attempts = attempts + 1
+                continue
+            else:
+                self.recordAttempt(method, url, started, attempts, r)
+                return r
+
+    def recordAttempt(self, method, url, started, attempts, r=None, outcome='ok'):
+        """This function records the timing of an attempt of an API call for the --stats and --trace-out options"""
+
+        self.stats.record(method, url, started, r, outcome)
+
+        endpoint = endpointOf(method, url)
+        tracer.record(endpoint, started, kind='client', **{
+            'http.request.method': method,
+            'http.route': endpoint.split(' ', 1)[1],
+            'http.response.status_code': r.status_code if r is not None else None,
+            'http.request.body.size': len(r.request.body or '') if r is not None else None,
+            'http.response.body.size': len(r.content) if r is not None else None,
+            'idmc.attempt': attempts + 1,
+            'idmc.outcome': outcome
+        })
+
+    def ensureSession(self, debug=False):
+        """This function logs in before the shared session expires, returning the response of a failed login"""
+
+        if not self.sessions.valid():
+            return self.refreshSession(debug=debug)
+
+    def refreshSession(self, stale=None, debug=False):
+        """
+        This function logs in again, unless another thread or process has already replaced the
+        stale or expired session, and returns the response of the login if it failed. A failed
+        login is not tried again by other calls, so that bad credentials do not lock the account.
+        """
+
+        with self.sessions.lock():
+            self.sessions.load()
+            if self.sessions.session_id != stale and self.sessions.valid():
+                self.session_id = self.sessions.session_id
+            elif self.failed_login is not None:
+                return self.failed_login
+            elif self.username:
+                r = self.loginSession(debug=debug)
+                if r.status_code < 200 or r.status_code > 299:
+
+                    # Only remember rejected credentials, not a login that was throttled or failed for a transient reason
+                    if r.status_code in rejected_login:
+                        self.failed_login = r
+                    return r
+
+    def paginate(self, fetchPage, records, style=SKIP_LIMIT, count=None, maxPageSize=None):
+        """This function returns a generator of the records of a list endpoint, fetched page by page"""
+
+        # Some endpoints cap the page size, so always advance by the size actually requested
+        pageSize = min(self.page_size, maxPageSize) if maxPageSize else self.page_size
+
+        paginator = Paginator(fetchPage, records, style, pageSize, self.page_window, count)
+        self.page_metrics = paginator.metrics
+
+        return chain.from_iterable(paginator)
+
+    def runConcurrently(self, calls):
+        """
+        This function runs a list of (method name, keyword arguments) calls concurrently on the shared pool of
+        poolSize worker threads and returns the results in order. Calls made from a worker thread run one after
+        the other on that thread instead, so that nested calls stay within the pool and never wait for it.
+        """
+
+        if getattr(workers, 'active', False):
+            return [getattr(self, name)(**kwargs) for name, kwargs in calls]
+
+        with self.executor_lock:
+            if self.executor is None:
+                self.executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix='idmc', initializer=lambda: setattr(workers, 'active', True))
+
+        # Run each call in a copy of the caller's context so that it is traced as its child
+        futures = [self.executor.submit(contextvars.copy_context().run, getattr(self, name), **kwargs) for name, kwargs in calls]
+        return [future.result() for future in futures]
+
+    def resolve(self, kind, key, lookup):
+        """This function returns the record of a name from the resolution cache, calling lookup() to find and cache it on a miss"""
+
+        record = self.cache.get(kind, key)
+        if record is None:
+            records = lookup()
+            self.cache.set(kind, records)
+            record = records.get(key)
+
+        return record
+
+    def resolveMany(self, kind, keys, lookup):
+        """
+        This function returns the records of several names from the resolution cache, in the order
+        of the names, together with the names that could not be found. lookup(missing) is called
+        once to find all of the names missing from the cache.
+        """
+
+        cached = self.cache.getMany(kind, keys)
+        records = { key: cached.get(key) for key in keys }
+        missing = [key for key, record in records.items() if record is None]
+        if missing:
+            found = lookup(missing)
+            self.cache.set(kind, found)
+            records.update({ key: found[key] for key in missing if key in found })
+
+        return { key: record for key, record in records.items() if record is not None }, [key for key, record in records.items() if record is None]
+
+    def resolveUsers(self, usernames, debug=False):
+        """This function returns the users with several user names, looking up any not cached concurrently"""
+
+        def lookup(missing):
+            # The user catalog can be very large, so filter by each name instead
+            results = self.runConcurrently([('getUsers', { 'username': username, 'debug': debug }) for username in missing])
+            return { username: users[0] for username, users in zip(missing, results) if isinstance(users, list) and users }
+
+        return self.resolveMany('user', usernames, lookup)
+
+    def resolveRoles(self, names, key='roleName', debug=False):
+        """This function returns the roles with several names, or IDs when key is 'id', fetching the role catalog once for any not cached"""
+
+        def lookup(missing):
+            if len(missing) == 1:
+                roles = self.getRoles(**{ 'name' if key == 'roleName' else 'id': missing[0] }, debug=debug)
+            else:
+                roles = self.getRoles(debug=debug)
+            return { role[key]: role for role in roles } if isinstance(roles, list) else {}
+
+        return self.resolveMany('role' if key == 'roleName' else 'roleId', names, lookup)
+
+    def resolveUserGroups(self, names, key='userGroupName', debug=False):
+        """This function returns the user groups with several names, or IDs when key is 'id', fetching the user group catalog once for any not cached"""
+
+        def lookup(missing):
+            if len(missing) == 1:
+                groups = self.getUserGroups(**{ 'name' if key == 'userGroupName' else 'id': missing[0] }, debug=debug)
+            else:
+                groups = self.getUserGroups(debug=debug)
+            return { group[key]: group for group in groups } if isinstance(groups, list) else {}
+
+        return self.resolveMany('userGroup' if key == 'userGroupName' else 'userGroupId', names, lookup)
+
+    def resolvePrivileges(self, names, key='name', debug=False):
+        """This function returns the privileges with several names, or IDs when key is 'id', caching every privilege of the org"""
+
+        def lookup(missing):
+            privileges = self.getPrivileges(all=True, debug=debug)
+            return { item[key]: item for item in privileges } if isinstance(privileges, list) else {}
+
+        return self.resolveMany('privilege' if key == 'name' else 'privilegeId', names, lookup)
+
+    def resolveUser(self, username, debug=False):
+        """This function returns the user with a user name"""
+
+        return self.resolveUsers([username], debug=debug)[0].get(username)
+
+    def resolveRole(self, name, debug=False):
+        """This function returns the role with a name"""
+
+        return self.resolveRoles([name], debug=debug)[0].get(name)
+
+    def resolveUserGroup(self, name, debug=False):
+        """This function returns the user group with a name"""
+
+        return self.resolveUserGroups([name], debug=debug)[0].get(name)
+
+    def resolvePrivilege(self, name, debug=False):
+        """This function returns the privilege with a name"""
+
+        return self.resolvePrivileges([name], debug=debug)[0].get(name)
+
+    def getInventory(self, debug=False):
+        """
+        This function returns the assigned and unassigned secure agents and the agent groups of the org, indexed
+        by name (agent, agentGroup) and by ID (agentId, agentGroupId). They are listed once per command.
+        """
+
+        if self.inventory is None:
+            assigned, unassigned, groups = self.runConcurrently([
+                ('getAgents', { 'debug': debug }),
+                ('getAgents', { 'unassigned': True, 'debug': debug }),
+                ('getAgentGroups', { 'debug': debug })
+            ])
+            agents = [item for items in [assigned, unassigned] if isinstance(items, list) for item in items]
+            groups = groups if isinstance(groups, list) else []
+
+            self.inventory = {
+                'agent': { item['name']: item for item in reversed(agents) },
+                'agentId': { item['id']: item for item in reversed(agents) },
+                'agentGroup': { item['name']: item for item in groups },
+                'agentGroupId': { item['id']: item for item in groups }
+            }
+
+        return self.inventory
+
+    def resolveAgent(self, name, debug=False):
+        """This function returns the assigned or unassigned secure agent with a name, caching every agent of the org"""
+
+        return self.resolve('agent', name, lambda: self.getInventory(debug=debug)['agent'])
+
+    def resolveAgentGroup(self, name, debug=False):
+        """This function returns the secure agent group with a name, caching every agent group of the org"""
+
+        return self.resolve('agentGroup', name, lambda: self.getInventory(debug=debug)['agentGroup'])
+
+    def resolveObject(self, path, type, debug=False):
+        """This function returns the object with a path and type"""
+
+        def lookup():
+
+            # Prefer the local object catalog if it has been synced
+            objects = self.catalogObjects(path=path, type=type, debug=debug)
+            if objects:
+                return { f'{ type }:{ path }': objects[0] }
+
+            objects = self.lookupObject(path=path, type=type, debug=debug)
+            try:
+                return { f'{ type }:{ path }': objects['objects'][0] }
+            except Exception as e:
+                return {}
+
+        return self.resolve('object', f'{ type }:{ path }', lookup)
+
+    def resolveObjects(self, objects, debug=False):
+        """
+        This function returns the objects with a list of (path, type) pairs, keyed by type:path, together with
+        the type:path of any that could not be found. The objects missing from the cache are looked up in
+        batches of lookupBatchSize objects, and the batches are sent concurrently.
+        """
+
+        def lookup(missing):
+            pairs = [key.split(':', 1) for key in missing]
+            batches = [pairs[i:i + self.lookup_batch_size] for i in range(0, len(pairs), self.lookup_batch_size)]
+            results = self.runConcurrently([('lookupObjects', { 'body': json.dumps({ 'objects': [{ 'path': path, 'type': type } for type, path in batch] }), 'debug': debug }) for batch in batches])
+
+            # Match the objects found to the requested keys, whatever the case of their type
+            keys = { (path, type.upper()): f'{ type }:{ path }' for type, path in pairs }
+            records = {}
+            for result in results:
+                for obj in result.get('objects', []) if isinstance(result, dict) else []:
+                    key = keys.get((obj.get('path'), str(obj.get('type')).upper()))
+                    if key:
+                        records[key] = obj
+            return records
+
+        return self.resolveMany('object', [f'{ type }:{ path }' for path, type in objects], lookup)
+
     def debugRequest(self, r, attempts=0):
         print('\n')
         print('Attempts: ' + str(attempts))
@@ -42,14 +434,7 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        # Execute the API call
-        url = f'https://{ self.region }.informaticacloud.com/saas/public/core/v3/login'
-        headers = { 'Accept': 'application/json', 'Content-Type': 'application/json' }
-        data = { 'username': self.username, 'password': self.password }
-        r = requests.post(url, json=data, headers=headers, allow_redirects=False)
-
-        if debug:
-            self.debugRequest(r)
+        r = self.loginSession(debug=debug)
 
         if r.status_code < 200 or r.status_code > 299:
             resp = {
@@ -58,13 +443,28 @@ class InformaticaCloudAPI:
             }
         else:
             resp = r.json()
-        
-            # Save the session ID
-            session_id = resp['userInfo']['sessionId']
-            self.session_id = session_id
-            config.set('sessionId', session_id)
 
         return resp
+
+    def loginSession(self, debug=False):
+        """This function logs in to IDMC and shares the new session, returning the response of the login call"""
+
+        # Execute the API call
+        url = f'{ self.login_url }/saas/public/core/v3/login'
+        data = { 'username': self.username, 'password': self.password }
+        r = self.executeRequest('POST', url, authType=None, json=data, policy=SESSION, debug=debug)
+
+        if 200 <= r.status_code <= 299:
+
+            # Share the session ID with other threads and processes
+            self.session_id = r.json()['userInfo']['sessionId']
+            self.sessions.save(self.session_id)
+            self.failed_login = None
+
+            # Fetch the org details again in case they have changed
+            self.cache.invalidate('org')
+
+        return r
     
     def logout(self, debug=False):
         """This function logs out from IDMC"""
@@ -74,12 +474,8 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         # Execute the API call
-        url = f'https://{ self.region }.informaticacloud.com/saas/public/core/v3/logout'
-        headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-        r = requests.post(url, headers=headers, allow_redirects=False)
-
-        if debug:
-            self.debugRequest(r)
+        url = f'{ self.login_url }/saas/public/core/v3/logout'
+        r = self.executeRequest('POST', url, policy=SESSION, debug=debug)
 
         if r.status_code < 200 or r.status_code > 299:
             resp = {
@@ -92,73 +488,49 @@ class InformaticaCloudAPI:
                 'text': 'Logged out successfully'
             }
 
+            # Stop other processes from using the closed session
+            self.session_id = None
+            self.sessions.save(None)
+
         return resp
     
     #############################
     # Users section
     #############################
 
-    def getUsers(self, id=None, username=None, debug=False):
-        """This function returns IDMC users"""
+    def iterUsers(self, id=None, username=None, debug=False):
+        """This function returns a generator of IDMC users, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        skip = 0
-        pages = []
-        
-        while True:
-        
+        def fetchPage(params):
+
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = { 'limit': self.page_size, 'skip': skip }
+            url = f'{ self.base_url }/saas/public/core/v3/users'
             if id:
                 params['q'] = f'userId=="{ id }"'
             elif username:
                 params['q'] = f'userName=="{ username }"'
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page
+        return self.paginate(fetchPage, lambda page: page)
 
-        return result
+    def getUsers(self, id=None, username=None, debug=False):
+        """This function returns IDMC users"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        return list(self.iterUsers(id=id, username=username, debug=debug))
     
 
     def deleteUser(self, id=None, username=None, debug=False):
@@ -170,52 +542,30 @@ class InformaticaCloudAPI:
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find user for id { username }'
                 }
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users/{ quote(id) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User deleted' }
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User deleted' }
-                break
-            # Break when there are no pages left
-            else:
-                break
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('user')
         
         return resp
 
@@ -228,104 +578,79 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
+        missing = []
+
         # Lookup the role ids if needed
         if roleNames:
-            roleIds = []
-            roles = roleNames.split(',')
-            for role in roles:
-                lookup = self.getRoles(name=role, debug=debug)
-                try:
-                    roleId = lookup[0]['id']
-                    roleIds.append(roleId)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find role for id { role }'
-                    }
+            roles, missingRoles = self.resolveRoles(roleNames.split(','), debug=debug)
+            roleIds = [role['id'] for role in roles.values()]
+            if missingRoles:
+                missing.append(f'roles { ", ".join(missingRoles) }')
         elif roleIds:
             roleIds = roleIds.split(',')
         
         # Lookup the group ids if needed
         if groupNames:
-            groupIds = []
-            groups = groupNames.split(',')
-            for group in groups:
-                lookup = self.getUserGroups(name=group, debug=debug)
-                try:
-                    groupId = lookup[0]['id']
-                    groupIds.append(groupId)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find group id for { group }'
-                    }
+            groups, missingGroups = self.resolveUserGroups(groupNames.split(','), debug=debug)
+            groupIds = [group['id'] for group in groups.values()]
+            if missingGroups:
+                missing.append(f'user groups { ", ".join(missingGroups) }')
         elif groupIds:
             groupIds = groupIds.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'name': name,
-                'firstName': firstName,
-                'lastName': lastName,
-                'email': email
+        # Report every name that could not be found at once
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find { " and ".join(missing) }'
             }
 
-            # Prepare the optional fields
-            if password:
-                data['password'] = password
-            if description:
-                data['description'] = description
-            if title:
-                data['title'] = title
-            if phone:
-                data['phone'] = phone
-            if forcePasswordChange:
-                data['forcePasswordChange'] = forcePasswordChange
-            if maxLoginAttempts:
-                data['maxLoginAttempts'] = maxLoginAttempts
-            if authentication:
-                data['authentication'] = authentication
-            if aliasName:
-                data['aliasName'] = aliasName
-            if roleIds:
-                data['roles'] = roleIds
-            if groupIds:
-                data['groups'] = groupIds
+        # Prepare the mandatory fields
+        data = {
+            'name': name,
+            'firstName': firstName,
+            'lastName': lastName,
+            'email': email
+        }
+
+        # Prepare the optional fields
+        if password:
+            data['password'] = password
+        if description:
+            data['description'] = description
+        if title:
+            data['title'] = title
+        if phone:
+            data['phone'] = phone
+        if forcePasswordChange:
+            data['forcePasswordChange'] = forcePasswordChange
+        if maxLoginAttempts:
+            data['maxLoginAttempts'] = maxLoginAttempts
+        if authentication:
+            data['authentication'] = authentication
+        if aliasName:
+            data['aliasName'] = aliasName
+        if roleIds:
+            data['roles'] = roleIds
+        if groupIds:
+            data['groups'] = groupIds
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+            # Forget any cached user with the same name
+            self.cache.invalidate('user', name)
         
         return resp
     
@@ -339,13 +664,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -354,61 +678,39 @@ class InformaticaCloudAPI:
         
         # Lookup the role ids if needed
         if roleIds:
-            roleNames = []
-            roles = roleIds.split(',')
-            for role in roles:
-                lookup = self.getRoles(id=role, debug=debug)
-                try:
-                    roleName = lookup[0]['roleName']
-                    roleNames.append(roleName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find role for id { role }'
-                    }
+            roles, missing = self.resolveRoles(roleIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find roles with ids { ", ".join(missing) }'
+                }
+            roleNames = [role['roleName'] for role in roles.values()]
         elif roleNames:
             roleNames = roleNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'roles': roleNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users/{ quote( id ) }/addRoles'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'roles': roleNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users/{ quote( id ) }/addRoles'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached user, whose roles have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('user', username)
         
         return resp
     
@@ -421,13 +723,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -436,61 +737,39 @@ class InformaticaCloudAPI:
         
         # Lookup the role ids if needed
         if roleIds:
-            roleNames = []
-            roles = roleIds.split(',')
-            for role in roles:
-                lookup = self.getRoles(id=role, debug=debug)
-                try:
-                    roleName = lookup[0]['roleName']
-                    roleNames.append(roleName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find role for id { role }'
-                    }
+            roles, missing = self.resolveRoles(roleIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find roles with ids { ", ".join(missing) }'
+                }
+            roleNames = [role['roleName'] for role in roles.values()]
         elif roleNames:
             roleNames = roleNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'roles': roleNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users/{ quote( id ) }/removeRoles'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'roles': roleNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users/{ quote( id ) }/removeRoles'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached user, whose roles have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('user', username)
         
         return resp
     
@@ -503,13 +782,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -518,61 +796,39 @@ class InformaticaCloudAPI:
         
         # Lookup the group ids if needed
         if groupIds:
-            groupNames = []
-            groups = groupIds.split(',')
-            for group in groups:
-                lookup = self.getUserGroups(id=group, debug=debug)
-                try:
-                    groupName = lookup[0]['userGroupName']
-                    groupNames.append(groupName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find group for id { group }'
-                    }
+            groups, missing = self.resolveUserGroups(groupIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find user groups with ids { ", ".join(missing) }'
+                }
+            groupNames = [group['userGroupName'] for group in groups.values()]
         elif groupNames:
             groupNames = groupNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'groups': groupNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users/{ quote( id ) }/addGroups'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'groups': groupNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users/{ quote( id ) }/addGroups'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached user, whose groups have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('user', username)
         
         return resp
 
@@ -586,13 +842,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -601,61 +856,39 @@ class InformaticaCloudAPI:
         
         # Lookup the group ids if needed
         if groupIds:
-            groupNames = []
-            groups = groupIds.split(',')
-            for group in groups:
-                lookup = self.getUserGroups(id=group, debug=debug)
-                try:
-                    groupName = lookup[0]['userGroupName']
-                    groupNames.append(groupName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find group for id { group }'
-                    }
+            groups, missing = self.resolveUserGroups(groupIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find user groups with ids { ", ".join(missing) }'
+                }
+            groupNames = [group['userGroupName'] for group in groups.values()]
         elif groupNames:
             groupNames = groupNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'groups': groupNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/users/{ quote( id ) }/removeGroups'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'groups': groupNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/users/{ quote( id ) }/removeGroups'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached user, whose groups have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('user', username)
         
         return resp
 
@@ -671,49 +904,27 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/roles'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = {}
-            if id:
-                params['q'] = f'roleId=="{ id }"'
-            elif name:
-                params['q'] = f'roleName=="{ name }"'
-            if expand:
-                params['expand'] = f'privileges'
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/roles'
+        params = {}
+        if id:
+            params['q'] = f'roleId=="{ id }"'
+        elif name:
+            params['q'] = f'roleName=="{ name }"'
+        if expand:
+            params['expand'] = f'privileges'
+        r = self.executeRequest('GET', url, params=params, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -726,68 +937,44 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the role ids if needed
         if privilegeNames:
-            privilegeIds = []
-            privileges = privilegeNames.split(',')
-            for privilege in privileges:
-                lookup = self.getPrivileges(all=True, debug=debug)
-                try:
-                    privilegeId = [item for item in lookup if item['name'] == privilege][0]['id']
-                    privilegeIds.append(privilegeId)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find privilege id for { privilege }'
-                    }
+            privileges, missing = self.resolvePrivileges(privilegeNames.split(','), debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find privileges { ", ".join(missing) }'
+                }
+            privilegeIds = [privilege['id'] for privilege in privileges.values()]
         elif privilegeIds:
             privilegeIds = privilegeIds.split(',')
         
+        # Prepare the mandatory fields
+        data = {
+            'name': name,
+            'privileges': privilegeIds
+        }
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'name': name,
-                'privileges': privilegeIds
-            }
-
-            # Prepare the optional fields
-            if description:
-                data['description'] = description
+        # Prepare the optional fields
+        if description:
+            data['description'] = description
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/roles'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/roles'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+            # Forget any cached role with the same name
+            self.cache.invalidate('role', name)
         
         return resp
     
@@ -800,13 +987,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user group id if needed
         if name:
-            lookup = self.getRoles(name=name, debug=debug)
+            lookup = self.resolveRole(name=name, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -815,61 +1001,40 @@ class InformaticaCloudAPI:
         
         # Lookup the privilege ids if needed
         if privilegeIds:
-            privilegeNames = []
-            privileges = privilegeIds.split(',')
-            for privilege in privileges:
-                lookup = self.getPrivileges(id=privilege, debug=debug)
-                try:
-                    privilegeName = lookup[0]['name']
-                    privilegeNames.append(privilegeName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find privilege id { privilege }'
-                    }
+            privileges, missing = self.resolvePrivileges(privilegeIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find privileges with ids { ", ".join(missing) }'
+                }
+            privilegeNames = [privilege['name'] for privilege in privileges.values()]
         elif privilegeNames:
             privilegeNames = privilegeNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'privileges': privilegeNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/roles/{ quote( id ) }/addPrivileges'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'privileges': privilegeNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User group updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/roles/{ quote( id ) }/addPrivileges'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User group updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached role, whose privileges have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('role', name)
+            self.cache.invalidate('roleId', id)
         
         return resp
     
@@ -882,13 +1047,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the role id if needed
         if name:
-            lookup = self.getRoles(name=name, debug=debug)
+            lookup = self.resolveRole(name=name, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -897,61 +1061,40 @@ class InformaticaCloudAPI:
         
         # Lookup the privilege ids if needed
         if privilegeIds:
-            privilegeNames = []
-            privileges = privilegeIds.split(',')
-            for privilege in privileges:
-                lookup = self.getPrivileges(id=privilege, debug=debug)
-                try:
-                    privilegeName = lookup[0]['name']
-                    privilegeNames.append(privilegeName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find privilege id { privilege }'
-                    }
+            privileges, missing = self.resolvePrivileges(privilegeIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find privileges with ids { ", ".join(missing) }'
+                }
+            privilegeNames = [privilege['name'] for privilege in privileges.values()]
         elif privilegeNames:
             privilegeNames = privilegeNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'privileges': privilegeNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/roles/{ quote( id ) }/removePrivileges'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'privileges': privilegeNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User group updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/roles/{ quote( id ) }/removePrivileges'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User group updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached role, whose privileges have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('role', name)
+            self.cache.invalidate('roleId', id)
         
         return resp
     
@@ -965,52 +1108,31 @@ class InformaticaCloudAPI:
         
         # Lookup the role id if needed
         if name:
-            lookup = self.getRoles(name=name, debug=debug)
+            lookup = self.resolveRole(name=name, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find role id for { name }'
                     }
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/roles/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/roles/{ quote(id) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Role deleted' }
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Role deleted' }
-                break
-            # Break when there are no pages left
-            else:
-                break
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('role')
+            self.cache.invalidate('roleId')
         
         return resp
     
@@ -1026,45 +1148,23 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/privileges'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = {}
-            if all:
-                params['q'] = f'status==All'
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/privileges'
+        params = {}
+        if all:
+            params['q'] = f'status==All'
+        r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -1072,67 +1172,39 @@ class InformaticaCloudAPI:
     # Groups section
     #############################
 
-    def getUserGroups(self, id=None, name=None, debug=False):
-        """This function returns IDMC user groups"""
+    def iterUserGroups(self, id=None, name=None, debug=False):
+        """This function returns a generator of IDMC user groups, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        skip = 0
-        pages = []
-        
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/userGroups'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = { 'limit': self.page_size, 'skip': skip }
+            url = f'{ self.base_url }/saas/public/core/v3/userGroups'
             if id:
                 params['q'] = f'userGroupId=="{ id }"'
             elif name:
                 params['q'] = f'userGroupName=="{ name }"'
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page
+        return self.paginate(fetchPage, lambda page: page)
 
-        return result
+    def getUserGroups(self, id=None, name=None, debug=False):
+        """This function returns IDMC user groups"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        return list(self.iterUserGroups(id=id, name=name, debug=debug))
     
 
 
@@ -1144,86 +1216,63 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
+        missing = []
+
         # Lookup the role ids if needed
         if roleNames:
-            roleIds = []
-            roles = roleNames.split(',')
-            for role in roles:
-                lookup = self.getRoles(name=role, debug=debug)
-                try:
-                    roleId = lookup[0]['id']
-                    roleIds.append(roleId)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find role for id { role }'
-                    }
+            roles, missingRoles = self.resolveRoles(roleNames.split(','), debug=debug)
+            roleIds = [role['id'] for role in roles.values()]
+            if missingRoles:
+                missing.append(f'roles { ", ".join(missingRoles) }')
         elif roleIds:
             roleIds = roleIds.split(',')
         
         # Lookup the user ids if needed
         if userNames:
-            userIds = []
-            users = userNames.split(',')
-            for user in users:
-                lookup = self.getUsers(username=user, debug=debug)
-                try:
-                    userId = lookup[0]['id']
-                    userIds.append(userId)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find user id for { user }'
-                    }
+            users, missingUsers = self.resolveUsers(userNames.split(','), debug=debug)
+            userIds = [user['id'] for user in users.values()]
+            if missingUsers:
+                missing.append(f'users { ", ".join(missingUsers) }')
         elif userIds:
             userIds = userIds.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'name': name,
-                'roles': roleIds
+        # Report every name that could not be found at once
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find { " and ".join(missing) }'
             }
 
-            # Prepare the optional fields
-            if description:
-                data['description'] = description
-            if userIds:
-                data['users'] = userIds
+        # Prepare the mandatory fields
+        data = {
+            'name': name,
+            'roles': roleIds
+        }
+
+        # Prepare the optional fields
+        if description:
+            data['description'] = description
+        if userIds:
+            data['users'] = userIds
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/userGroups'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/userGroups'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+            # Forget any cached user group with the same name, and the users added to it
+            self.cache.invalidate('userGroup', name)
+            if userIds or userNames:
+                self.cache.invalidate('user')
         
         return resp
     
@@ -1236,13 +1285,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user group id if needed
         if groupname:
-            lookup = self.getUserGroups(name=groupname, debug=debug)
+            lookup = self.resolveUserGroup(name=groupname, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -1251,61 +1299,40 @@ class InformaticaCloudAPI:
         
         # Lookup the role ids if needed
         if roleIds:
-            roleNames = []
-            roles = roleIds.split(',')
-            for role in roles:
-                lookup = self.getRoles(id=role, debug=debug)
-                try:
-                    roleName = lookup[0]['roleName']
-                    roleNames.append(roleName)
-                except Exception as e:
-                    return {
-                        'status': 500,
-                        'text': f'Unable to find role for id { role }'
-                    }
+            roles, missing = self.resolveRoles(roleIds.split(','), key='id', debug=debug)
+            if missing:
+                return {
+                    'status': 500,
+                    'text': f'Unable to find roles with ids { ", ".join(missing) }'
+                }
+            roleNames = [role['roleName'] for role in roles.values()]
         elif roleNames:
             roleNames = roleNames.split(',')
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'roles': roleNames
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/userGroups/{ quote( id ) }/addRoles'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'roles': roleNames
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User group updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/userGroups/{ quote( id ) }/addRoles'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User group updated' }
+        else:
+            resp = r.json()
+
+        # Forget the cached user group, whose roles have changed
+        if 200 <= r.status_code <= 299:
+            self.cache.invalidate('userGroup', groupname)
+            self.cache.invalidate('userGroupId', id)
         
         return resp
     
@@ -1319,52 +1346,31 @@ class InformaticaCloudAPI:
         
         # Lookup the user id if needed
         if name:
-            lookup = self.getUserGroups(name=name, debug=debug)
+            lookup = self.resolveUserGroup(name=name, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find user group id for { name }'
                 }
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/userGroups/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/userGroups/{ quote(id) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'User group deleted' }
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'User group deleted' }
-                break
-            # Break when there are no pages left
-            else:
-                break
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('userGroup')
+            self.cache.invalidate('userGroupId')
         
         return resp
     
@@ -1374,27 +1380,32 @@ class InformaticaCloudAPI:
     #############################
 
     def getObjects(self, id=None, name=None, type=None, location=None, debug=False):
-        result = self.queryObjects(type=type, location=location, debug=debug)
+
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+        
+        # Answer from the local object catalog if it has been synced
+        objects = self.catalogObjects(id=id, name=name, type=type, location=location, debug=debug)
+        if objects is not None:
+            return objects
+
         if name:
-            filtered = [obj for obj in result if obj['path'].split('/')[-1] == name]
+            filtered = [obj for obj in self.iterObjects(type=type, location=location, debug=debug) if obj['path'].split('/')[-1] == name]
             return filtered
         elif id:
-            filtered = [obj for obj in result if obj['id'] == id]
+            filtered = [obj for obj in self.iterObjects(type=type, location=location, debug=debug) if obj['id'] == id]
             return filtered
         else:
-            return result
+            return self.queryObjects(type=type, location=location, debug=debug)
     
-    def queryObjects(self, type=None, location=None, tag=None, hash=None, checkedOutBy=None, checkedOutSince=None, checkedOutUntil=None, checkedInBy=None, checkedInSince=None, checkedInUntil=None, sourceCtrld=None, publishedBy=None, publishedSince=None, publishedUntil=None, updatedBy=None, updatedSince=None, updatedUntil=None, debug=False):
-        """This function is used to query objects"""
+    def iterObjects(self, type=None, location=None, tag=None, hash=None, checkedOutBy=None, checkedOutSince=None, checkedOutUntil=None, checkedInBy=None, checkedInSince=None, checkedInUntil=None, sourceCtrld=None, publishedBy=None, publishedSince=None, publishedUntil=None, updatedBy=None, updatedSince=None, updatedUntil=None, debug=False):
+        """This function returns a generator of queried objects, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        skip = 0
-        pages = []
-
         # Prepare the query string
         qargs = []
         if type:
@@ -1432,58 +1443,78 @@ class InformaticaCloudAPI:
         if hash:
             qargs.append(f'sourceControl.hash <= { hash }')
         
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = { 'limit': self.page_size, 'skip': skip }
+            url = f'{ self.base_url }/saas/public/core/v3/objects'
             if len(qargs) > 0:
                 params['q'] = ' and '.join(qargs)
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()['objects']) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page['objects']
+        # The first page reports the total count so the remaining pages can be fetched in parallel
+        return self.paginate(fetchPage, lambda page: page['objects'], count=lambda page: page.get('count'))
 
-        return result
+    def syncCatalog(self, full=False, debug=False):
+        """This function syncs the local object catalog, fetching only the objects updated since the last sync unless full"""
+
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        since = None if full else self.catalog.lastSync()
+
+        # Keep the previous catalog if any page could not be fetched
+        start = time.perf_counter()
+        try:
+            count = self.catalog.sync(self.iterObjects(updatedSince=since, debug=debug), full=since is None)
+        except PageError as e:
+            return {
+                'status': 500,
+                'text': f'{ e }, the catalog was not synced'
+            }
+        self.catalog_synced = True
+
+        return {
+            'full': since is None,
+            'objects': count,
+            'lastSync': self.catalog.lastSync(),
+            'seconds': round(time.perf_counter() - start, 3)
+        }
+
+    def catalogObjects(self, id=None, path=None, name=None, type=None, location=None, debug=False):
+        """
+        This function returns the matching objects from the local object catalog, or None if the catalog
+        has never been synced. The changes since the last sync are fetched first, once per command.
+        """
+
+        if not self.catalog.synced():
+            return None
+
+        # Answer from the objects already synced even if the latest changes could not be fetched
+        if not self.catalog_synced:
+            self.syncCatalog(debug=debug)
+            self.catalog_synced = True
+
+        return self.catalog.find(id=id, path=path, name=name, type=type, location=location)
+
+    def queryObjects(self, type=None, location=None, tag=None, hash=None, checkedOutBy=None, checkedOutSince=None, checkedOutUntil=None, checkedInBy=None, checkedInSince=None, checkedInUntil=None, sourceCtrld=None, publishedBy=None, publishedSince=None, publishedUntil=None, updatedBy=None, updatedSince=None, updatedUntil=None, debug=False):
+        """This function is used to query objects"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        return list(self.iterObjects(type=type, location=location, tag=tag, hash=hash, checkedOutBy=checkedOutBy, checkedOutSince=checkedOutSince, checkedOutUntil=checkedOutUntil, checkedInBy=checkedInBy, checkedInSince=checkedInSince, checkedInUntil=checkedInUntil, sourceCtrld=sourceCtrld, publishedBy=publishedBy, publishedSince=publishedSince, publishedUntil=publishedUntil, updatedBy=updatedBy, updatedSince=updatedSince, updatedUntil=updatedUntil, debug=debug))
     
-    def getDependencies(self, id=None, path=None, type=None, refType=None, debug=False):
-        """This function is used to find dependencies for an object"""
+    def iterDependencies(self, id=None, path=None, type=None, refType=None, debug=False):
+        """This function returns a generator of the dependencies of an object, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
@@ -1491,66 +1522,45 @@ class InformaticaCloudAPI:
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        attempts = 0
-        skip = 0
-        pages = []
-        
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote(id) }/references'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            params = { 'limit': 50, 'skip': skip, 'refType': refType }
-
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote(id) }/references'
+            params['refType'] = refType
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()['references']) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page['references']
+        # The references API returns at most 50 records per page
+        return self.paginate(fetchPage, lambda page: page['references'], maxPageSize=50)
 
-        return result
+    def getDependencies(self, id=None, path=None, type=None, refType=None, debug=False):
+        """This function is used to find dependencies for an object"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        result = self.iterDependencies(id=id, path=path, type=type, refType=refType, debug=debug)
+
+        # Return lookup failures as they are
+        if isinstance(result, dict):
+            return result
+
+        return list(result)
     
     def lookupObject(self, id=None, path=None, type=None, debug=False):
         """This function is used to lookup objects"""
@@ -1559,53 +1569,31 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/lookup'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            data = {
-                'objects': []
-            }
-            obj = {}
-            if id:
-                obj['id'] = id
-            if type:
-                obj['type'] = type
-            if path:
-                obj['path'] = path
-            data['objects'].append(obj)
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/lookup'
+        data = {
+            'objects': []
+        }
+        obj = {}
+        if id:
+            obj['id'] = id
+        if type:
+            obj['type'] = type
+        if path:
+            obj['path'] = path
+        data['objects'].append(obj)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, policy=IDEMPOTENT, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -1616,43 +1604,21 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/lookup'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            data = json.loads(body)
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/lookup'
+        data = json.loads(body)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, policy=IDEMPOTENT, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -1667,94 +1633,70 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/TagObjects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            data = []
-            obj = {
-                'id': id,
-                'tags': tags.split(',')
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/TagObjects'
+        data = []
+        obj = {
+            'id': id,
+            'tags': tags.split(',')
+        }
+        data.append(obj)
+
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
             }
-            data.append(obj)
+        elif r.status_code == 204:
+            resp = { 'message': 'Object updated' }
+        # Return the response
+        
+        return resp
+    
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+    def tagObjects(self, body, debug=False):
+        """This function is used to add tags to multiple objects"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+        
+        data = []
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
 
-            if debug:
-                self.debugRequest(r, attempts)
-
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Object updated' }
-                break
-            # Return the response
-            else:
-                break
-        
-        return resp
-    
-
-    def tagObjects(self, body, debug=False):
-        """This function is used to add tags to multiple objects"""
-        
-        # Check if cli has been configured
-        if not self.username:
-            return 'CLI needs to be configured. Run the command "idmc configure"'
-        
-        attempts = 0
-
-        data = []
-        for obj in json.loads(body):
-            path = None
-            type = None
-            tags = obj['tags']
+        for obj in body:
+            path = None
+            type = None
+            tags = obj['tags']
 
             if 'path' in obj and 'type' in obj:
                 path = obj['path']
                 type = obj['type']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -1765,43 +1707,20 @@ class InformaticaCloudAPI:
                 'tags': tags
             })
             
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/TagObjects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/TagObjects'
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Object updated' }
-                break
-            # Return the response
-            else:
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Object updated' }
+        # Return the response
         
         return resp
     
@@ -1813,61 +1732,37 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/UntagObjects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            data = []
-            obj = {
-                'id': id,
-                'tags': tags.split(',')
-            }
-            data.append(obj)
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/UntagObjects'
+        data = []
+        obj = {
+            'id': id,
+            'tags': tags.split(',')
+        }
+        data.append(obj)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Object updated' }
-                break
-            # Return the response
-            else:
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Object updated' }
+        # Return the response
         
         return resp
     
@@ -1879,10 +1774,17 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         data = []
-        for obj in json.loads(body):
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
+
+        for obj in body:
             path = None
             type = None
             tags = obj['tags']
@@ -1891,16 +1793,9 @@ class InformaticaCloudAPI:
                 path = obj['path']
                 type = obj['type']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -1911,43 +1806,20 @@ class InformaticaCloudAPI:
                 'tags': tags
             })
             
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/UntagObjects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/UntagObjects'
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Object updated' }
-                break
-            # Return the response
-            else:
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Object updated' }
+        # Return the response
         
         return resp
     
@@ -1964,49 +1836,28 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'name': name
-            }
+        # Prepare the mandatory fields
+        data = {
+            'name': name
+        }
 
-            # Prepare the optional fields
-            if description:
-                data['description'] = description
+        # Prepare the optional fields
+        if description:
+            data['description'] = description
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/projects'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/projects'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2019,61 +1870,46 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the project id if needed
         if path:
-            lookup = self.lookupObject(path=path, type='PROJECT', debug=debug)
+            lookup = self.resolveObject(path=path, type='PROJECT', debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type PROJECT'
                     }
 
-        while True:
-        
-            # Prepare the update fields
-            data = {}
-            if name:
-                data['name'] = name
-            if description:
-                data['description'] = description
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/projects/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.patch(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the update fields
+        data = {}
+        if name:
+            data['name'] = name
+        if description:
+            data['description'] = description
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Project updated' }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/projects/{ quote( id ) }'
+        r = self.executeRequest('PATCH', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Project updated' }
+
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('object')
+
+            # The paths of everything within it have changed, so the next catalog sync must be full
+            if name:
+                self.catalog.invalidate()
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2086,53 +1922,34 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the project id if needed
         if path:
-            lookup = self.lookupObject(path=path, type='PROJECT', debug=debug)
+            lookup = self.resolveObject(path=path, type='PROJECT', debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type PROJECT'
                     }
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/projects/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Project deleted' }
-                break
-            else:
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/projects/{ quote( id ) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Project deleted' }
+
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('object')
+            self.catalog.remove(id=id, path=path)
         
         return resp
     
@@ -2150,9 +1967,9 @@ class InformaticaCloudAPI:
         
         # Lookup the project id if needed
         if projectName:
-            lookup = self.lookupObject(path=projectName, type='PROJECT', debug=debug)
+            lookup = self.resolveObject(path=projectName, type='PROJECT', debug=debug)
             try:
-                projectId = lookup['objects'][0]['id']
+                projectId = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -2160,49 +1977,28 @@ class InformaticaCloudAPI:
                     }
         
         resp = ''
-        attempts = 0
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'name': name
-            }
+        # Prepare the mandatory fields
+        data = {
+            'name': name
+        }
 
-            # Prepare the optional fields
-            if description:
-                data['description'] = description
+        # Prepare the optional fields
+        if description:
+            data['description'] = description
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/projects/{ projectId }/folders'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/projects/{ projectId }/folders'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2214,63 +2010,46 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the folder id if needed
         if path:
         
             # Get the folder ID
-            lookup = self.lookupObject(path=path, type='FOLDER', debug=debug)
+            lookup = self.resolveObject(path=path, type='FOLDER', debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type FOLDER'
                     }
 
+        # Prepare the update fields
+        data = {}
+        if name:
+            data['name'] = name
+        if description:
+            data['description'] = description
+            
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/folders/{ quote( id ) }'
+        r = self.executeRequest('PATCH', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Folder updated' }
 
-        while True:
-        
-            # Prepare the update fields
-            data = {}
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('object')
+
+            # The paths of everything within it have changed, so the next catalog sync must be full
             if name:
-                data['name'] = name
-            if description:
-                data['description'] = description
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/folders/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.patch(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Folder updated' }
-                break
-            else:
-                break
+                self.catalog.invalidate()
         
         return resp
     
@@ -2283,55 +2062,36 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the folder id if needed
         if path:
         
             # Get the folder ID
-            lookup = self.lookupObject(path=path, type='FOLDER', debug=debug)
+            lookup = self.resolveObject(path=path, type='FOLDER', debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type FOLDER'
                     }
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/folders/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            elif r.status_code == 204:
-                resp = { 'message': 'Folder deleted' }
-                break
-            else:
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/folders/{ quote( id ) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        elif r.status_code == 204:
+            resp = { 'message': 'Folder deleted' }
+
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('object')
+            self.catalog.remove(id=id, path=path)
         
         return resp
     
@@ -2347,69 +2107,47 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/checkin'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/checkin'
             
-            # Include the mandatory fields
-            data = {
-                'objects': [
-                    {
-                        'id': id
-                    }
-                ],
-                'summary': summary
-            }
-
-            # Include the optional fields if needed
-            if description:
-                data['description'] = description
-            if includeContainer:
-                data['objects'][0]['includeContainerAssets'] = includeContainer
+        # Include the mandatory fields
+        data = {
+            'objects': [
+                {
+                    'id': id
+                }
+            ],
+            'summary': summary
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if description:
+            data['description'] = description
+        if includeContainer:
+            data['objects'][0]['includeContainerAssets'] = includeContainer
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2421,10 +2159,17 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         objects = []
-        for obj in json.loads(body):
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
+
+        for obj in body:
             path = None
             type = None
             tmp = {}
@@ -2435,16 +2180,9 @@ class InformaticaCloudAPI:
             if 'includeContainerAssets' in obj:
                 tmp['includeContainerAssets'] = obj['includeContainerAssets']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -2453,50 +2191,30 @@ class InformaticaCloudAPI:
             tmp['id'] = id
             objects.append(tmp)
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/checkin'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/checkin'
             
-            # Include the mandatory fields
-            data = {
-                'objects': objects,
-                'summary': summary
-            }
-
-            # Include the optional fields if needed
-            if description:
-                data['description'] = description
+        # Include the mandatory fields
+        data = {
+            'objects': objects,
+            'summary': summary
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if description:
+            data['description'] = description
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2508,66 +2226,44 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/checkout'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/checkout'
             
-            # Include the mandatory fields
-            data = {
-                'objects': [
-                    {
-                        'id': id
-                    }
-                ]
-            }
-
-            # Include the optional fields if needed
-            if includeContainer:
-                data['objects'][0]['includeContainerAssets'] = includeContainer
+        # Include the mandatory fields
+        data = {
+            'objects': [
+                {
+                    'id': id
+                }
+            ]
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if includeContainer:
+            data['objects'][0]['includeContainerAssets'] = includeContainer
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2579,10 +2275,17 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         objects = []
-        for obj in json.loads(body):
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
+
+        for obj in body:
             path = None
             type = None
             tmp = {}
@@ -2593,16 +2296,9 @@ class InformaticaCloudAPI:
             if 'includeContainerAssets' in obj:
                 tmp['includeContainerAssets'] = obj['includeContainerAssets']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -2611,45 +2307,25 @@ class InformaticaCloudAPI:
             tmp['id'] = id
             objects.append(tmp)
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/checkout'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/checkout'
             
-            # Include the mandatory fields
-            data = {
-                'objects': objects
-            }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the mandatory fields
+        data = {
+            'objects': objects
+        }
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2661,67 +2337,45 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/pull'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/pull'
             
-            # Include the mandatory fields
-            data = {
-                'commitHash': hash,
-                'objects': [
-                    {
-                        'id': id
-                    }
-                ]
-            }
-
-            # Include the optional fields if needed
-            if relaxValidation:
-                data['relaxObjectSpecificationValidation'] = relaxValidation
+        # Include the mandatory fields
+        data = {
+            'commitHash': hash,
+            'objects': [
+                {
+                    'id': id
+                }
+            ]
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if relaxValidation:
+            data['relaxObjectSpecificationValidation'] = relaxValidation
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2733,10 +2387,17 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         objects = []
-        for obj in json.loads(body):
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
+
+        for obj in body:
             path = None
             type = None
             tmp = {}
@@ -2745,16 +2406,9 @@ class InformaticaCloudAPI:
                 path = obj['path']
                 type = obj['type']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -2763,48 +2417,28 @@ class InformaticaCloudAPI:
             tmp['id'] = id
             objects.append(tmp)
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/pull'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/pull'
             
-            # Include the mandatory fields
-            data = {
-                'commitHash': hash,
-                'objects': objects
-            }
-            if relaxValidation:
-                data['relaxObjectSpecificationValidation'] = relaxValidation
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the mandatory fields
+        data = {
+            'commitHash': hash,
+            'objects': objects
+        }
+        if relaxValidation:
+            data['relaxObjectSpecificationValidation'] = relaxValidation
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2816,55 +2450,33 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/pullByCommitHash'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/pullByCommitHash'
             
-            # Include the mandatory fields
-            data = {
-                'commitHash': hash
-            }
-
-            # Include the optional fields if needed
-            if search:
-                data['searchCustomRepositories'] = search
-            if repoId:
-                data['repoConnectionId'] = repoId
-            if relaxValidation:
-                data['relaxObjectSpecificationValidation'] = relaxValidation
+        # Include the mandatory fields
+        data = {
+            'commitHash': hash
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if search:
+            data['searchCustomRepositories'] = search
+        if repoId:
+            data['repoConnectionId'] = repoId
+        if relaxValidation:
+            data['relaxObjectSpecificationValidation'] = relaxValidation
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2876,66 +2488,44 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/undoCheckout'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/undoCheckout'
             
-            # Include the mandatory fields
-            data = {
-                'objects': [
-                    {
-                        'id': id
-                    }
-                ]
-            }
-
-            # Include the optional fields if needed
-            if includeContainer:
-                data['objects'][0]['includeContainerAssets'] = includeContainer
+        # Include the mandatory fields
+        data = {
+            'objects': [
+                {
+                    'id': id
+                }
+            ]
+        }
 
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the optional fields if needed
+        if includeContainer:
+            data['objects'][0]['includeContainerAssets'] = includeContainer
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
     
@@ -2947,10 +2537,17 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-
         objects = []
-        for obj in json.loads(body):
+        # Lookup the ids of every object given by path and type at once
+        body = json.loads(body)
+        found, missing = self.resolveObjects([(obj['path'], obj['type']) for obj in body if obj.get('path') and obj.get('type')], debug=debug)
+        if missing:
+            return {
+                'status': 500,
+                'text': f'Unable to find object ids for { ", ".join(missing) }'
+            }
+
+        for obj in body:
             path = None
             type = None
             tmp = {}
@@ -2961,16 +2558,9 @@ class InformaticaCloudAPI:
             if 'includeContainerAssets' in obj:
                 tmp['includeContainerAssets'] = obj['includeContainerAssets']
 
-            # Lookup the object id if needed
+            # Use the id looked up above if needed
             if path and type:
-                lookup = self.lookupObject(path=path, type=type, debug=debug)
-                try:
-                    id = lookup['objects'][0]['id']
-                except Exception as e:
-                    return {
-                            'status': 500,
-                            'text': f'Unable to find object id for path { path } and type { type }'
-                    }
+                id = found[f'{ type }:{ path }']['id']
             # Else use the IDs
             else:
                 id = obj['id']
@@ -2979,45 +2569,25 @@ class InformaticaCloudAPI:
             tmp['id'] = id
             objects.append(tmp)
         
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/undoCheckout'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/undoCheckout'
             
-            # Include the mandatory fields
-            data = {
-                'objects': objects
-            }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the mandatory fields
+        data = {
+            'objects': objects
+        }
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            resp = r.json()
         
         return resp
 
@@ -3028,41 +2598,18 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/sourceControlAction/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/sourceControlAction/{ quote(id) }'
+        r = self.executeRequest('GET', url, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -3074,55 +2621,32 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/repositoryConnection'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            # Populate the optional fields if needed
-            params = {}
-            if projectIds:
-                params['projectIds'] = projectIds
-            if projectNames:
-                params['projectNames'] = projectNames
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/repositoryConnection'
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        # Populate the optional fields if needed
+        params = {}
+        if projectIds:
+            params['projectIds'] = projectIds
+        if projectNames:
+            params['projectNames'] = projectNames
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
 
-    def getCommitHistory(self, id, path, type, branch, debug=False):
-        """This function returns the git history for an asset"""
+    def iterCommitHistory(self, id, path, type, branch, debug=False):
+        """This function returns a generator of the git history for an asset, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
@@ -3130,71 +2654,49 @@ class InformaticaCloudAPI:
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        attempts = 0
-        page = 1
-        pages = []
-        
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/commitHistory'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+            url = f'{ self.base_url }/saas/public/core/v3/commitHistory'
 
             # Initialise the query
-            params = { 'perPage': self.page_size, 'page': page, 'q': f'id=="{ id }"' }
+            params['q'] = f'id=="{ id }"'
             if branch:
                 params['q'] += f' and branch=="{ branch }"'
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()['commits']) > 0:
-                resp = r.json()
-                pages.append(resp)
-                page +=1
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page['commits']
+        return self.paginate(fetchPage, lambda page: page['commits'], style=PAGE_PER_PAGE)
 
-        return result
+    def getCommitHistory(self, id, path, type, branch, debug=False):
+        """This function returns the git history for an asset"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        result = self.iterCommitHistory(id=id, path=path, type=type, branch=branch, debug=debug)
+
+        # Return lookup failures as they are
+        if isinstance(result, dict):
+            return result
+
+        return list(result)
     
 
     def getCommitDetails(self, hash, searchAllRepos, repoId, debug=False):
@@ -3204,49 +2706,26 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/commit/{ hash }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            # Populate the optional fields if needed
-            params = {}
-            if searchAllRepos:
-                params['searchCustomRepositories'] = searchAllRepos
-            if repoId:
-                params['repoConnectionId'] = repoId
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/commit/{ hash }'
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        # Populate the optional fields if needed
+        params = {}
+        if searchAllRepos:
+            params['searchCustomRepositories'] = searchAllRepos
+        if repoId:
+            params['repoConnectionId'] = repoId
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -3260,61 +2739,39 @@ class InformaticaCloudAPI:
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
 
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/compare/{ id }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/compare/{ id }'
             
-            # Include the mandatory fields
-            data = {
-                'source': oldVersion,
-                'destination': newVersion,
-                'outputFormat': format
-            }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Include the mandatory fields
+        data = {
+            'source': oldVersion,
+            'destination': newVersion,
+            'outputFormat': format
+        }
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Return the response
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        # Return the response
+        else:
+            if format == 'JSON':
+                resp = r.json()
             else:
-                if format == 'JSON':
-                    resp = r.json()
-                else:
-                    resp = r.text
-                break
+                resp = r.text
         
         return resp
     
@@ -3322,8 +2779,8 @@ class InformaticaCloudAPI:
     # Logs section
     #############################
 
-    def getSecurityLogs(self, category, actor, name, time_from, time_to, debug=False):
-        """This function returns the git history for an asset"""
+    def iterSecurityLogs(self, category, actor, name, time_from, time_to, debug=False):
+        """This function returns a generator of security log entries, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
@@ -3336,18 +2793,13 @@ class InformaticaCloudAPI:
         if time_from is None:
             time_from = past.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
         
-        attempts = 0
-        skip = 0
-        pages = []
-        
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/securityLog'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
+            url = f'{ self.base_url }/saas/public/core/v3/securityLog'
 
             # Initialise the query
-            params = { 'limit': self.page_size, 'skip': skip, 'q': f'entryTime>="{ time_from }" and entryTime<="{ time_to }"' }
+            params['q'] = f'entryTime>="{ time_from }" and entryTime<="{ time_to }"'
             if category:
                 params['q'] += f';actionCategory=="{ category }"'
             if actor:
@@ -3355,47 +2807,24 @@ class InformaticaCloudAPI:
             if name:
                 params['q'] += f';objectName=="{ name }"'
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+            r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()['entries']) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip += self.page_size
-                continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
-        for page in pages:
-            result += page['entries']
+        return self.paginate(fetchPage, lambda page: page['entries'])
 
-        return result
+    def getSecurityLogs(self, category, actor, name, time_from, time_to, debug=False):
+        """This function returns the git history for an asset"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        return list(self.iterSecurityLogs(category, actor, name, time_from, time_to, debug=debug))
     
 
     def getRunningActivityJobs(self, id=None, runId=None, taskId=None, taskName=None, debug=False):
@@ -3405,42 +2834,19 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/activity/activityMonitor'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            params = { 'details': 'true' }
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/activity/activityMonitor'
+        params = { 'details': 'true' }
+        r = self.executeRequest('GET', url, authType='v2', params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
 
         # Filter the running jobs
         if id:
@@ -3457,80 +2863,53 @@ class InformaticaCloudAPI:
         return result
     
 
-    def getCompletedActivityJobs(self, id=None, runId=None, taskId=None, taskName=None, debug=False):
-        """This function is used to return completed job info from the monitor"""
+    def iterCompletedActivityJobs(self, id=None, runId=None, taskId=None, taskName=None, debug=False):
+        """This function returns a generator of completed job info from the monitor, fetched page by page"""
         
         # Check if cli has been configured
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        skip = 0
-        pages = []
-        
-        while True:
+        def fetchPage(params):
         
             # Execute the API call
             if id:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/activity/activityLog/{ quote(id) }'
+                url = f'{ self.base_url }/saas/api/v2/activity/activityLog/{ quote(id) }'
             else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/activity/activityLog'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            params = { 'rowLimit': self.page_size, 'offset': skip }
+                url = f'{ self.base_url }/saas/api/v2/activity/activityLog'
             if taskId:
                 params['taskId'] = taskId
             if runId:
                 params['runId'] = runId
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+            r = self.executeRequest('GET', url, authType='v2', params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                if id:
-                    break
-                else:
-                    continue
-            # Break when there are no pages left
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                break
+                return r.json()
         
-        result = []
         if id:
-            result = pages
+            # A single activity log entry is returned as one object
+            page = fetchPage(OFFSET_ROW_LIMIT.params(0, self.page_size))
+            result = iter([page] if page else [])
         else:
-            for page in pages:
-                result += page
+            result = self.paginate(fetchPage, lambda page: page, style=OFFSET_ROW_LIMIT)
 
         # Filter the completed jobs
         if taskName:
-            result = [obj for obj in result if re.match(rf'^{ taskName }.*$', obj['objectName'])]
+            result = (obj for obj in result if re.match(rf'^{ taskName }.*$', obj['objectName']))
         
         return result
+
+    def getCompletedActivityJobs(self, id=None, runId=None, taskId=None, taskName=None, debug=False):
+        """This function is used to return completed job info from the monitor"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+
+        return list(self.iterCompletedActivityJobs(id=id, runId=runId, taskId=taskId, taskName=taskName, debug=debug))
     
 
     #############################
@@ -3546,58 +2925,36 @@ class InformaticaCloudAPI:
         
         # Lookup the agent id if needed
         if name:
-            lookup = self.getAgents(unassigned=unassigned, debug=debug)
+            lookup = self.resolveAgent(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            params = {}
-            if unassigned:
-                params['includeUnassignedOnly'] = unassigned
+        params = {}
+        if unassigned:
+            params['includeUnassignedOnly'] = unassigned
             
-            # Execute the API call
-            if id:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/agent/{ quote(id) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/agent'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        # Execute the API call
+        if id:
+            url = f'{ self.base_url }/saas/api/v2/agent/{ quote(id) }'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/agent'
+        r = self.executeRequest('GET', url, authType='v2', params=params, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -3610,54 +2967,32 @@ class InformaticaCloudAPI:
         
         # Lookup the agent id if needed
         if name:
-            lookup = self.getAgents(debug=debug)
+            lookup = self.resolveAgent(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-            
-            # Execute the API call
-            if id:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/agent/details/{ quote(id) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/agent/details'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        if id:
+            url = f'{ self.base_url }/saas/api/v2/agent/details/{ quote(id) }'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/agent/details'
+        r = self.executeRequest('GET', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -3670,54 +3005,36 @@ class InformaticaCloudAPI:
         
         # Lookup the agent id if needed
         if name:
-            lookup = self.getAgents(unassigned=unassigned, debug=debug)
+            lookup = self.resolveAgent(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/agent/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/agent/{ quote(id) }'
+        r = self.executeRequest('DELETE', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Agent deleted'
-                }
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Agent deleted'
+            }
+
+            # Forget the cached IDs that may no longer be valid
+            self.cache.invalidate('agent')
+            self.inventory = None
         
         return resp
     
@@ -3730,54 +3047,32 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
-        
-        while True:
-        
-            # Execute the API call
-            if id:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
+        
+        # Execute the API call
+        if id:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment'
+        r = self.executeRequest('GET', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -3789,49 +3084,31 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            data = {
-                '@type': 'runtimeEnvironment',
-                'name': name
-            }
-            if shared:
-                data['isShared'] = shared
+        data = {
+            '@type': 'runtimeEnvironment',
+            'name': name
+        }
+        if shared:
+            data['isShared'] = shared
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment'
+        r = self.executeRequest('POST', url, authType='v2', json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
+
+            # Forget any cached agent group with the same name, and list them again if they are needed later in the command
+            self.cache.invalidate('agentGroup', name)
+            self.inventory = None
         
         return resp
     
@@ -3843,27 +3120,30 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        # Lookup the agent group
+        # Lookup the agent group id if needed
         if groupName:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=groupName, debug=debug)
             try:
-                groupId = [obj for obj in lookup if obj['name'] == groupName][0]['id']
-                shared = [obj for obj in lookup if obj['name'] == groupName][0]['isShared']
+                groupId = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { groupName }'
                     }
-        else:
-            lookup = self.getAgentGroups(id=groupId, debug=debug)
-            try:
-                groupName = lookup['name']
-                shared = lookup['isShared']
-            except Exception as e:
-                return {
-                        'status': 500,
-                        'text': f'Unable to find id for runtime environment { groupId }'
-                    }
+
+        # Read the agent group again, as the update replaces its settings with the ones sent
+        lookup = self.getAgentGroups(id=groupId, debug=debug)
+        try:
+            groupName = lookup['name']
+            shared = lookup['isShared']
+        except Exception as e:
+
+            # Forget a cached ID that may no longer be valid
+            self.cache.invalidate('agentGroup')
+            return {
+                    'status': 500,
+                    'text': f'Unable to find id for runtime environment { groupName or groupId }'
+                }
         
         # Lookup the agent id if needed
         agents = []
@@ -3871,16 +3151,9 @@ class InformaticaCloudAPI:
             
             for agent in agentName:
                 try:
-                    lookup = self.getAgents(unassigned=False, debug=debug)
-                    filter = [obj for obj in lookup if obj['name'] == agent]
-                    
-                    if len(filter) == 0:
-                        lookup = self.getAgents(unassigned=True, debug=debug)
-                        agentId = [obj for obj in lookup if obj['name'] == agent][0]['id']
-                        orgId = [obj for obj in lookup if obj['name'] == agent][0]['orgId']
-                    else:
-                        agentId = filter[0]['id']
-                        orgId = filter[0]['orgId']
+                    lookup = self.resolveAgent(name=agent, debug=debug)
+                    agentId = lookup['id']
+                    orgId = lookup['orgId']
 
                     agents.append({
                         '@type': 'agent',
@@ -3895,10 +3168,7 @@ class InformaticaCloudAPI:
         else:
             for agent in agentId:
                 try:
-                    lookup = self.getAgents(id=agent, unassigned=False, debug=debug)
-                    
-                    if lookup is None:
-                        lookup = self.getAgents(id=agent, unassigned=True, debug=debug)
+                    lookup = self.getInventory(debug=debug)['agentId'][agent]
                     orgId = lookup['orgId']
 
                     agents.append({
@@ -3912,49 +3182,32 @@ class InformaticaCloudAPI:
                             'text': f'Unable to find id for runtime environment { agent }'
                         }
 
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            data = {
-                '@type': 'runtimeEnvironment',
-                'name': groupName,
-                'isShared': shared,
-                'agents': agents
-            }
+        data = {
+            '@type': 'runtimeEnvironment',
+            'name': groupName,
+            'isShared': shared,
+            'agents': agents
+        }
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(groupId) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(groupId) }'
+        r = self.executeRequest('POST', url, authType='v2', json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
+
+            # Forget the cached agents and agent groups, whose membership has changed
+            self.cache.invalidate('agent')
+            self.cache.invalidate('agentGroup')
+            self.inventory = None
         
         return resp
     
@@ -3968,7 +3221,7 @@ class InformaticaCloudAPI:
         
         # Lookup the agent group
         if name:
-            lookup = self.getAgentGroups(name=name, debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
                 id = lookup['id']
             except Exception as e:
@@ -3977,45 +3230,28 @@ class InformaticaCloudAPI:
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }'
+        r = self.executeRequest('DELETE', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Agent group deleted'
-                }
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Agent group deleted'
+            }
+
+            # Forget the cached IDs that may no longer be valid, including the agent group of its agents
+            self.cache.invalidate('agent')
+            self.cache.invalidate('agentGroup')
+            self.inventory = None
         
         return resp
     
@@ -4029,54 +3265,32 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            # Execute the API call
-            if includeAll:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections/details'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        if includeAll:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections/details'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections'
+        r = self.executeRequest('GET', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -4090,9 +3304,9 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -4148,57 +3362,35 @@ class InformaticaCloudAPI:
         if len(connectorObjs) == 0 and len(serviceObjs) == 0 and len(additionalObjs) == 0:
             raise Exception('Unable to find relevant service, connector or additional service') 
 
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            data = {
-                'services': {
-                    'selections': serviceObjs
-                },
-                'connectors': {
-                    'selections': connectorObjs
-                },
-                'additionalServices': {
-                    'selections': additionalObjs
-                },
-            }
+        data = {
+            'services': {
+                'selections': serviceObjs
+            },
+            'connectors': {
+                'selections': connectorObjs
+            },
+            'additionalServices': {
+                'selections': additionalObjs
+            },
+        }
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/selections'
+        r = self.executeRequest('PUT', url, authType='v2', json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
                     'status': r.status_code,
-                    'text': r.text
+                    'text': f'Components updated'
                 }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                        'status': r.status_code,
-                        'text': f'Components updated'
-                    }
-                break
         
         return resp
     
@@ -4212,9 +3404,9 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -4227,61 +3419,38 @@ class InformaticaCloudAPI:
         else:
             platform = ''
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            # Execute the API call
-            if overridden:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs{ platform }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs/details{ platform }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        if overridden:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs{ platform }'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs/details{ platform }'
+        r = self.executeRequest('GET', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
                 
-                # Apply the response filters if needed
-                if service:
-                    resp = { 
-                        service: resp[service]
-                     }
+            # Apply the response filters if needed
+            if service:
+                resp = { 
+                    service: resp[service]
+                 }
                     
-                    if type:
-                        filtered = [obj for obj in resp[service] if type in obj]
-                        resp[service] = filtered
+                if type:
+                    filtered = [obj for obj in resp[service] if type in obj]
+                    resp[service] = filtered
 
-                        if property:
-                            filtered = [obj for obj in resp[service][0][type] if property == obj['name']]
-                            resp[service][0][type] = filtered
+                    if property:
+                        filtered = [obj for obj in resp[service][0][type] if property == obj['name']]
+                        resp[service][0][type] = filtered
 
-                break
-        
         return resp
     
 
@@ -4294,9 +3463,9 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -4309,69 +3478,47 @@ class InformaticaCloudAPI:
         else:
             platform = ''
         
-        attempts = 0
         resp = ''
         
-        while True:
-            
-            # Prepare the mandatory fields
-            data = {
-                service: [
-                    {
-                        type: [
-                            {
-                                'name': property,
-                                'value': value
-                            }
-                        ]
-                    }
-                ]
-            }
+        # Prepare the mandatory fields
+        data = {
+            service: [
+                {
+                    type: [
+                        {
+                            'name': property,
+                            'value': value
+                        }
+                    ]
+                }
+            ]
+        }
 
-            # Add the optional fields if needed
-            if custom:
-                data[service][0][type][0]['isCustom'] = 'true'
-            else:
-                data[service][0][type][0]['isCustom'] = 'false'
-            if sensitive:
-                data[service][0][type][0]['isSensitive'] = 'true'
-            else:
-                data[service][0][type][0]['isSensitive'] = 'false'
+        # Add the optional fields if needed
+        if custom:
+            data[service][0][type][0]['isCustom'] = 'true'
+        else:
+            data[service][0][type][0]['isCustom'] = 'false'
+        if sensitive:
+            data[service][0][type][0]['isSensitive'] = 'true'
+        else:
+            data[service][0][type][0]['isSensitive'] = 'false'
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs{ platform }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs{ platform }'
+        r = self.executeRequest('PUT', url, authType='v2', json=data, debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Property updated'
-                }
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Property updated'
+            }
         
         return resp
     
@@ -4385,54 +3532,32 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.getAgentGroups(debug=debug)
+            lookup = self.resolveAgentGroup(name=name, debug=debug)
             try:
-                id = [obj for obj in lookup if obj['name'] == name][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for runtime environment { name }'
                     }
         
-        attempts = 0
         resp = ''
         
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/api/v2/runtimeEnvironment/{ quote(id) }/configs'
+        r = self.executeRequest('DELETE', url, authType='v2', debug=debug)
 
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Properties deleted'
-                }
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Properties deleted'
+            }
         
         return resp
     
@@ -4446,9 +3571,9 @@ class InformaticaCloudAPI:
         
         # Lookup the runtime env id if needed
         if name:
-            lookup = self.lookupObject(path=name, type='AGENT', debug=debug)
+            lookup = self.resolveObject(path=name, type='AGENT', debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -4456,47 +3581,26 @@ class InformaticaCloudAPI:
                     }
         
         resp = ''
-        attempts = 0
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'serviceName': service,
-                'serviceAction': action,
-                'agentId': id
-            }
+        # Prepare the mandatory fields
+        data = {
+            'serviceName': service,
+            'serviceAction': action,
+            'agentId': id
+        }
             
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/agent/service'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/agent/service'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -4524,54 +3628,31 @@ class InformaticaCloudAPI:
                         'text': f'Unable to find id for schedule { name }'
                     }
         
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            if id:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/schedule/{ quote( id ) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/schedule'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            # Initialise the query
-            params = { 'q': f'status=="{ status }"' }
-            if interval:
-                params['q'] += f';interval=="{ interval }"'
-            if time_from:
-                params['q'] += f';updateTime>="{ time_from }"'
-            if time_to:
-                params['q'] += f';updateTime<="{ time_to }"'
+        # Execute the API call
+        if id:
+            url = f'{ self.base_url }/saas/public/core/v3/schedule/{ quote( id ) }'
+        else:
+            url = f'{ self.base_url }/saas/public/core/v3/schedule'
 
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        # Initialise the query
+        params = { 'q': f'status=="{ status }"' }
+        if interval:
+            params['q'] += f';interval=="{ interval }"'
+        if time_from:
+            params['q'] += f';updateTime>="{ time_from }"'
+        if time_to:
+            params['q'] += f';updateTime<="{ time_to }"'
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('GET', url, params=params, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -4583,8 +3664,6 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        
         # Add the mandatory fields to the body
         data = {
             'name': name,
@@ -4631,40 +3710,19 @@ class InformaticaCloudAPI:
         if sat:
             data['sat'] = sat
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/schedule'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/schedule'
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('POST', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -4697,8 +3755,6 @@ class InformaticaCloudAPI:
                         'text': f'Unable to find id for schedule { id }'
                     }
         
-        attempts = 0
-        
         # Add the mandatory fields to the body
         data = {
             'schedules': [
@@ -4753,40 +3809,19 @@ class InformaticaCloudAPI:
         if sat:
             data['schedules'][0]['sat'] = sat
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/schedule/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-
-            r = requests.patch(url, headers=headers, json=data, allow_redirects=False)
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/schedule/{ quote( id ) }'
 
-            if debug:
-                self.debugRequest(r, attempts)
+        r = self.executeRequest('PATCH', url, json=data, debug=debug)
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -4807,47 +3842,25 @@ class InformaticaCloudAPI:
                 return {
                         'status': 500,
                         'text': f'Unable to find id for schedule { name }'
-                    }
-        
-        attempts = 0
-        resp = ''
-        
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/schedule/{ quote( id ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Schedule deleted'
-                }
-                break
+                    }
+        
+        resp = ''
+        
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/schedule/{ quote( id ) }'
+        r = self.executeRequest('DELETE', url, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Schedule deleted'
+            }
         
         return resp
     
@@ -4863,58 +3876,37 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find user for id { username }'
                     }
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'userId': id,
-                'newPassword': newPassword,
-                'oldPassword': oldPassword
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/Users/ChangePassword'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'userId': id,
+            'newPassword': newPassword,
+            'oldPassword': oldPassword
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = { 'message': 'Password changed' }
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/Users/ChangePassword'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = { 'message': 'Password changed' }
         
         return resp
     
@@ -4927,58 +3919,37 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the user id if needed
         if username:
-            lookup = self.getUsers(username=username, debug=debug)
+            lookup = self.resolveUser(username=username, debug=debug)
             try:
-                id = lookup[0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find user for id { username }'
                     }
 
-        while True:
-        
-            # Prepare the mandatory fields
-            data = {
-                'userId': id,
-                'newPassword': newPassword,
-                'securityAnswer': securityAnswer
-            }
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/Users/ResetPassword'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        # Prepare the mandatory fields
+        data = {
+            'userId': id,
+            'newPassword': newPassword,
+            'securityAnswer': securityAnswer
+        }
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = { 'message': 'Password changed' }
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/Users/ResetPassword'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = { 'message': 'Password changed' }
         
         return resp
 
@@ -4995,13 +3966,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -5010,48 +3980,28 @@ class InformaticaCloudAPI:
             
         params = None
 
-        while True:
-            
-            # Execute the API call
-            if acl:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
-            elif checkAccess:
-                if checkType:
-                    params = {
-                        'type': checkType
-                    }
-
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions/checkAccess'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
+        # Execute the API call
+        if acl:
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
+        elif checkAccess:
+            if checkType:
+                params = {
+                    'type': checkType
                 }
-                break
-            else:
-                resp = r.json()
-                break
+
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions/checkAccess'
+        else:
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions'
+        r = self.executeRequest('GET', url, params=params, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -5063,13 +4013,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -5091,38 +4040,18 @@ class InformaticaCloudAPI:
             }
         }
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -5135,13 +4064,12 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
@@ -5163,41 +4091,21 @@ class InformaticaCloudAPI:
             }
         }
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.put(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Permission updated'
-                }
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
+        r = self.executeRequest('PUT', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Permission updated'
+            }
         
         return resp
     
@@ -5210,57 +4118,36 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         resp = ''
-        attempts = 0
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
 
-        while True:
-            
-            # Execute the API call
-            if acl:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/objects/{ quote( id ) }/permissions'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.delete(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = {
-                    'status': r.status_code,
-                    'text': 'Permissions deleted'
-                }
-                break
+        # Execute the API call
+        if acl:
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions/{ quote( acl ) }'
+        else:
+            url = f'{ self.base_url }/saas/public/core/v3/objects/{ quote( id ) }/permissions'
+        r = self.executeRequest('DELETE', url, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = {
+                'status': r.status_code,
+                'text': 'Permissions deleted'
+            }
         
         return resp
     
@@ -5268,66 +4155,70 @@ class InformaticaCloudAPI:
     # Organizations section
     #############################
 
-    def getOrg(self, subId=None, subName=None, debug=False):
-        """This function returns details about an organisation or sub-organisation"""
-        
+    def getOrg(self, subId=None, subName=None, debug=False):
+        """This function returns details about an organisation or sub-organisation"""
+        
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
+        
+        # Execute the API call
+        if subId:
+            url = f'{ self.base_url }/saas/api/v2/org/{ quote(subId) }'
+        elif subName:
+            url = f'{ self.base_url }/saas/api/v2/org/name/{ quote(subName) }'
+        else:
+            url = f'{ self.base_url }/saas/api/v2/org'
+
+        # The v2 org API reports an expired session as forbidden
+        r = self.executeRequest('GET', url, authType='v2', policy=RetryPolicy(relogin=(401, 403)), debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
+
+        return resp
+
+    def getOrgInfo(self, refresh=False, debug=False):
+        """
+        This function returns the details of the org of the user, e.g. its orgUUID and sub-orgs, together
+        with its pod and region. They are cached for orgTtl seconds and fetched again after each login.
+        """
+
         # Check if cli has been configured
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
-        
-        attempts = 0
-        
-        while True:
-        
-            # Execute the API call
-            if subId:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/org/{ quote(subId) }'
-            elif subName:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/org/name/{ quote(subName) }'
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/org'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
 
-            if debug:
-                self.debugRequest(r, attempts)
+        org = None if refresh else self.cache.get('org', 'org')
+        if org is None:
+            resp = self.getOrg(debug=debug)
 
-            # Check for expired session token
-            if r.status_code in [401,403] and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+            # Return a failure if the org could not be retrieved
+            if isinstance(resp, list) and resp:
+                resp = resp[0]
+            if not isinstance(resp, dict) or 'orgUUID' not in resp:
+                return resp
 
-        return resp
+            org = dict(resp, pod=self.pod, region=self.region)
+            self.cache.set('org', { 'org': org }, ttl=self.org_ttl)
+
+        return org
     
     #############################
     # Jobs section
     #############################
 
-    def getMonitorJobs(self, type=None, name=None, status=None, errorMsg=None, location=None, startSince=None, startUntil=None, endSince=None, endUntil=None, runtime=None, orderBy=None, debug=False):
+    def iterMonitorJobs(self, type=None, name=None, status=None, errorMsg=None, location=None, startSince=None, startUntil=None, endSince=None, endUntil=None, runtime=None, orderBy=None, debug=False):
         """
         ***WARNING!!!***
         Experimental function - not officially supported
 
-        Used to return job details from the monitor
+        Used to return a generator of job details from the monitor, fetched page by page
         """
         
         # Check if cli has been configured
@@ -5335,242 +4226,167 @@ class InformaticaCloudAPI:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
         # Get the org ID
-        orgId = self.getOrg(debug=debug)[0]['orgUUID']
-        
-        attempts = 0
-        skip = 0
-        pages = []
+        org = self.getOrgInfo(debug=debug)
+        if 'orgUUID' not in org:
+            return org
+        orgId = org['orgUUID']
         
-        while True:
+        # Prepare the filters
+        filters = []
+        if status:
+            statuses = status.split(',')
+            statuses = [f"status eq '{ item }'" for item in statuses]
+            statuses = ' or '.join(statuses)
+            filters.append(quote(f"({ statuses })"))
+        if name:
+            filters.append(quote(f"(contains(assetName,'{ name }'))"))
+        if type:
+            filters.append(quote(f"(assetType eq '{ type }')"))
+        if errorMsg:
+            filters.append(quote(f"(contains(errorMessage,'{ errorMsg }'))"))
+        if location:
+            filters.append(quote(f"(contains(location,'{ location }'))"))
+        if startSince:
+            filters.append(quote(f"(startTime ge { startSince })"))
+        if startUntil:
+            filters.append(quote(f"(startTime le { startUntil })"))
+        if endSince:
+            filters.append(quote(f"(startTime ge { endSince })"))
+        if endUntil:
+            filters.append(quote(f"(startTime le { endUntil })"))
+        if runtime:
+            filters.append(quote(f"(contains(runtimeEnvName,'{ runtime }'))"))
+
+        if len(filters) > 0:
+            #params['$filter'] = ' and '.join(filters)
+            url = f"{ self.base_url }/jls-di/api/v1/Orgs('{ orgId }')/JobLogEntries?%24filter={ ' and '.join(filters) }"
+        else:
+            url = f"{ self.base_url }/jls-di/api/v1/Orgs('{ orgId }')/JobLogEntries"
+
+        def fetchPage(params):
         
             # Execute the API call
-            xsrf = shortuuid.uuid()
-            headers = { 'Accept': 'application/json', 'XSRF_TOKEN': xsrf, 'Cookie': f'USER_SESSION={ self.session_id }; XSRF_TOKEN={ xsrf }' }
-            params = { '$top': self.page_size, '$skip': skip }
-            
+            headers = { 'Accept': 'application/json' }
             if orderBy:
                 params['$orderby'] = orderBy
-            
-            filters = []
-            if status:
-                statuses = status.split(',')
-                statuses = [f"status eq '{ item }'" for item in statuses]
-                statuses = ' or '.join(statuses)
-                filters.append(quote(f"({ statuses })"))
-            if name:
-                filters.append(quote(f"(contains(assetName,'{ name }'))"))
-            if type:
-                filters.append(quote(f"(assetType eq '{ type }')"))
-            if errorMsg:
-                filters.append(quote(f"(contains(errorMessage,'{ errorMsg }'))"))
-            if location:
-                filters.append(quote(f"(contains(location,'{ location }'))"))
-            if startSince:
-                filters.append(quote(f"(startTime ge { startSince })"))
-            if startUntil:
-                filters.append(quote(f"(startTime le { startUntil })"))
-            if endSince:
-                filters.append(quote(f"(startTime ge { endSince })"))
-            if endUntil:
-                filters.append(quote(f"(startTime le { endUntil })"))
-            if runtime:
-                filters.append(quote(f"(contains(runtimeEnvName,'{ runtime }'))"))
-            
-            if len(filters) > 0:
-                #params['$filter'] = ' and '.join(filters)
-                url = f"https://{ self.pod }.{ self.region }.informaticacloud.com/jls-di/api/v1/Orgs('{ orgId }')/JobLogEntries?%24filter={ ' and '.join(filters) }"
+            r = self.executeRequest('GET', url, authType='cookie', headers=headers, params=params, debug=debug)
+
+            # Stop if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                return None
             else:
-                url = f"https://{ self.pod }.{ self.region }.informaticacloud.com/jls-di/api/v1/Orgs('{ orgId }')/JobLogEntries"
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+                return r.json()
+        
+        return self.paginate(fetchPage, lambda page: page['value'], style=ODATA)
 
-            if debug:
-                self.debugRequest(r, attempts)
+    def getMonitorJobs(self, type=None, name=None, status=None, errorMsg=None, location=None, startSince=None, startUntil=None, endSince=None, endUntil=None, runtime=None, orderBy=None, debug=False):
+        """
+        ***WARNING!!!***
+        Experimental function - not officially supported
 
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                pages.append(resp)
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # If there is still some data then continue onto the next page
-            elif len(r.json()) > 0:
-                resp = r.json()
-                pages.append(resp)
-                skip = skip + self.page_size
-                if id:
-                    break
-                else:
-                    continue
-            # Break when there are no pages left
-            else:
-                break
+        Used to return job details from the monitor
+        """
         
-        result = []
-        for page in pages:
-            result += page['value']
+        # Check if cli has been configured
+        if not self.username:
+            return 'CLI needs to be configured. Run the command "idmc configure"'
 
-        return result
+        jobs = self.iterMonitorJobs(type=type, name=name, status=status, errorMsg=errorMsg, location=location, startSince=startSince, startUntil=startUntil, endSince=endSince, endUntil=endUntil, runtime=runtime, orderBy=orderBy, debug=debug)
+
+        # Return a failure if the org could not be retrieved
+        if isinstance(jobs, (dict, str)):
+            return jobs
+
+        return list(jobs)
 
     
-    def waitForCdiJobs(self, type, jobs, pollDelay=3, debug=False):
-        """This function is used to wait for CDI jobs to complete"""
-        
+    def getCdiJobStatus(self, type, job, debug=False):
+        """This function returns the status of a started CDI job"""
+
         # For taskflow jobs
         if type == 'TASKFLOW':
-            
-            done = False
-            while not done:
-
-                status = []
-                
-                # Check the status of all jobs
-                for job in jobs:
-                    
-                    attempts = 0
-
-                    while True:
-                        url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/active-bpel/services/tf/status/{ quote(job['RunId']) }'
-                        headers = { 'Accept': 'application/json', 'Content-Type': 'application/json' }
-                        r = requests.get(url, headers=headers, auth=(self.username, self.password), allow_redirects=False)
-
-                        if debug:
-                            self.debugRequest(r, attempts)
-                        
-                        # Abort after the maximum number of attempts
-                        if attempts > self.max_attempts:
-                            resp = {
-                                'status': r.status_code,
-                                'text': r.text
-                            }
-                            break
-                        # Else if there is an unexpected error return a failure
-                        elif r.status_code < 200 or r.status_code > 299:
-                            resp = {
-                                'status': r.status_code,
-                                'text': r.text
-                            }
-                            attempts += 1
-                            continue
-                        # Break when there are no pages left
-                        else:
-                            resp = r.json()
-                            break
-
-                    status.append(resp)
-
-                # Evaluate if all jobs have finished
-                done = all(item['status'] != 'RUNNING' for item in status)
-                if not done:
-                    time.sleep(pollDelay)
+            url = f'{ self.base_url }/active-bpel/services/tf/status/{ quote(job['RunId']) }'
+            r = self.executeRequest('GET', url, authType='basic', policy=POLLING, debug=debug)
 
         # For all other CDI jobs
         else:
-            done = False
-            while not done:
+            url = f'{ self.base_url }/saas/api/v2/activity/activityLog'
+            params = {
+                'taskId': job['taskId'],
+                'runId': job['runId']
+            }
+            r = self.executeRequest('GET', url, authType='v2', params=params, policy=POLLING, debug=debug)
 
-                status = []
-                
-                # Check the status of all jobs
-                for job in jobs:
-                    
-                    attempts = 0
+        # Return a failure if the status could not be retrieved
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
 
-                    while True:
-                        url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/activity/activityLog'
-                        params = {
-                            'taskId': job['taskId'],
-                            'runId': job['runId']
-                        }
-                        headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-                        r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-
-                        if debug:
-                            self.debugRequest(r, attempts)
-                        
-                        # Check for expired session token
-                        if r.status_code == 401 and attempts <= self.max_attempts:
-                            self.login()
-                            attempts = attempts + 1
-                            continue
-                        # Abort after the maximum number of attempts
-                        elif attempts > self.max_attempts:
-                            resp = {
-                                'status': r.status_code,
-                                'text': r.text
-                            }
-                            break
-                        # Else if there is an unexpected error return a failure
-                        elif r.status_code < 200 or r.status_code > 299:
-                            resp = {
-                                'status': r.status_code,
-                                'text': r.text
-                            }
-                            attempts += 1
-                            continue
-                        # Break when there are no pages left
-                        else:
-                            resp = r.json()
-                            break
-
-                    status.append(resp)
-
-                # Evaluate if all jobs have finished
+        return resp
+
+    def waitForCdiJobs(self, type, jobs, pollDelay=3, debug=False):
+        """This function is used to wait for CDI jobs to complete"""
+
+        done = False
+        while not done:
+
+            # Check the status of all jobs concurrently
+            status = self.runConcurrently([('getCdiJobStatus', { 'type': type, 'job': job, 'debug': debug }) for job in jobs])
+
+            # Evaluate if all jobs have finished
+            if type == 'TASKFLOW':
+                done = all(item['status'] != 'RUNNING' for item in status)
+            else:
                 done = True if sum(1 for sublist in status if len(sublist) > 0) == len(jobs) else False
-                if not done:
-                    time.sleep(pollDelay)
+            if not done:
+                time.sleep(pollDelay)
 
         return status
-
-                
     
     def startCdiJobs(self, ids=None, paths=None, type=None, callbackUrl=None, paramFile=None, paramDir=None, apiNames=None, wait=None, pollDelay=None, debug=False):
         """This function is used to manage starting multiple jobs, including the support of wildcard path searches."""
 
-        result = []
+        calls = []
         
         if type == 'TASKFLOW':
             apiNames = apiNames.split(',')
             for apiName in apiNames:
-                result.append(self.startCdiJob(apiName=apiName, type=type, debug=debug))
+                calls.append({ 'apiName': apiName, 'type': type, 'debug': debug })
 
         elif ids:
             ids = ids.split(',')
             for id in ids:
-                result.append(self.startCdiJob(id=id, type=type, callbackUrl=callbackUrl, paramFile=paramFile, paramDir=paramDir, debug=debug))
+                calls.append({ 'id': id, 'type': type, 'callbackUrl': callbackUrl, 'paramFile': paramFile, 'paramDir': paramDir, 'debug': debug })
                     
         elif paths:
             
-            # Get a list of all objects to support a wildcard search if needed
-            if '*' in paths or '?' in paths:
+            # Get a list of all objects to support a wildcard search if needed, unless the local object catalog can match them
+            objects = None
+            if ('*' in paths or '?' in paths) and not self.catalog.synced():
                 objects = self.getObjects(type=type, debug=debug)
             
-            # Loop through the paths, search for matching objects and execute the jobs
+            # Loop through the paths, search for matching objects and queue the jobs
             paths = paths.split(',')
             for path in paths:
-                if '*' in path or '?' in path:
+                if ('*' in path or '?' in path) and objects is None:
+                    filtered = self.catalogObjects(path=path, type=type, debug=debug)
+                elif '*' in path or '?' in path:
                     filtered = [obj for obj in objects if fnmatch.fnmatch(obj['path'], path) ]
                 else:
                     filtered = []
-                    filtered.append(self.lookupObject(path=path, type=type, debug=debug)['objects'][0])
+                    filtered.append(self.resolveObject(path=path, type=type, debug=debug))
                 for obj in filtered:
-                    result.append(self.startCdiJob(id=obj['id'], type=type, callbackUrl=callbackUrl, paramFile=paramFile, paramDir=paramDir, debug=debug))
+                    calls.append({ 'id': obj['id'], 'type': type, 'callbackUrl': callbackUrl, 'paramFile': paramFile, 'paramDir': paramDir, 'debug': debug })
 
         else:
-            result.append(self.startCdiJob(id=ids, path=paths, type=type, callbackUrl=callbackUrl, paramFile=paramFile, paramDir=paramDir, debug=debug))
+            calls.append({ 'id': ids, 'path': paths, 'type': type, 'callbackUrl': callbackUrl, 'paramFile': paramFile, 'paramDir': paramDir, 'debug': debug })
+
+        # Start the jobs concurrently, keeping the results in the requested order
+        result = self.runConcurrently([('startCdiJob', kwargs) for kwargs in calls])
         
         if wait:
             return self.waitForCdiJobs(type=type, jobs=result, pollDelay=pollDelay, debug=debug)   
@@ -5588,68 +4404,46 @@ class InformaticaCloudAPI:
         
         # Lookup the object id if needed
         if path and type:
-            lookup = self.lookupObject(path=path, type=type, debug=debug)
+            lookup = self.resolveObject(path=path, type=type, debug=debug)
             try:
-                id = lookup['objects'][0]['id']
+                id = lookup['id']
             except Exception as e:
                 return {
                         'status': 500,
                         'text': f'Unable to find object id for path { path } and type { type }'
                 }
         
-        attempts = 0
         resp = ''
         
-        while True:
-        
-            if type == 'TASKFLOW':
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/active-bpel/rt/{ apiName }'
-                headers = { 'Accept': 'application/json', 'Content-Type': 'application/json' }
-                r = requests.get(url, headers=headers, auth=(self.username, self.password), allow_redirects=False)
-            else:
-                data = {
-                    '@type': 'job',
-                    'taskFederatedId': id,
-                    'taskType': type
-                }
-                if callbackUrl:
-                    data['callbackURL'] = callbackUrl
-                if paramFile and paramDir:
-                    data['runtime'] = {}
-                    data['runtime']['parameterFileName'] = paramFile
-                    data['runtime']['parameterFileDir'] = paramDir
-                
-                # Execute the API call
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/job'
-                headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-                r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-
-            if debug:
-                self.debugRequest(r, attempts)
+        # Starting a job is never idempotent, even for the taskflow GET endpoint
+        if type == 'TASKFLOW':
+            url = f'{ self.base_url }/active-bpel/rt/{ apiName }'
+            r = self.executeRequest('GET', url, authType='basic', policy=NON_IDEMPOTENT, debug=debug)
+        else:
+            data = {
+                '@type': 'job',
+                'taskFederatedId': id,
+                'taskType': type
+            }
+            if callbackUrl:
+                data['callbackURL'] = callbackUrl
+            if paramFile and paramDir:
+                data['runtime'] = {}
+                data['runtime']['parameterFileName'] = paramFile
+                data['runtime']['parameterFileDir'] = paramDir
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Break when there are no pages left
-            else:
-                resp = r.json()
-                break
+            # Execute the API call
+            url = f'{ self.base_url }/saas/api/v2/job'
+            r = self.executeRequest('POST', url, authType='v2', json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -5677,6 +4471,8 @@ class InformaticaCloudAPI:
         # Get the running jobs
         stop = []
         jobs = self.getMonitorJobs(status=status, debug=debug)
+        if isinstance(jobs, (dict, str)):
+            return jobs
         for job in jobs:
             job['extraData'] = json.loads(job['extraData'])
 
@@ -5704,70 +4500,45 @@ class InformaticaCloudAPI:
             print('Attempting to stop:\n')
             print(stop)
         
-        attempts = 0
         resp = ''
         result = []
 
         # Stop the running jobs
         for job in stop:
         
-            while True:
-            
-                if job['assetType'] == 'TASKFLOW':
-                    url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/active-bpel/restadmin/processes/{ quote(job['cli_job_id']) }/terminate?isManual=true'
-                    xsrf = shortuuid.uuid()
-                    headers = { 'Accept': 'application/json', 'XSRF_TOKEN': xsrf, 'Cookie': f'USER_SESSION={ self.session_id }; XSRF_TOKEN={ xsrf }', 'Content-Type': 'application/json' }
-                    r = requests.put(url, headers=headers, allow_redirects=False)
-                else:
-                    data = {
-                        '@type': 'job',
-                        'taskFederatedId': job['assetId'],
-                        'taskType': job['assetType']
-                    }
-                    
-                    params = {}
-                    if clean:
-                        params['cleanStop'] = 'true'
-                    
-                    # Execute the API call
-                    url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/api/v2/job/stop'
-                    headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'icSessionId': self.session_id }
-                    r = requests.post(url, headers=headers, json=data, params=params, allow_redirects=False)
-
-                if debug:
-                    self.debugRequest(r, attempts)
+            if job['assetType'] == 'TASKFLOW':
+                url = f'{ self.base_url }/active-bpel/restadmin/processes/{ quote(job['cli_job_id']) }/terminate?isManual=true'
+                r = self.executeRequest('PUT', url, authType='cookie', debug=debug)
+            else:
+                data = {
+                    '@type': 'job',
+                    'taskFederatedId': job['assetId'],
+                    'taskType': job['assetType']
+                }
                 
-                # Check for expired session token
-                if r.status_code == 401 and attempts <= self.max_attempts:
-                    self.login()
-                    attempts = attempts + 1
-                    continue
-                # Abort after the maximum number of attempts
-                elif attempts > self.max_attempts:
-                    resp = {
-                        'status': r.status_code,
-                        'text': r.text
-                    }
-                    result.append(resp)
-                    break
-                # Else if there is an unexpected error return a failure
-                elif r.status_code < 200 or r.status_code > 299:
-                    resp = {
-                        'status': r.status_code,
-                        'text': r.text
-                    }
-                    break
-                # Break when there are no pages left
-                else:
-                    resp = {
-                        'status': r.status_code,
-                        'text': 'Stop request submitted successfully',
-                        'jobId': job['cli_job_id'],
-                        'jobType': job['assetType'],
-                        'jobName': job['assetName']
-                    }
-                    result.append(resp)
-                    break
+                params = {}
+                if clean:
+                    params['cleanStop'] = 'true'
+                
+                # Execute the API call
+                url = f'{ self.base_url }/saas/api/v2/job/stop'
+                r = self.executeRequest('POST', url, authType='v2', json=data, params=params, debug=debug)
+
+            # Skip the job if there is an unexpected error
+            if r.status_code < 200 or r.status_code > 299:
+                resp = {
+                    'status': r.status_code,
+                    'text': r.text
+                }
+            else:
+                resp = {
+                    'status': r.status_code,
+                    'text': 'Stop request submitted successfully',
+                    'jobId': job['cli_job_id'],
+                    'jobType': job['assetType'],
+                    'jobName': job['assetName']
+                }
+                result.append(resp)
         
         return result
     
@@ -5833,47 +4604,25 @@ class InformaticaCloudAPI:
                     }
                     objects.append(obj)
                 
-        
-        attempts = 0
         resp = ''
 
-        while True:
-        
-            data = {}
-            if name:
-                data['name'] = name
-            data['objects'] = objects
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/export'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
+        data = {}
+        if name:
+            data['name'] = name
+        data['objects'] = objects
             
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/export'
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -5885,46 +4634,25 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
-        resp = ''
-
-        while True:
-            
-            params = {}
-            if expand:
-                params['expand'] = 'objects'
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/export/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
-        
+        resp = ''
+
+        params = {}
+        if expand:
+            params['expand'] = 'objects'
+            
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/export/{ quote(id) }'
+        r = self.executeRequest('GET', url, params=params, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
+        
         return resp
     
 
@@ -5935,41 +4663,21 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/export/{ quote(id) }/package'
+        headers = { 'Accept': 'application/zip' }
+        r = self.executeRequest('GET', url, headers=headers, debug=debug)
 
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/export/{ quote(id) }/package'
-            headers = { 'Accept': 'application/zip', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.content
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.content
         
         return resp
 
@@ -6008,43 +4716,24 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
-
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/import/package'
-            filePath = Path(filePath)
-            files = {'package': (filePath.name, open(filePath, 'rb'), 'application/zip')}
-            headers = { 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, files=files, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/import/package'
+        filePath = Path(filePath)
+        # Read the package up front so it can be sent again if the upload is retried
+        files = {'package': (filePath.name, filePath.read_bytes(), 'application/zip')}
+        headers = {}
+        r = self.executeRequest('POST', url, headers=headers, files=files, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -6055,47 +4744,26 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/import/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            data = {
-                'name' : name + '-' + shortuuid.uuid()[:8],
-                'importSpecification' : {
-                    'defaultConflictResolution' : 'REUSE'
-                }
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/import/{ quote(id) }'
+        data = {
+            'name' : name + '-' + shortuuid.uuid()[:8],
+            'importSpecification' : {
+                'defaultConflictResolution' : 'REUSE'
             }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        }
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -6106,45 +4774,24 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
-            
-            params = {}
-            if expand:
-                params['expand'] = 'objects'
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/import/{ quote(id) }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, params=params, allow_redirects=False)
+        params = {}
+        if expand:
+            params['expand'] = 'objects'
             
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/import/{ quote(id) }'
+        r = self.executeRequest('GET', url, params=params, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -6195,57 +4842,36 @@ class InformaticaCloudAPI:
         if startDate is None:
             startDate = past.strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
         
-        attempts = 0
         resp = ''
 
-        while True:
-            
-            # Execute the API call
-            if type == 'JOB':
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/license/metering/ExportServiceJobLevelMeteringData'
-                data = {
-                    'startDate': startDate,
-                    'endDate': endDate,
-                    'allMeters': True
-                }
-            else:
-                url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/license/metering/ExportMeteringData'
-                data = {
-                    'startDate': startDate,
-                    'endDate': endDate,
-                    'jobType': type,
-                    'allLinkedOrgs': linked
-                }
-                if type in ['SUMMARY', 'PROJECT']:
-                    data['combinedMeterUsage'] = combined
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.post(url, headers=headers, json=data, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        if type == 'JOB':
+            url = f'{ self.base_url }/saas/public/core/v3/license/metering/ExportServiceJobLevelMeteringData'
+            data = {
+                'startDate': startDate,
+                'endDate': endDate,
+                'allMeters': True
+            }
+        else:
+            url = f'{ self.base_url }/saas/public/core/v3/license/metering/ExportMeteringData'
+            data = {
+                'startDate': startDate,
+                'endDate': endDate,
+                'jobType': type,
+                'allLinkedOrgs': linked
+            }
+            if type in ['SUMMARY', 'PROJECT']:
+                data['combinedMeterUsage'] = combined
+        r = self.executeRequest('POST', url, json=data, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -6257,41 +4883,20 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
-            
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/license/metering/ExportMeteringData/{ id }'
-            headers = { 'Accept': 'application/json', 'Content-Type': 'application/json', 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.json()
-                break
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/license/metering/ExportMeteringData/{ id }'
+        r = self.executeRequest('GET', url, debug=debug)
+
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.json()
         
         return resp
     
@@ -6303,41 +4908,21 @@ class InformaticaCloudAPI:
         if not self.username:
             return 'CLI needs to be configured. Run the command "idmc configure"'
         
-        attempts = 0
         resp = ''
 
-        while True:
+        # Execute the API call
+        url = f'{ self.base_url }/saas/public/core/v3/license/metering/ExportMeteringData/{ id }/download'
+        headers = {}
+        r = self.executeRequest('GET', url, headers=headers, debug=debug)
 
-            # Execute the API call
-            url = f'https://{ self.pod }.{ self.region }.informaticacloud.com/saas/public/core/v3/license/metering/ExportMeteringData/{ id }/download'
-            headers = { 'INFA-SESSION-ID': self.session_id }
-            r = requests.get(url, headers=headers, allow_redirects=False)
-            
-            if debug:
-                self.debugRequest(r, attempts)
-            
-            # Check for expired session token
-            if r.status_code == 401 and attempts <= self.max_attempts:
-                self.login()
-                attempts = attempts + 1
-                continue
-            # Abort after the maximum number of attempts
-            elif attempts > self.max_attempts:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            # Else if there is an unexpected error return a failure
-            elif r.status_code < 200 or r.status_code > 299:
-                resp = {
-                    'status': r.status_code,
-                    'text': r.text
-                }
-                break
-            else:
-                resp = r.content
-                break
+        # Return a failure if there is an unexpected error
+        if r.status_code < 200 or r.status_code > 299:
+            resp = {
+                'status': r.status_code,
+                'text': r.text
+            }
+        else:
+            resp = r.content
         
         return resp
     
@@ -6376,5 +4961,32 @@ class InformaticaCloudAPI:
 
 
 
+# Record every API operation as a span of the command when tracing
+for name, func in inspect.getmembers(InformaticaCloudAPI, inspect.isfunction):
+    if not name.startswith('_') and name not in ['createSession', 'sessionHeaders', 'executeRequest', 'recordAttempt', 'ensureSession', 'paginate', 'debugRequest']:
+        setattr(InformaticaCloudAPI, name, traced(name, func))
+
+class LazyClient:
+    """
+    Client shared by the commands, which is only built when it is first used, so that importing
+    a command to show its help or report a usage error reads no config and creates no files.
+    """
+
+    def __init__(self):
+        object.__setattr__(self, '_client', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get(self):
+        with self._lock:
+            if self._client is None:
+                object.__setattr__(self, '_client', InformaticaCloudAPI())
+        return self._client
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
 # Expose the class as a variable
-api = InformaticaCloudAPI()
\ No newline at end of file
+api = LazyClient()
@@ -0,0 +1,220 @@
+"""
+End-to-end benchmarks of the CLI against the local mock server.
+
+Each workload runs in a fresh worker process so that its peak memory is measured in
+isolation, while the mock server runs in the calling process. Results are returned as
+a dict that can be saved as JSON and compared with an earlier run.
+"""
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from statistics import median
+from idmc_cli.mockserver import MockServer, MockData
+
+
+class Workload:
+    """A representative command, with the synthetic data it needs and its default size"""
+
+    def __init__(self, description, size, data, run):
+        self.description = description
+        self.size = size
+        self.data = data
+        self.run = run
+
+
+def queryObjects(api, size, workdir):
+    return sum(1 for _ in api.iterObjects())
+
+
+def exportSecurityLog(suffix):
+    def run(api, size, workdir):
+        from idmc_cli.cli import write_output
+        write_output(workdir / f'securityLog{ suffix }', None, api.iterSecurityLogs(None, None, None, None, None))
+        return size
+    return run
+
+
+def startJobs(api, size, workdir):
+    ids = ','.join(f'obj{ i:019d}' for i in range(size))
+    return len(api.startCdiJobs(ids=ids, type='MTT', wait=True, pollDelay=0))
+
+
+def exportObjects(api, size, workdir):
+    ids = ','.join(f'obj{ i:019d}' for i in range(size))
+    (workdir / 'export.zip').write_bytes(api.runExport(ids=ids, pollDelay=0))
+    return size
+
+
+WORKLOADS = {
+    'objects-query': Workload('Query 100k objects', 100000, lambda size: MockData(objects=size), queryObjects),
+    'security-log-csv': Workload('Export 1M security log entries to CSV', 1000000, lambda size: MockData(logs=size), exportSecurityLog('.csv')),
+    'security-log-xlsx': Workload('Export 1M security log entries to XLSX', 1000000, lambda size: MockData(logs=size), exportSecurityLog('.xlsx')),
+    'jobs-start-wait': Workload('Start 500 jobs and wait for them', 500, lambda size: MockData(objects=size), startJobs),
+    'export': Workload('Export 200 objects', 200, lambda size: MockData(objects=size), exportObjects)
+}
+
+# Client settings of every run, which are pinned rather than read from the user's config so that
+# the results of different machines can be compared
+SETTINGS = {
+    'maxAttempts': 5,
+    'pageSize': 100,
+    'pageWindow': 4,
+    'poolSize': 10,
+    'lookupBatchSize': 100
+}
+
+
+def percentile(values, percent):
+    """This function returns the nearest rank percentile of a list of values"""
+
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, -(-len(values) * percent // 100) - 1)]
+
+
+def peakRss():
+    """This function returns the peak resident memory of the current process in MB"""
+
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    # Linux reports kilobytes and macOS bytes
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def measureStartup(args=('--help',), runs=5):
+    """This function returns the median time taken to start the CLI with some arguments, by default to print its help"""
+
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'from idmc_cli.cli import idmc; idmc()', *args], stdout=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - start)
+    return round(median(times), 3)
+
+
+def runWorkload(name, url, size, settings=SETTINGS):
+    """This function runs a workload in the current process and returns its measurements"""
+
+    from idmc_cli.api import InformaticaCloudAPI
+    from idmc_cli.config import Config
+
+    workdir = Path(tempfile.mkdtemp(prefix='idmc-bench-'))
+
+    # Point a client at the mock server with its own config, so that its session, cache and
+    # catalog are kept in the work directory and the user's files are neither read nor created
+    config = Config(workdir / 'config.json')
+    config.update({ **settings, 'username': 'bench', 'password': 'bench', 'loginUrl': url, 'baseUrl': url })
+    api = InformaticaCloudAPI(config)
+    api.login()
+
+    # Time every response received in milliseconds, including retries
+    latencies = []
+    api.session.hooks['response'].append(lambda r, *args, **kwargs: latencies.append(round(r.elapsed.total_seconds() * 1000, 2)))
+
+    start = time.perf_counter()
+    records = WORKLOADS[name].run(api, size, workdir)
+    wall = time.perf_counter() - start
+
+    return {
+        'description': WORKLOADS[name].description,
+        'records': records,
+        'wall': round(wall, 3),
+        'requests': len(latencies),
+        'rps': round(len(latencies) / wall, 1) if wall else None,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'peakRss': peakRss()
+    }
+
+
+def runBenchmarks(names=None, scale=1.0, latency=0, settings=SETTINGS, echo=print):
+    """This function runs the selected workloads, each in its own worker process, and returns the results"""
+
+    results = {
+        'version': version(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'scale': scale,
+        'latency': latency,
+        'settings': settings,
+        'startup': measureStartup(),
+        'startupCommand': measureStartup(('jobs', 'start', '--help')),
+        'workloads': {}
+    }
+    echo(f'startup: { results["startup"] }s, jobs start: { results["startupCommand"] }s')
+
+    for name in names or WORKLOADS:
+        size = max(1, int(WORKLOADS[name].size * scale))
+        server = MockServer(data=WORKLOADS[name].data(size), latency=latency).start()
+        try:
+            worker = subprocess.run([sys.executable, '-m', 'idmc_cli.bench', name, server.url, str(size), json.dumps(settings)], capture_output=True, text=True)
+        finally:
+            server.stop()
+
+        if worker.returncode != 0:
+            results['workloads'][name] = { 'error': worker.stderr.strip().splitlines()[-1] if worker.stderr.strip() else f'exit code { worker.returncode }' }
+        else:
+            results['workloads'][name] = json.loads(worker.stdout.strip().splitlines()[-1])
+        echo(f'{ name }: { results["workloads"][name].get("wall", results["workloads"][name].get("error")) }')
+
+    return results
+
+
+def formatResults(results, baseline=None):
+    """This function formats the results as a table, with the change from a baseline run if given"""
+
+    columns = { 'wall': 'wall s', 'rps': 'req/s', 'p50': 'p50 ms', 'p95': 'p95 ms', 'p99': 'p99 ms', 'peakRss': 'peak rss MB' }
+    lines = [f'{ "workload":<20}{ "records":>10}{ "requests":>10}' + ''.join(f'{ label:>18}' for label in columns.values())]
+
+    for name, result in results['workloads'].items():
+        if 'error' in result:
+            lines.append(f'{ name:<20}  { result["error"] }')
+            continue
+
+        line = f'{ name:<20}{ result["records"]:>10}{ result["requests"]:>10}'
+        for column in columns:
+            value = result[column]
+            previous = ((baseline or {}).get('workloads', {}).get(name) or {}).get(column)
+            text = '-' if value is None else f'{ value:g}'
+            if value is not None and previous:
+                text += f' ({ (value - previous) / previous:+.0%})'
+            line += f'{ text:>18}'
+        lines.append(line)
+
+    startup = []
+    for key, label in [('startup', 'startup'), ('startupCommand', 'jobs start')]:
+        if results.get(key) is None:
+            continue
+        text = f'{ label } { results[key] }s'
+        if baseline and baseline.get(key):
+            text += f' ({ (results[key] - baseline[key]) / baseline[key]:+.0%})'
+        startup.append(text)
+    lines.append(', '.join(startup))
+
+    return '\n'.join(lines)
+
+
+def version():
+    try:
+        return metadata.version('idmc-cli')
+    except metadata.PackageNotFoundError:
+        return None
+
+
+if __name__ == '__main__':
+
+    # Worker process: python -m idmc_cli.bench <workload> <server url> <size> <settings>
+    print(json.dumps(runWorkload(sys.argv[1], sys.argv[2], int(sys.argv[3]), json.loads(sys.argv[4]))))
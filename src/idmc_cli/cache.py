@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from idmc_cli.config import CONFIG_DIR
+from idmc_cli.utils import FileLock, atomicWrite
+
+CACHE_FILE = CONFIG_DIR / 'cache.json'
+
+class ResolutionCache:
+    """
+    Cache of the records found when resolving names to IDs, e.g. roles by name or objects by path.
+
+    Records are kept per user and org and by kind, in memory and on disk so that they are
+    shared by every command run by the same user. Each record expires `ttl` seconds after it
+    was cached, and a ttl of 0 disables the cache. A miss in memory re-reads the disk before
+    the caller looks the name up, so records resolved by other processes are picked up.
+    """
+
+    def __init__(self, owner, ttl=3600, path=CACHE_FILE):
+        self.owner = owner
+        self.ttl = ttl
+        self.path = path
+        self.file_lock = FileLock(path.with_suffix('.lock'))
+        self.lock = threading.RLock()
+        self.entries = None
+
+    def read(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        """This function reads the latest cached records of this user and org"""
+
+        with self.lock:
+            self.entries = self.read().get(self.owner, {})
+
+    def get(self, kind, key):
+        """This function returns a cached record, or None if it is missing or has expired"""
+
+        if not self.ttl:
+            return None
+
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            entry = self.entries.get(kind, {}).get(key)
+
+            # Check whether another process has resolved it since
+            if entry is None or entry['expires'] < time.time():
+                self.load()
+                entry = self.entries.get(kind, {}).get(key)
+
+        if entry is None or entry['expires'] < time.time():
+            return None
+        return entry['value']
+
+    def getMany(self, kind, keys):
+        """This function returns a dict of the cached records of several keys, re-reading the disk at most once"""
+
+        if not self.ttl:
+            return {}
+
+        with self.lock:
+            if self.entries is None:
+                self.load()
+            now = time.time()
+            items = self.entries.get(kind, {})
+
+            # Check whether another process has resolved any of them since
+            if any(key not in items or items[key]['expires'] < now for key in keys):
+                self.load()
+                items = self.entries.get(kind, {})
+
+        return { key: items[key]['value'] for key in keys if key in items and items[key]['expires'] >= now }
+
+    def set(self, kind, records, ttl=None):
+        """This function caches a dict of records by key and shares them with other processes, optionally for longer than the default ttl"""
+
+        if not self.ttl or not records:
+            return
+
+        expires = time.time() + (ttl or self.ttl)
+        self.update(lambda entries: entries.setdefault(kind, {}).update({ key: { 'value': value, 'expires': expires } for key, value in records.items() }))
+
+    def invalidate(self, kind=None, key=None):
+        """This function removes a cached record, every record of a kind, or every record"""
+
+        def remove(entries):
+            if kind is None:
+                entries.clear()
+            elif key is None:
+                entries.pop(kind, None)
+            else:
+                entries.get(kind, {}).pop(key, None)
+
+        self.update(remove)
+
+    def update(self, change):
+        """This function applies a change to the latest cached records on disk, dropping any that have expired"""
+
+        with self.lock, self.file_lock:
+            data = self.read()
+            entries = data.get(self.owner, {})
+            change(entries)
+
+            now = time.time()
+            entries = { kind: { key: entry for key, entry in items.items() if entry['expires'] >= now } for kind, items in entries.items() }
+            entries = { kind: items for kind, items in entries.items() if items }
+            if entries:
+                data[self.owner] = entries
+            else:
+                data.pop(self.owner, None)
+
+            atomicWrite(self.path, json.dumps(data))
+            self.entries = entries
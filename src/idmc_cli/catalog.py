@@ -0,0 +1,146 @@
+import json
+import sqlite3
+import time
+from contextlib import closing
+from idmc_cli.config import CONFIG_DIR
+
+CATALOG_FILE = CONFIG_DIR / 'catalog.db'
+
+SCHEMA = [
+    'CREATE TABLE IF NOT EXISTS objects (owner TEXT NOT NULL, id TEXT NOT NULL, path TEXT, type TEXT, tags TEXT, updateTime TEXT, sourceControl TEXT, record TEXT NOT NULL, PRIMARY KEY (owner, id))',
+    'CREATE INDEX IF NOT EXISTS objects_path ON objects (owner, path)',
+    'CREATE TABLE IF NOT EXISTS syncs (owner TEXT PRIMARY KEY, lastSync TEXT, syncedAt REAL NOT NULL)'
+]
+
+
+class ObjectCatalog:
+    """
+    Local SQLite copy of the objects of an org, used to answer object lookups and wildcard
+    path searches without listing every object from IDMC.
+
+    Objects are kept per user and org together with the updateTime of the latest change
+    synced, so that later syncs only need to fetch the objects updated since. Incremental
+    syncs cannot see deleted objects, so a full sync replaces every object of the org.
+    """
+
+    def __init__(self, owner, path=CATALOG_FILE):
+        self.owner = owner
+        self.path = path
+
+    def connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        for statement in SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def lastSync(self):
+        """This function returns the updateTime of the latest change synced, or None if the catalog has never been synced"""
+
+        if not self.path.exists():
+            return None
+
+        with closing(self.connect()) as conn:
+            row = conn.execute('SELECT lastSync FROM syncs WHERE owner = ?', (self.owner,)).fetchone()
+        return row[0] if row else None
+
+    def synced(self):
+        """This function checks whether the catalog has been synced"""
+
+        if not self.path.exists():
+            return False
+
+        with closing(self.connect()) as conn:
+            return conn.execute('SELECT 1 FROM syncs WHERE owner = ?', (self.owner,)).fetchone() is not None
+
+    def sync(self, records, full=False, batchSize=1000):
+        """
+        This function stores an iterable of object records in a single transaction and
+        returns how many were stored. A full sync first removes every object of the org.
+        Nothing is kept if the records cannot all be read.
+        """
+
+        lastSync = None if full else self.lastSync()
+        count = 0
+
+        with closing(self.connect()) as conn, conn:
+            if full:
+                conn.execute('DELETE FROM objects WHERE owner = ?', (self.owner,))
+
+            batch = []
+            for record in records:
+                batch.append((self.owner, record['id'], record.get('path'), record.get('type'), json.dumps(record.get('tags') or []), record.get('updateTime'), json.dumps(record.get('sourceControl')), json.dumps(record)))
+                if record.get('updateTime') and (lastSync is None or record['updateTime'] > lastSync):
+                    lastSync = record['updateTime']
+                if len(batch) >= batchSize:
+                    conn.executemany('INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)', batch)
+                    count += len(batch)
+                    batch = []
+            conn.executemany('INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)', batch)
+            count += len(batch)
+
+            conn.execute('INSERT OR REPLACE INTO syncs VALUES (?, ?, ?)', (self.owner, lastSync, time.time()))
+
+        return count
+
+    def find(self, id=None, path=None, name=None, type=None, location=None):
+        """This function returns the objects matching every given filter, where path may contain * and ? wildcards"""
+
+        query = ['owner = ?']
+        params = [self.owner]
+        if id:
+            query.append('id = ?')
+            params.append(id)
+        if path:
+            query.append('path GLOB ?' if '*' in path or '?' in path else 'path = ?')
+            params.append(path)
+        if name:
+            query.append('(path = ? OR substr(path, ?) = ?)')
+            params.extend([name, -len(name) - 1, '/' + name])
+        if type:
+            query.append('type = ?')
+            params.append(type)
+        if location:
+
+            # Only the objects directly within the project or folder
+            location = str(location).rstrip('/') + '/'
+            query.append("substr(path, 1, ?) = ? AND instr(substr(path, ?), '/') = 0")
+            params.extend([len(location), location, len(location) + 1])
+
+        with closing(self.connect()) as conn:
+            rows = conn.execute(f'SELECT record FROM objects WHERE { " AND ".join(query) } ORDER BY path', params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def remove(self, id=None, path=None):
+        """This function removes an object by ID or path and everything within it, e.g. a deleted project or folder"""
+
+        if not self.path.exists():
+            return
+
+        with closing(self.connect()) as conn, conn:
+            if not path:
+                row = conn.execute('SELECT path FROM objects WHERE owner = ? AND id = ?', (self.owner, id)).fetchone()
+                if row is None:
+                    return
+                path = row[0]
+            conn.execute('DELETE FROM objects WHERE owner = ? AND (path = ? OR substr(path, 1, ?) = ?)', (self.owner, path, len(path) + 1, path + '/'))
+
+    def invalidate(self):
+        """This function makes the next sync a full sync, e.g. after a project or folder was renamed"""
+
+        if not self.path.exists():
+            return
+
+        with closing(self.connect()) as conn, conn:
+            conn.execute('UPDATE syncs SET lastSync = NULL WHERE owner = ?', (self.owner,))
+
+    def clear(self):
+        """This function removes every object of the org and its sync state"""
+
+        if not self.path.exists():
+            return
+
+        with closing(self.connect()) as conn, conn:
+            conn.execute('DELETE FROM objects WHERE owner = ?', (self.owner,))
+            conn.execute('DELETE FROM syncs WHERE owner = ?', (self.owner,))
@@ -0,0 +1,61 @@
+import click
+from idmc_cli.config import config
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import write_output, echo_output
+
+###################################
+# Admin commands section
+###################################
+
+@click.command('configure', help=i18n.getCommandHelp('configure'))
+def configure():
+    # Log out of current session
+    api.logout()
+
+    # Get the username
+    user = config.get("username")
+    user = input(f"Username [{ user }]: ") or user
+
+    # Get the password
+    password = config.get("password")
+    if password:
+        masked = '************' + password[-3:]
+    else:
+        masked = None
+    password = input(f"Password [{ masked }]: ") or password
+
+    # Get the pod
+    pod = config.get("pod")
+    pod = input(f"Pod (e.g. 'na1') [{ pod }]: ") or pod
+
+    # Get the region
+    region = config.get("region")
+    region = input(f"Region (e.g. 'dm-us') [{ region }]: ") or region
+
+    # Save them all at once
+    config.update({ "username": user, "password": password, "pod": pod, "region": region })
+
+
+
+@click.command('login', help=i18n.getCommandHelp('login'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def login(debug, output, pretty=0):
+    result = api.login(debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@click.command('logout', help=i18n.getCommandHelp('logout'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def logout(debug, output, pretty=0):
+    result = api.logout(debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
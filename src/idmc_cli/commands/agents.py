@@ -0,0 +1,346 @@
+import click
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, output_options, write_output, echo_output
+
+###################################
+# Secure agent commands section
+###################################
+
+@click.group('agents', help=i18n.getCommandHelp('agents'))
+def agents():
+    pass
+
+@agents.command('get', epilog=i18n.getHelpExample('agents', 'get'))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'get', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'get', 'name'))
+@click.option('--unassigned', '-u', 'unassigned', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agents', 'get', 'unassigned'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getAgents(id, name, unassigned, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets Secure Agents"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.getAgents(id=id, name=name, unassigned=unassigned, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@agents.command('delete', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'delete', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'delete', 'name'))
+@click.option('--unassigned', '-u', 'unassigned', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agents', 'delete', 'unassigned'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def deleteAgent(id, name, unassigned, debug, output, pretty=0):
+    """Deletes a secure agent"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.deleteAgent(id=id, name=name, unassigned=unassigned, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@agents.command('status', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'status', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agents', 'status', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getAgentStatus(id, name, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets Secure Agent Status"""
+
+    result = api.getAgentStatus(id=id, name=name, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@agents.group('service')
+def service():
+    """Secure Agent service management commands."""
+    pass
+
+@service.command('stop', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('services', 'stop', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('services', 'stop', 'name'))
+@click.option('--service', '-s', 'service', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('services', 'stop', 'service'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def stopService(id, name, service, debug, output, pretty=0):
+    """Stops a service on a secure agent"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.execAgentService(id=id, name=name, service=service, action='stop', debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@service.command('start', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('services', 'start', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('services', 'start', 'name'))
+@click.option('--service', '-s', 'service', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('services', 'start', 'service'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def startService(id, name, service, debug, output, pretty=0):
+    """Starts a service on a secure agent"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.execAgentService(id=id, name=name, service=service, action='start', debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+###################################
+# Secure agent group commands section
+###################################
+
+@agents.group('groups')
+def agentGroup():
+    """Secure Agent Group service management commands."""
+    pass
+
+@agentGroup.command('get', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'get', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'get', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getAgentGroups(id, name, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets Secure Agent Groups"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.getAgentGroups(id=id, name=name, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@agentGroup.command('create', epilog=i18n.getHelpExample('common', None))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'create', 'name'))
+@click.option('--shared', '-s', 'shared', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'create', 'shared'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def createAgentGroup(name, shared, debug, output, pretty=0):
+    """Creates a secure agent group"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.createAgentGroup(name=name, shared=shared, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@agentGroup.command('add-agent', epilog=i18n.getHelpExample('common', None))
+@click.option('--group-id', '-gi', 'group_id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'add', 'group_id'))
+@click.option('--group-name', '-gn', 'group_name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'add', 'group_name'))
+@click.option('--agent-id', '-ai', 'agent_id', multiple=True, default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'add', 'agent_id'))
+@click.option('--agent-name', '-an', 'agent_name', multiple=True, default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'add', 'agent_name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def addAgent(group_id, group_name, agent_id, agent_name, debug, output, pretty=0):
+    """Add one or more agents to a secure agent group"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if group_id is None and group_name is None:
+        raise click.BadParameter(i18n.getErrorText('agentGroup', 'add', 'groupid-groupname-missing'))
+    if len(agent_id) == 0 and len(agent_name) == 0:
+        raise click.BadParameter(i18n.getErrorText('agentGroup', 'add', 'agentid-agentname-missing'))
+
+    result = api.addAgent(groupId=group_id, groupName=group_name, agentId=agent_id, agentName=agent_name, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@agentGroup.command('delete', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'delete', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'delete', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def deleteAgentGroup(id, name, debug, output, pretty=0):
+    """Deletes a secure agent group"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.deleteAgentGroup(id=id, name=name, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@agentGroup.group('components')
+def components():
+    """Secure Agent Group component management commands."""
+    pass
+
+@components.command('get', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-components', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-components', 'name'))
+@click.option('--include-all', '-a', 'include_all', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'list-components', 'include_all'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getAgentGroupComponents(id, name, include_all, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets Secure Agent Group components"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.getAgentGroupComponents(id=id, name=name, includeAll=include_all, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@components.command('update', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-components', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-components', 'name'))
+@click.option('--enable', '-e', 'enable', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'update-components', 'enable'))
+@click.option('--disable', '-d', 'disable', flag_value=False, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'update-components', 'disable'))
+@click.option('--services', '-s', 'services', multiple=True, default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-components', 'services'))
+@click.option('--connectors', '-c', 'connectors', multiple=True, default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-components', 'connectors'))
+@click.option('--additional', '-a', 'additional', multiple=True, default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-components', 'additional'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def updateAgentGroupComponents(id, name, enable, disable, services, connectors, additional, debug, output, pretty=0):
+    """Can be used to enable or disable Secure Agent Group components"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+    
+    if enable is None and disable is None:
+        raise click.BadParameter(i18n.getErrorText('agentGroup', 'update-components', 'enable-disable-missing'))
+    
+    if len(services) == 0 and len(connectors) == 0 and len(additional) == 0:
+        raise click.BadParameter(i18n.getErrorText('agentGroup', 'update-components', 'services-connectors-additional-missing'))
+    
+    if disable:
+        enable=disable
+    
+    try:
+
+        result = api.updateAgentGroupComponents(id=id, name=name, enable=enable, services=services, connectors=connectors, additional=additional, debug=debug)
+        if output:
+            write_output(output, pretty, result)
+        else:
+            echo_output(pretty, result)
+    except Exception as e:
+        raise click.ClickException(e)
+
+@agentGroup.group('properties')
+def properties():
+    """Secure Agent Group property management commands."""
+    pass
+
+@properties.command('get', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'name'))
+@click.option('--service', '-s', 'service', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'service'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'type'))
+@click.option('--property', '-k', 'property', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'property'))
+@click.option('--overridden', '-o', 'overridden', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'list-props', 'overridden'))
+@click.option('--platform', '-p', 'platform', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'list-props', 'platform'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getAgentGroupProps(id, name, overridden, platform, service, type, property, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets Secure Agent Group properties"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.getAgentGroupProps(id=id, name=name, overridden=overridden, platform=platform, service=service, type=type, property=property, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@properties.command('update', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'name'))
+@click.option('--service', '-s', 'service', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'service'))
+@click.option('--type', '-t', 'type', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'type'))
+@click.option('--property', '-k', 'property', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'property'))
+@click.option('--value', '-v', 'value', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'value'))
+@click.option('--platform', '-p', 'platform', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'update-prop', 'platform'))
+@click.option('--custom', '-c', 'custom', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'update-prop', 'custom'))
+@click.option('--sensitive', '-S', 'sensitive', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('agentGroup', 'update-prop', 'sensitive'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def updateAgentGroupProps(id, name, service, type, property, value, platform, custom, sensitive, debug, output, pretty=0):
+    """Updates Secure Agent Group properties"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.updateAgentGroupProps(id=id, name=name, service=service, type=type, property=property, value=value, platform=platform, custom=custom, sensitive=sensitive, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@properties.command('delete', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'delete-props', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('agentGroup', 'delete-props', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def deleteAgentGroupProps(id, name, debug, output, pretty=0):
+    """Deletes Secure Agent Group properties"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and name is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-name-missing'))
+
+    result = api.deleteAgentGroupProps(id=id, name=name, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
@@ -0,0 +1,32 @@
+import click
+import json
+from idmc_cli.i18n import i18n
+
+###################################
+# Benchmark commands section
+###################################
+
+@click.command('bench', help=i18n.getCommandHelp('bench'), epilog=i18n.getHelpExample('bench', None))
+@click.option('--workloads', '-w', 'workloads', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('bench', None, 'workloads'))
+@click.option('--scale', '-s', 'scale', default=1.0, required=False, type=click.FLOAT, help=i18n.getHelpOption('bench', None, 'scale'))
+@click.option('--latency', '-l', 'latency', default=0.0, required=False, type=click.FLOAT, help=i18n.getHelpOption('bench', None, 'latency'))
+@click.option('--compare', '-c', 'compare', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('bench', None, 'compare'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('bench', None, 'output'))
+def bench(workloads, scale, latency, compare, output):
+    from idmc_cli.bench import WORKLOADS, runBenchmarks, formatResults
+
+    if workloads:
+        workloads = workloads.split(',')
+        if any(name not in WORKLOADS for name in workloads):
+            raise click.BadParameter(i18n.getErrorText('bench', None, 'bad-workload') + ' ' + ', '.join(WORKLOADS))
+
+    baseline = None
+    if compare:
+        with open(compare, 'r') as file:
+            baseline = json.load(file)
+
+    result = runBenchmarks(names=workloads, scale=scale, latency=latency, echo=lambda text: click.echo(text, err=True))
+    if output:
+        with open(output, 'w', encoding='utf-8') as file:
+            json.dump(result, file, indent=4)
+    click.echo(formatResults(result, baseline))
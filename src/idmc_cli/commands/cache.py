@@ -0,0 +1,20 @@
+import click
+import json
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+
+###################################
+# Cache commands section
+###################################
+
+@click.group('cache', help=i18n.getCommandHelp('cache'))
+def cache():
+    pass
+
+@cache.command('clear', epilog=i18n.getHelpExample('cache', 'clear'))
+@click.option('--kind', '-k', 'kind', default=None, required=False, type=click.Choice(['user', 'role', 'roleId', 'userGroup', 'userGroupId', 'privilege', 'privilegeId', 'agent', 'agentGroup', 'object', 'org']), help=i18n.getHelpOption('cache', 'clear', 'kind'))
+def clearCache(kind):
+    """Clears the cached IDs of names"""
+
+    api.cache.invalidate(kind)
+    click.echo(json.dumps({ 'message': 'Cache cleared' }))
@@ -0,0 +1,30 @@
+import click
+import json
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import echo_output
+
+###################################
+# Catalog commands section
+###################################
+
+@click.group('catalog', help=i18n.getCommandHelp('catalog'))
+def catalog():
+    pass
+
+@catalog.command('sync', epilog=i18n.getHelpExample('catalog', 'sync'))
+@click.option('--full', '-f', 'full', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('catalog', 'sync', 'full'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+def syncCatalog(full, debug, pretty=0):
+    """Syncs the local object catalog used for object lookups"""
+
+    result = api.syncCatalog(full=full, debug=debug)
+    echo_output(pretty, result)
+
+@catalog.command('clear', epilog=i18n.getHelpExample('catalog', 'clear'))
+def clearCatalog():
+    """Clears the local object catalog"""
+
+    api.catalog.clear()
+    click.echo(json.dumps({ 'message': 'Catalog cleared' }))
@@ -0,0 +1,99 @@
+import click
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, output_options, write_output, echo_output
+
+###################################
+# Jobs commands section
+###################################
+
+@click.group('jobs', help=i18n.getCommandHelp('jobs'))
+def jobs():
+    pass
+
+@jobs.group('exp')
+def jobsExp():
+    """WARNING: Experimental unsupported job management commands."""
+    pass
+
+@jobsExp.command('get', epilog=i18n.getHelpExample('jobs', 'get'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'name'))
+@click.option('--status', '-s', 'status', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'status'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'type'))
+@click.option('--order-by', '-o', 'order_by', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'order-by'))
+@click.option('--location', '-l', 'location', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'location'))
+@click.option('--error', '-e', 'error_msg', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'error-msg'))
+@click.option('--runtime', '-r', 'runtime', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'runtime'))
+@click.option('--start-since', '-ss', 'start_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'start-since'))
+@click.option('--start-until', '-su', 'start_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'start-until'))
+@click.option('--end-since', '-es', 'end_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'end-since'))
+@click.option('--end-until', '-eu', 'end_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'get', 'end-until'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getJobs(name, start_since, start_until, end_since, end_until, status, type, order_by, error_msg, location, runtime, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Get job details from the monitor"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.iterMonitorJobs(type=type, name=name, status=status, errorMsg=error_msg, location=location, startSince=start_since, startUntil=start_until, endSince=end_since, endUntil=end_until, runtime=runtime, orderBy=order_by, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@jobs.command('start', epilog=i18n.getHelpExample('jobs', 'start'))
+@click.option('--ids', '-i', 'ids', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'ids'))
+@click.option('--paths', '-p', 'paths', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'paths'))
+@click.option('--type', '-t', 'type', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'type'))
+@click.option('--callback', '-c', 'callback_url', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'callback'))
+@click.option('--param-file', '-f', 'param_file', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'param-file'))
+@click.option('--param-dir', '-d', 'param_dir', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'param-dir'))
+@click.option('--api-names', '-a', 'api_names', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'start', 'api-names'))
+@click.option('--wait', '-w', 'wait', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('jobs', 'start', 'wait'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('jobs', 'start', 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def startJobs(ids, paths, type, callback_url, param_file, param_dir, api_names, wait, poll_delay, debug, output, pretty=0):
+    """Starts a job"""
+    
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    # Validate the options
+    if ids is None and paths is None and type != 'TASKFLOW':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-path-type-missing'))
+    if (param_file and param_dir is None) or (param_file is None and param_dir):
+        raise click.BadParameter(i18n.getErrorText('jobs', 'start', 'param-file-dir-missing'))
+    if type == 'TASKFLOW' and api_names is None:
+        raise click.BadParameter(i18n.getErrorText('jobs', 'start', 'api-name-missing'))
+    
+    if type in ['DMASK', 'DRS', 'DSS', 'MTT', 'PCS', 'WORKFLOW', 'TASKFLOW']:
+
+        result = api.startCdiJobs(ids=ids, paths=paths, type=type, callbackUrl=callback_url, paramFile=param_file, paramDir=param_dir, apiNames=api_names, wait=wait, pollDelay=poll_delay, debug=debug)
+        if output:
+            write_output(output, pretty, result)
+        else:
+            echo_output(pretty, result)
+
+@jobs.command('stop', epilog=i18n.getHelpExample('jobs', 'stop'))
+@click.option('--ids', '-i', 'ids', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'stop', 'ids'))
+@click.option('--names', '-n', 'names', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'stop', 'names'))
+@click.option('--locations', '-l', 'locations', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'stop', 'locations'))
+@click.option('--types', '-t', 'types', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('jobs', 'stop', 'types'))
+@click.option('--clean', '-c', 'clean', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('jobs', 'stop', 'clean'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def stopJobs(ids, names, locations, types, clean, debug, output, pretty=0):
+    """Stops running jobs"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.stopCdiJobs(ids=ids, names=names, locations=locations, types=types, clean=clean, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
@@ -0,0 +1,86 @@
+import click
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, output_options, write_output, echo_output
+
+###################################
+# Log commands section
+###################################
+
+@click.group('logs', help=i18n.getCommandHelp('logs'))
+def logs():
+    pass
+
+@logs.command('security', epilog=i18n.getHelpExample('common', None))
+@click.option('--category', '-c', 'category', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'security', 'category'))
+@click.option('--actor', '-a', 'actor', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'security', 'actor'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'security', 'name'))
+@click.option('--from', '-f', 'time_from', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'security', 'time_from'))
+@click.option('--to', '-t', 'time_to', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'security', 'time_to'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getSecurityLogs(category, actor, name, time_from, time_to, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets the security logs"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.iterSecurityLogs(category=category, actor=actor, name=name, time_from=time_from, time_to=time_to, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@logs.group('activity')
+def logsActivity():
+    """Activity log commands."""
+    pass
+
+@logsActivity.command('completed', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'completed-activity', 'id'))
+@click.option('--run-id', '-r', 'run_id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'completed-activity', 'run-id'))
+@click.option('--task-id', '-t', 'task_id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'completed-activity', 'task-id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'completed-activity', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getCompletedActivityJobs(id, run_id, task_id, name, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets the completed activity logs"""
+    
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if run_id and task_id is None:
+        raise click.BadParameter(i18n.getErrorText('logs', 'completed-activity', 'task-id-missing'))
+
+    result = api.iterCompletedActivityJobs(id=id, runId=run_id, taskId=task_id, taskName=name, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@logsActivity.command('running', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'running-activity', 'id'))
+@click.option('--run-id', '-r', 'run_id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'running-activity', 'run-id'))
+@click.option('--task-id', '-t', 'task_id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'running-activity', 'task-id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('logs', 'running-activity', 'name'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getRunningActivityJobs(id, run_id, task_id, name, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets the running activity logs"""
+    
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if run_id and task_id is None:
+        raise click.BadParameter(i18n.getErrorText('logs', 'running-activity', 'task-id-missing'))
+
+    result = api.getRunningActivityJobs(id=id, runId=run_id, taskId=task_id, taskName=name, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
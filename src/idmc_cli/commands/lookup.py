@@ -0,0 +1,53 @@
+import click
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, output_options, write_output, echo_output
+
+###################################
+# Lookup commands section
+###################################
+
+@click.group('lookup', help=i18n.getCommandHelp('lookup'))
+def lookup():
+    pass
+
+@lookup.command('object', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('lookup', 'object', 'id'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('lookup', 'object', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('lookup', 'object', 'type'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def lookupObject(id, path, type, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Lookup a single object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('lookup', 'object', 'id-path-type-missing'))
+    elif id is None and ( path is None or type is None ):
+        raise click.BadParameter(i18n.getErrorText('lookup', 'object', 'path-type-missing'))
+    
+    result = api.lookupObject(id=id, path=path, type=type, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@lookup.command('objects', epilog=i18n.getHelpExample('common', None))
+@click.option('--body', '-b', 'body', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('lookup', 'objects', 'body'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def lookupObjects(body, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Lookup multiple objects"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.lookupObjects(body=body, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
@@ -0,0 +1,108 @@
+import click
+from pathlib import Path
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+
+###################################
+# Metering commands section
+###################################
+
+@click.group('metering', help=i18n.getCommandHelp('metering'))
+def metering():
+    pass
+
+@metering.command('summary', epilog=i18n.getHelpExample('common', None))
+@click.option('--start', '-s', 'start', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'start'))
+@click.option('--end', '-e', 'end', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'end'))
+@click.option('--linked', '-l', 'linked', flag_value='TRUE', required=False, type=click.STRING, is_flag=True, help=i18n.getHelpOption('metering', None, 'linked'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('metering', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'output'))
+def getMeteringSummary(start, end, linked, poll_delay, debug, output, pretty=0):
+    """Used to get a metering summary report"""
+    
+    if output and Path(output).suffix != '.zip':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    if not linked:
+        linked = 'FALSE'
+    
+    result = api.runMetering(type='SUMMARY', startDate=start, endDate=end, linked=linked, pollDelay=poll_delay, debug=debug)
+    if output:
+        with open(output, 'wb') as file:
+            file.write(result)
+    else:
+        click.echo(result)
+
+@metering.command('project', epilog=i18n.getHelpExample('common', None))
+@click.option('--start', '-s', 'start', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'start'))
+@click.option('--end', '-e', 'end', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'end'))
+@click.option('--linked', '-l', 'linked', flag_value='TRUE', required=False, type=click.STRING, is_flag=True, help=i18n.getHelpOption('metering', None, 'linked'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('metering', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'output'))
+def getMeteringProject(start, end, linked, poll_delay, debug, output, pretty=0):
+    """Used to get a metering project report"""
+    
+    if output and Path(output).suffix != '.zip':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    if not linked:
+        linked = 'FALSE'
+    
+    result = api.runMetering(type='PROJECT_FOLDER', startDate=start, endDate=end, linked=linked, pollDelay=poll_delay, debug=debug)
+    if output:
+        with open(output, 'wb') as file:
+            file.write(result)
+    else:
+        click.echo(result)
+
+@metering.command('asset', epilog=i18n.getHelpExample('common', None))
+@click.option('--start', '-s', 'start', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'start'))
+@click.option('--end', '-e', 'end', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'end'))
+@click.option('--linked', '-l', 'linked', flag_value='TRUE', required=False, type=click.STRING, is_flag=True, help=i18n.getHelpOption('metering', None, 'linked'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('metering', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'output'))
+def getMeteringProject(start, end, linked, poll_delay, debug, output, pretty=0):
+    """Used to get a metering asset report"""
+    
+    if output and Path(output).suffix != '.zip':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    if not linked:
+        linked = 'FALSE'
+    
+    result = api.runMetering(type='ASSET', startDate=start, endDate=end, linked=linked, pollDelay=poll_delay, debug=debug)
+    if output:
+        with open(output, 'wb') as file:
+            file.write(result)
+    else:
+        click.echo(result)
+
+@metering.command('job', epilog=i18n.getHelpExample('common', None))
+@click.option('--start', '-s', 'start', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'start'))
+@click.option('--end', '-e', 'end', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'end'))
+@click.option('--linked', '-l', 'linked', flag_value='TRUE', required=False, type=click.STRING, is_flag=True, help=i18n.getHelpOption('metering', None, 'linked'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('metering', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('metering', None, 'output'))
+def getMeteringProject(start, end, linked, poll_delay, debug, output, pretty=0):
+    """Used to get a metering job level report"""
+    
+    if output and Path(output).suffix != '.zip':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    if not linked:
+        linked = 'FALSE'
+    
+    result = api.runMetering(type='JOB', startDate=start, endDate=end, linked=linked, pollDelay=poll_delay, debug=debug)
+    if output:
+        with open(output, 'wb') as file:
+            file.write(result)
+    else:
+        click.echo(result)
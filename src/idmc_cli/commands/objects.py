@@ -0,0 +1,261 @@
+import click
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, output_options, write_output, echo_output
+
+###################################
+# Object commands section
+###################################
+
+@click.group('objects', help=i18n.getCommandHelp('objects'))
+def objects():
+    pass
+
+@objects.command('get', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'get', 'id'))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'get', 'name'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'get', 'type'))
+@click.option('--location', '-l', 'location', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'location'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getObjects(id, name, type, location, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Used to get objects"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.getObjects(id=id, name=name, type=type, location=location, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@objects.command('query', epilog=i18n.getHelpExample('common', None))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'type'))
+@click.option('--location', '-l', 'location', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'location'))
+@click.option('--tag', '-T', 'tag', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'tag'))
+@click.option('--checked-out-by', '-co', 'checked_out_by', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-out-by'))
+@click.option('--checked-out-since', '-cos', 'checked_out_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-out-since'))
+@click.option('--checked-out-until', '-cou', 'checked_out_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-out-until'))
+@click.option('--checked-in-by', '-ci', 'checked_in_by', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-in-by'))
+@click.option('--checked-in-since', '-cis', 'checked_in_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-in-since'))
+@click.option('--checked-in-until', '-ciu', 'checked_in_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'checked-in-until'))
+@click.option('--source-ctrld', '-s', 'source_cntrld', default=None, required=False, type=click.BOOL, help=i18n.getHelpOption('objects', 'query', 'source-ctrld'))
+@click.option('--hash', '-h', 'hash', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'hash'))
+@click.option('--published-by', '-p', 'published_by', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'published-by'))
+@click.option('--published-since', '-ps', 'published_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'published-since'))
+@click.option('--published-until', '-pu', 'published_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'published-until'))
+@click.option('--updated-by', '-u', 'updated_by', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'updated-by'))
+@click.option('--updated-since', '-us', 'updated_since', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'updated-since'))
+@click.option('--updated-until', '-uu', 'updated_until', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'query', 'updated-until'))
+
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def queryObjects(type, location, tag, checked_out_by, checked_out_since, checked_out_until, checked_in_by, checked_in_since, checked_in_until, source_cntrld, hash, published_by, published_since, published_until, updated_by, updated_since, updated_until, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Used to query objects"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.iterObjects(type=type, location=location, tag=tag, hash=hash, checkedOutBy=checked_out_by, checkedOutSince=checked_out_since, checkedOutUntil=checked_out_until, checkedInBy=checked_in_by, checkedInSince=checked_in_since, checkedInUntil=checked_in_until, sourceCtrld=source_cntrld, publishedBy=published_by, publishedSince=published_since, publishedUntil=published_until, updatedBy=updated_by, updatedSince=updated_since, updatedUntil=updated_until, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@objects.command('dependencies', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'dependencies', 'id'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'dependencies', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'dependencies', 'type'))
+@click.option('--ref-type', '-r', 'ref_type', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('objects', 'dependencies', 'ref_type'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getDependencies(id, path, type, ref_type, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Returns dependencies for an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and ( path is None or type is None ):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'path-type-missing'))
+
+    result = api.iterDependencies(id=id, path=path, type=type, refType=ref_type, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+@objects.command('add-tags', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'add-tags', 'id'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'add-tags', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'add-tags', 'type'))
+@click.option('--body', '-b', 'body', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'add-tags', 'body'))
+@click.option('--tags', '-T', 'tags', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'add-tags', 'tags'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def tagObject(id, path, type, body, tags, debug, output, pretty=0):
+    """Adds one or more tags to an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if body is None and id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('objects', 'add-tags', 'body-id-path-type-missing'))
+    elif body is None and id is None and ( path is None or type is None ):
+        raise click.BadParameter(i18n.getErrorText('objects', 'add-tags', 'path-type-missing'))
+    
+    if body:
+         result = api.tagObjects(body=body, debug=debug)
+    else:
+        result = api.tagObject(id=id, path=path, type=type, tags=tags, debug=debug)
+
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+
+@objects.command('remove-tags', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'remove-tags', 'id'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'remove-tags', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'remove-tags', 'type'))
+@click.option('--body', '-b', 'body', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'remove-tags', 'body'))
+@click.option('--tags', '-T', 'tags', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('objects', 'remove-tags', 'tags'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def tagObject(id, path, type, body, tags, debug, output, pretty=0):
+    """Removes one or more tags from an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if body is None and id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('objects', 'remove-tags', 'body-id-path-type-missing'))
+    elif body is None and id is None and ( path is None or type is None ):
+        raise click.BadParameter(i18n.getErrorText('objects', 'remove-tags', 'path-type-missing'))
+    
+    if body:
+        result = api.untagObjects(body=body, debug=debug)
+    else:
+        result = api.untagObject(id=id, path=path, type=type, tags=tags, debug=debug)
+
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@objects.group('permissions')
+def permissions():
+    """Permission management commands."""
+    pass
+
+@permissions.command('get', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'get', 'id'))
+@click.option('--acl', '-a', 'acl', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'get', 'acl'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'get', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'get', 'type'))
+@click.option('--check-access', '-c', 'check_access', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'get', 'check_access'))
+@click.option('--check-type', '-ct', 'check_type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'get', 'check_type'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+@output_options
+def getPermissions(id, acl, path, type, check_access, check_type, debug, output, ndjson, compression, row_group_size, unnest, pretty=0):
+    """Gets permission ACL's for an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-path-type-missing'))
+    if check_type is not None and check_access == False:
+        check_access = True
+
+    result = api.getPermissions(id=id, acl=acl, path=path, type=type, checkAccess=check_access, checkType=check_type, debug=debug)
+    if output:
+        write_output(output, pretty, result, compression=compression, row_group_size=row_group_size, unnest=unnest)
+    else:
+        echo_output(pretty, result, ndjson=ndjson)
+
+
+@permissions.command('create', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'create', 'id'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'create', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'create', 'type'))
+@click.option('--ptype', '-pt', 'ptype', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('permissions', 'create', 'ptype'))
+@click.option('--pname', '-pn', 'pname', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('permissions', 'create', 'pname'))
+@click.option('--read', '-r', 'read', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'create', 'read'))
+@click.option('--update', '-u', 'update', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'create', 'update'))
+@click.option('--delete', '-d', 'delete', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'create', 'delete'))
+@click.option('--execute', '-e', 'execute', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'create', 'execute'))
+@click.option('--change', '-c', 'change', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'create', 'change'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def createPermission(id, path, type, ptype, pname, read, update, delete, execute, change, debug, output, pretty=0):
+    """Creates a permission ACL for an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-path-type-missing'))
+
+    result = api.createPermission(id=id, path=path, type=type, ptype=ptype, pname=pname, read=read, update=update, delete=delete, execute=execute, change=change, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+@permissions.command('update', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'id'))
+@click.option('--acl', '-a', 'acl', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'acl'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'type'))
+@click.option('--ptype', '-pt', 'ptype', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'ptype'))
+@click.option('--pname', '-pn', 'pname', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('permissions', 'update', 'pname'))
+@click.option('--read', '-r', 'read', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'update', 'read'))
+@click.option('--update', '-u', 'update', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'update', 'update'))
+@click.option('--delete', '-d', 'delete', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'update', 'delete'))
+@click.option('--execute', '-e', 'execute', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'update', 'execute'))
+@click.option('--change', '-c', 'change', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('permissions', 'update', 'change'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def updatePermission(id, acl, path, type, ptype, pname, read, update, delete, execute, change, debug, output, pretty=0):
+    """Updates a permission ACL for an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-path-type-missing'))
+
+    result = api.updatePermission(id=id, acl=acl, path=path, type=type, ptype=ptype, pname=pname, read=read, update=update, delete=delete, execute=execute, change=change, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
+
+
+@permissions.command('delete', epilog=i18n.getHelpExample('common', None))
+@click.option('--id', '-i', 'id', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'delete', 'id'))
+@click.option('--acl', '-a', 'acl', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'delete', 'acl'))
+@click.option('--path', '-p', 'path', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'delete', 'path'))
+@click.option('--type', '-t', 'type', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('permissions', 'delete', 'type'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def deletePermissions(id, acl, path, type, debug, output, pretty=0):
+    """Deletes permission ACL's for an object"""
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+    
+    if id is None and path is None and type is None:
+        raise click.BadParameter(i18n.getErrorText('common', None, 'id-path-type-missing'))
+
+    result = api.deletePermissions(id=id, acl=acl, path=path, type=type, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
@@ -0,0 +1,49 @@
+import click
+from pathlib import Path
+from idmc_cli.i18n import i18n
+from idmc_cli.api import api
+from idmc_cli.cli import valid_output, write_output, echo_output
+
+###################################
+# Export / Import commands section
+###################################
+
+@click.command('export', help=i18n.getCommandHelp('export'), epilog=i18n.getHelpExample('common', None))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('export', None, 'name'))
+@click.option('--ids', '-i', 'ids', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('export', None, 'ids'))
+@click.option('--paths', '-p', 'paths', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('export', None, 'paths'))
+@click.option('--types', '-t', 'types', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('export', None, 'types'))
+@click.option('--include-dependencies', '-d', 'dependencies', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('export', None, 'dependencies'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('export', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('export', None, 'output'))
+def exportObjects(name, ids, paths, types, dependencies, poll_delay, debug, output, pretty=0):
+    
+    if output and Path(output).suffix != '.zip':
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.runExport(ids=ids, name=name, paths=paths, types=types, dependencies=dependencies, pollDelay=poll_delay, debug=debug)
+    if output:
+        with open(output, 'wb') as file:
+            file.write(result)
+    else:
+        click.echo(result)
+
+@click.command('import', help=i18n.getCommandHelp('import'), epilog=i18n.getHelpExample('common', None))
+@click.option('--name', '-n', 'name', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('import', None, 'name'))
+@click.option('--path', '-p', 'path', default=None, required=True, type=click.STRING, help=i18n.getHelpOption('import', None, 'path'))
+@click.option('--poll-delay', '-pd', 'poll_delay', default=3, required=False, type=click.INT, help=i18n.getHelpOption('import', None, 'poll-delay'))
+@click.option('--debug', '-D', 'debug', flag_value=True, required=False, type=click.BOOL, is_flag=True, help=i18n.getHelpOption('common', None, 'debug'))
+@click.option('--pretty', '-P', 'pretty', flag_value=4, required=False, type=click.INT, is_flag=True, help=i18n.getHelpOption('common', None, 'pretty'))
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING, help=i18n.getHelpOption('common', None, 'output'))
+def importObjects(name, path, poll_delay, debug, output, pretty=0):
+    
+    if output and not valid_output(output):
+        raise click.BadParameter(i18n.getErrorText('common', None, 'bad-file-type'))
+
+    result = api.runImport(path=path, name=name, pollDelay=poll_delay, debug=debug)
+    if output:
+        write_output(output, pretty, result)
+    else:
+        echo_output(pretty, result)
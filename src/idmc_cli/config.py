@@ -1,10 +1,11 @@
 # src/informatica_cli/config.py
 import json
 from pathlib import Path
-from cryptography.fernet import Fernet
+from idmc_cli.utils import FileLock, atomicWrite
 
 CONFIG_DIR = Path.home() / '.idmc-cli'
 CONFIG_FILE = CONFIG_DIR / 'config.json'
+CONFIG_LOCK = CONFIG_DIR / 'config.lock'
 
 DEFAULT_CONFIG = {
     "pod": None,
@@ -12,62 +13,107 @@ DEFAULT_CONFIG = {
     "username": None,
     "password": None,
     "key": None,
-    "sessionId": None,
     "maxAttempts": 5,
-    "pageSize": 100
+    "pageSize": 100,
+    "poolSize": 10,
+    "pageWindow": 4,
+    "lookupBatchSize": 100,
+    "sessionTimeout": 1800,
+    "cacheTtl": 3600,
+    "orgTtl": 86400,
+    "loginUrl": None,
+    "baseUrl": None
 }
 
 class Config:
-    def __init__(self):
-        self.config_path = CONFIG_FILE
-        self.data = {}
-        self.load()
+    """
+    Settings of the CLI, read from the config file on first use.
+
+    The password is stored encrypted and only decrypted when it is read. Changes are written
+    under a lock to a copy of the latest file that then replaces it, so that concurrent
+    processes neither see a partial file nor lose each other's changes.
+    """
+
+    def __init__(self, path=CONFIG_FILE):
+        self.config_path = path
+        self.lock_path = path.with_name(CONFIG_LOCK.name)
+        self._data = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self.load()
+        return self._data
 
     def load(self):
         if not self.config_path.exists():
-            self.data = DEFAULT_CONFIG.copy()
-            
+            with FileLock(self.lock_path):
+                self._create()
+
+        self._read()
+
+    def _create(self):
+        """This function creates the config file with the default settings if it is missing, and must be called holding the lock"""
+
+        # Another process may have created it while waiting for the lock
+        if not self.config_path.exists():
+            from cryptography.fernet import Fernet
+
+            data = DEFAULT_CONFIG.copy()
+
             # Generate the once off key for encryption and decryption
-            self.data['key'] = Fernet.generate_key().decode('utf-8')
-            
-            self.save()
-        else:
-            with open(self.config_path, 'r') as f:
-                self.data = json.load(f)
+            data['key'] = Fernet.generate_key().decode('utf-8')
+
+            atomicWrite(self.config_path, json.dumps(data, indent=4))
+
+    def _read(self):
+        with open(self.config_path, 'r') as f:
+            self._data = json.load(f)
 
     def save(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, 'w') as f:
-            json.dump(self.data, f, indent=4)
+        self.update({})
 
     def get(self, key, default=None):
         
         # If returning the password, first decrypt it using the key
         if key == 'password':
-            cipher_key = self.data.get('key').encode('utf-8')
-            cipher_suite = Fernet(cipher_key)
             encrypted = self.data.get(key, '')
             if encrypted:
-                return cipher_suite.decrypt(self.data.get(key, '')).decode('utf-8')
+                from cryptography.fernet import Fernet
+                cipher_suite = Fernet(self.data.get('key').encode('utf-8'))
+                return cipher_suite.decrypt(encrypted).decode('utf-8')
             else:
                 return encrypted
         else:
             return self.data.get(key, default)
 
     def set(self, key, value):
-        
-        # If setting the password, encrypt it using the key
-        if key == 'password':
-            if value:
-                cipher_key = self.data.get('key', '')
-                cipher_suite = Fernet(cipher_key)
-                self.data[key] = cipher_suite.encrypt(value.encode('utf-8')).decode('utf-8')
-            else:
-                self.data[key] = None
-        else:
-            self.data[key] = value
-        
-        self.save()
+        self.update({ key: value })
+
+    def update(self, values):
+        """This function changes several settings with a single write of the config file"""
+
+        with FileLock(self.lock_path):
+
+            # Apply the changes to the latest settings saved by any process
+            self._create()
+            self._read()
+            data = dict(self._data)
+            for key, value in values.items():
+                
+                # If setting the password, encrypt it using the key
+                if key == 'password':
+                    if value:
+                        from cryptography.fernet import Fernet
+                        cipher_suite = Fernet(data.get('key', ''))
+                        data[key] = cipher_suite.encrypt(value.encode('utf-8')).decode('utf-8')
+                    else:
+                        data[key] = None
+                else:
+                    data[key] = value
+
+            atomicWrite(self.config_path, json.dumps(data, indent=4))
+            self._data = data
 
 # Expose the class as a variable
-config = Config()
\ No newline at end of file
+config = Config()
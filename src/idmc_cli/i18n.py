@@ -1,56 +1,139 @@
-import yaml
+import hashlib
+import marshal
 import sys
 from pathlib import Path
+from idmc_cli.config import CONFIG_DIR
+from idmc_cli.utils import atomicWrite
 
 CLASS_PATH = Path(__file__)
 I18N_PATH = 'config/i18n.yaml'
+COMPILED_PATH = 'config/i18n.marshal'
+CACHE_FILE = CONFIG_DIR / 'i18n.marshal'
 
 class I18n:
+    """
+    Help text of the CLI, read from config/i18n.yaml on first use.
+
+    Parsing the YAML is slow compared with the commands that need it, so the parsed text is
+    kept in a compiled catalog, either shipped next to the YAML (see compile) or cached in
+    the config directory. A catalog is only used while the YAML it was compiled from is
+    unchanged, unless the YAML itself was not shipped.
+    """
+
     def __init__(self):
-        
+
         if hasattr(sys, '_MEIPASS'):
             # Running from a onefile PyInstaller bundle
-            relative_path = Path(I18N_PATH)
             base_path = Path(sys._MEIPASS)
-            self.i18n_path = base_path / relative_path
         else:
             # Running from source
-            self.i18n_path = CLASS_PATH.parent / I18N_PATH
+            base_path = CLASS_PATH.parent
+
+        self.i18n_path = base_path / I18N_PATH
+        self.compiled_path = base_path / COMPILED_PATH
+        self._data = None
 
-        self.data = {}
-        self.load()
+    @property
+    def data(self):
+        if self._data is None:
+            self.load()
+        return self._data
 
     def load(self):
-        if self.i18n_path.is_file():
-            with open(self.i18n_path, 'r') as f:
-                self.data = yaml.load(f, Loader=yaml.SafeLoader)
+        source = self.i18n_path.read_bytes() if self.i18n_path.is_file() else None
+        key = catalogKey(source)
+
+        # Prefer a catalog compiled from the same YAML
+        for path in [self.compiled_path, CACHE_FILE]:
+            data = readCatalog(path, key)
+            if data is not None:
+                self._data = data
+                return
+
+        if source is None:
+            self._data = {}
+            return
+
+        # Compile the YAML again and cache it for the next process
+        self._data = parseYaml(source)
+        try:
+            atomicWrite(CACHE_FILE, marshal.dumps((key, self._data)))
+        except OSError:
+            pass
+
+    def compile(self):
+        """This function compiles the YAML into the catalog shipped next to it, e.g. before building the executable"""
+
+        source = self.i18n_path.read_bytes()
+        self._data = parseYaml(source)
+        atomicWrite(self.compiled_path, marshal.dumps((catalogKey(source), self._data)))
+
+        return self.compiled_path
 
     def get(self):
         return self.data
-    
+
     def getHelpOption(self, command, sub_command, option):
         if sub_command:
             option = self.data['english']['help'][command][sub_command]['options'][option]
         else:
             option = self.data['english']['help'][command]['options'][option]
-        
+
         return option
-    
+
     def getHelpExample(self, command, sub_command):
         if sub_command:
             example = self.data['english']['help'][command][sub_command]['examples']
         else:
             example = self.data['english']['help'][command]['examples']
-        
+
         return example
-    
+
+    def getCommandHelp(self, command):
+        return self.data['english']['commands'][command]
+
     def getErrorText(self, command, sub_command, error):
         if sub_command:
             error = self.data['english']['help'][command][sub_command]['errors'][error]
         else:
             error = self.data['english']['help'][command]['errors'][error]
-        
+
         return error
 
+
+def catalogKey(source):
+    """This function returns the key of a catalog compiled from the YAML, or None if the YAML is missing"""
+
+    if source is None:
+        return None
+    return f'{ marshal.version }:{ hashlib.sha1(source).hexdigest() }'
+
+
+def readCatalog(path, key):
+    """This function returns the text of a compiled catalog, or None if it is missing, unreadable or out of date"""
+
+    try:
+        compiled, data = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if key is not None and compiled != key:
+        return None
+    return data
+
+
+def parseYaml(source):
+    import yaml
+
+    # Use the much faster LibYAML parser when PyYAML was built with it
+    return yaml.load(source, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
 # Expose the class as a variable
-i18n = I18n()
\ No newline at end of file
+i18n = I18n()
+
+
+if __name__ == '__main__':
+
+    # Compile the catalog: python -m idmc_cli.i18n
+    print(i18n.compile())
@@ -0,0 +1,620 @@
+"""
+Local stand-in for the IDMC REST APIs used by the CLI, serving synthetic data.
+
+Usage:
+    python -m idmc_cli.mockserver [--port 8080] [--objects 10000] [--latency 0.05] [--throttle 0.01] [--errors 0.01]
+
+Point the CLI at it by setting the loginUrl and baseUrl keys in ~/.idmc-cli/config.json
+to the printed URL, with any username and password.
+"""
+import argparse
+import io
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+
+OBJECT_TYPES = ['DTEMPLATE', 'MTT', 'TASKFLOW', 'DSS', 'WORKFLOW', 'DMASK', 'PCS']
+JOB_STATUSES = ['COMPLETED', 'COMPLETED', 'COMPLETED', 'FAILED', 'RUNNING', 'QUEUED', 'STOPPED']
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def timestamp(seconds):
+    return (EPOCH + timedelta(seconds=seconds)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+class MockData:
+    """Synthetic org contents, generated deterministically from the record index"""
+
+    def __init__(self, users=100, groups=20, roles=20, objects=1000, logs=1000, jobs=1000, agents=5):
+        self.counts = {
+            'users': users,
+            'groups': groups,
+            'roles': roles,
+            'objects': objects,
+            'logs': logs,
+            'jobs': jobs,
+            'agents': agents
+        }
+        self.records = {
+            'users': self.user,
+            'groups': self.group,
+            'roles': self.role,
+            'objects': self.object,
+            'logs': self.log,
+            'jobs': self.job,
+            'agents': self.agent
+        }
+
+    def user(self, i):
+        return {
+            'id': f'user{ i:06d}',
+            'userName': f'user{ i }@example.com',
+            'firstName': f'First{ i }',
+            'lastName': f'Last{ i }',
+            'email': f'user{ i }@example.com',
+            'state': 'ENABLED',
+            'authentication': 0,
+            'roles': [{ 'id': f'role{ i % self.counts["roles"]:04d}', 'roleName': f'Role {i % self.counts["roles"] }' }],
+            'groups': [{ 'id': f'group{ i % max(1, self.counts["groups"]):04d}', 'userGroupName': f'Group { i % max(1, self.counts["groups"]) }' }],
+            'createTime': timestamp(i * 60),
+            'updateTime': timestamp(i * 90)
+        }
+
+    def group(self, i):
+        return {
+            'id': f'group{ i:04d}',
+            'userGroupName': f'Group { i }',
+            'description': f'Synthetic user group { i }',
+            'roles': [{ 'id': f'role{ i % self.counts["roles"]:04d}', 'roleName': f'Role { i % self.counts["roles"] }' }],
+            'users': []
+        }
+
+    def role(self, i):
+        return {
+            'id': f'role{ i:04d}',
+            'roleName': f'Role { i }',
+            'description': f'Synthetic role { i }',
+            'status': 'ENABLED',
+            'systemRole': i < 3,
+            'createTime': timestamp(i * 3600),
+            'updateTime': timestamp(i * 7200)
+        }
+
+    def object(self, i):
+        return {
+            'id': f'obj{ i:019d}',
+            'path': f'Project{ i % 10 }/Folder{ i // 10 % 20 }/asset{ i }',
+            'type': OBJECT_TYPES[i % len(OBJECT_TYPES)],
+            'description': f'Synthetic asset { i }',
+            'updatedBy': f'user{ i % max(1, self.counts["users"]) }@example.com',
+            'updateTime': timestamp(i * 45),
+            'tags': [f'tag{ i % 5 }'],
+            'sourceControl': {
+                'checkedOutBy': None,
+                'lastCheckinBy': f'user{ i % max(1, self.counts["users"]) }@example.com',
+                'hash': f'{ i:040x}'
+            },
+            'customAttributes': None
+        }
+
+    def log(self, i):
+        return {
+            'id': f'log{ i:010d}',
+            'entryTime': timestamp(i * 30),
+            'actor': f'user{ i % max(1, self.counts["users"]) }@example.com',
+            'actionCategory': ['USER', 'ROLE', 'ASSET', 'LOGIN'][i % 4],
+            'actionEvent': ['CREATE', 'UPDATE', 'DELETE', 'LOGIN'][i % 4],
+            'objectName': f'asset{ i % max(1, self.counts["objects"]) }',
+            'message': f'Synthetic security event { i }'
+        }
+
+    def job(self, i):
+        return {
+            'id': f'job{ i:010d}',
+            'runId': i,
+            'taskId': f'task{ i % 100:06d}',
+            'objectName': f'asset{ i % max(1, self.counts["objects"]) }',
+            'type': 'MTT_ACTIVITY_LOG',
+            'state': 1 if i % 7 else 3,
+            'startTime': timestamp(i * 120),
+            'endTime': timestamp(i * 120 + 60),
+            'successSourceRows': i * 10,
+            'successTargetRows': i * 10,
+            'errorMsg': None if i % 7 else 'Synthetic failure'
+        }
+
+    def jobLogEntry(self, i):
+        status = JOB_STATUSES[i % len(JOB_STATUSES)]
+        return {
+            'id': f'jle{ i:010d}',
+            'assetId': f'obj{ i % max(1, self.counts["objects"]):019d}',
+            'assetName': f'asset{ i % max(1, self.counts["objects"]) }',
+            'assetType': OBJECT_TYPES[i % len(OBJECT_TYPES)],
+            'location': f'Project{ i % 10 }/Folder{ i // 10 % 20 }',
+            'status': status,
+            'runtimeEnvName': f'Agent Group { i % max(1, self.counts["agents"]) }',
+            'startTime': timestamp(i * 120),
+            'endTime': None if status in ['RUNNING', 'QUEUED'] else timestamp(i * 120 + 60),
+            'errorMessage': 'Synthetic failure' if status == 'FAILED' else None,
+            'extraData': json.dumps({ 'pid': f'pid{ i }', 'saasTaskId': f'task{ i % 100:06d}' })
+        }
+
+    def agent(self, i):
+        return {
+            'id': f'agent{ i:04d}',
+            'name': f'Agent { i }',
+            'agentHost': f'agent{ i }.example.com',
+            'active': True,
+            'readyToRun': i % 3 != 2,
+            'agentVersion': '60.0.0',
+            'platform': 'linux64',
+            'runtimeEnvironmentId': f'rte{ i:04d}',
+            'orgId': 'mockorg'
+        }
+
+    def agentGroup(self, i):
+        return {
+            'id': f'rte{ i:04d}',
+            'name': f'Agent Group { i }',
+            'agents': [self.agent(i)],
+            'isShared': False
+        }
+
+    @lru_cache(maxsize=256)
+    def select(self, kind, filters):
+        """This function returns the indexes of the records matching a frozen set of (field, value) filters"""
+
+        record = self.records[kind]
+        return [i for i in range(self.counts[kind]) if all(str(record(i).get(field)) == value for field, value in filters)]
+
+    def page(self, kind, skip, limit, filters=()):
+        indexes = self.select(kind, frozenset(filters))
+        return len(indexes), [self.records[kind](i) for i in indexes[skip:skip + limit]]
+
+
+def parseQuery(q, fields):
+    """This function extracts field=="value" conditions from a v3 query, mapping query fields to record fields"""
+
+    filters = []
+    for field, value in re.findall(r'(\w+)\s*==\s*"([^"]*)"', q or ''):
+        if field in fields:
+            filters.append((fields[field], value))
+    return filters
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Routes IDMC API calls to the synthetic data of the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    routes = [
+        ('POST', r'/saas/public/core/v3/login', 'login'),
+        ('POST', r'/saas/public/core/v3/logout', 'logout'),
+        ('GET', r'/saas/public/core/v3/users', 'getUsers'),
+        ('POST', r'/saas/public/core/v3/users', 'createUser'),
+        ('DELETE', r'/saas/public/core/v3/users/(?P<id>[^/]+)', 'noContent'),
+        ('PUT', r'/saas/public/core/v3/users/(?P<id>[^/]+)/\w+', 'noContent'),
+        ('GET', r'/saas/public/core/v3/userGroups', 'getUserGroups'),
+        ('GET', r'/saas/public/core/v3/roles', 'getRoles'),
+        ('POST', r'/saas/public/core/v3/roles', 'createRole'),
+        ('DELETE', r'/saas/public/core/v3/roles/(?P<id>[^/]+)', 'noContent'),
+        ('PUT', r'/saas/public/core/v3/roles/(?P<id>[^/]+)/\w+', 'noContent'),
+        ('GET', r'/saas/public/core/v3/privileges', 'getPrivileges'),
+        ('GET', r'/saas/public/core/v3/objects', 'getObjects'),
+        ('GET', r'/saas/public/core/v3/objects/(?P<id>[^/]+)/references', 'getReferences'),
+        ('POST', r'/saas/public/core/v3/lookup', 'lookup'),
+        ('POST', r'/saas/public/core/v3/(?:TagObjects|UntagObjects)', 'noContent'),
+        ('GET', r'/saas/public/core/v3/securityLog', 'getSecurityLog'),
+        ('GET', r'/saas/public/core/v3/commitHistory', 'getCommitHistory'),
+        ('POST', r'/saas/public/core/v3/export', 'startExport'),
+        ('GET', r'/saas/public/core/v3/export/(?P<id>[^/]+)', 'getExport'),
+        ('GET', r'/saas/public/core/v3/export/(?P<id>[^/]+)/package', 'getExportPackage'),
+        ('POST', r'/saas/public/core/v3/import/package', 'uploadImport'),
+        ('POST', r'/saas/public/core/v3/import/(?P<id>[^/]+)', 'startImport'),
+        ('GET', r'/saas/public/core/v3/import/(?P<id>[^/]+)', 'getImport'),
+        ('GET', r'/saas/api/v2/org', 'getOrg'),
+        ('POST', r'/saas/api/v2/job', 'startJob'),
+        ('POST', r'/saas/api/v2/job/stop', 'stopJob'),
+        ('GET', r'/saas/api/v2/activity/activityLog', 'getActivityLog'),
+        ('GET', r'/saas/api/v2/activity/activityLog/(?P<id>[^/]+)', 'getActivityLogEntry'),
+        ('GET', r'/saas/api/v2/activity/activityMonitor', 'getActivityMonitor'),
+        ('GET', r'/saas/api/v2/agent', 'getAgents'),
+        ('GET', r'/saas/api/v2/agent/(?P<id>[^/]+)', 'getAgent'),
+        ('GET', r'/saas/api/v2/agent/details', 'getAgents'),
+        ('GET', r'/saas/api/v2/agent/details/(?P<id>[^/]+)', 'getAgent'),
+        ('GET', r'/saas/api/v2/runtimeEnvironment', 'getAgentGroups'),
+        ('GET', r'/saas/api/v2/runtimeEnvironment/(?P<id>[^/]+)', 'getAgentGroup'),
+        ('POST', r'/saas/api/v2/runtimeEnvironment/(?P<id>[^/]+)', 'getAgentGroup'),
+        ('GET', r"/jls-di/api/v1/Orgs\('(?P<org>[^']+)'\)/JobLogEntries", 'getJobLogEntries'),
+        ('GET', r'/active-bpel/rt/(?P<name>[^/]+)', 'startTaskflow'),
+        ('GET', r'/active-bpel/services/tf/status/(?P<id>[^/]+)', 'getTaskflowStatus'),
+        ('PUT', r'/active-bpel/restadmin/processes/(?P<id>[^/]+)/terminate', 'noContent')
+    ]
+
+    def setup(self):
+        super().setup()
+        self.server.count('connections')
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_PUT(self):
+        self.dispatch('PUT')
+
+    def do_PATCH(self):
+        self.dispatch('PATCH')
+
+    def do_DELETE(self):
+        self.dispatch('DELETE')
+
+    def dispatch(self, method):
+        url = urlparse(self.path)
+        self.query = { key: values[0] for key, values in parse_qs(url.query).items() }
+        length = int(self.headers.get('Content-Length', 0))
+        self.body = self.rfile.read(length) if length else b''
+        self.server.count('requests')
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        # Find the handler of the endpoint
+        path = unquote(url.path)
+        for route_method, pattern, name in self.routes:
+            match = re.fullmatch(pattern, path)
+            if match and route_method == method:
+                break
+        else:
+            return self.reply(404, { 'error': { 'code': 'NOT_FOUND', 'message': f'No mock for { method } { path }' } })
+
+        # Inject the configured throttling and transient failures
+        fault = self.server.fault()
+        if fault == 'throttle':
+            self.server.count('throttled')
+            return self.reply(429, { 'error': { 'code': 'TOO_MANY_REQUESTS' } }, { 'Retry-After': str(self.server.retry_after) })
+        elif fault == 'error':
+            self.server.count('errors')
+            return self.reply(503, { 'error': { 'code': 'SERVICE_UNAVAILABLE' } })
+
+        # Reject calls without a live session
+        if name not in ['login'] and not path.startswith('/active-bpel/') and not self.server.validSession(self.sessionId()):
+            self.server.count('unauthorized')
+            return self.reply(401, { 'error': { 'code': 'AUTH_01', 'message': 'Invalid session' } })
+
+        self.server.count(name)
+        status, body = getattr(self, name)(**match.groupdict())
+        self.reply(status, body)
+
+    def sessionId(self):
+        if self.headers.get('INFA-SESSION-ID'):
+            return self.headers.get('INFA-SESSION-ID')
+        if self.headers.get('icSessionId'):
+            return self.headers.get('icSessionId')
+        cookie = re.search(r'USER_SESSION=([^;]+)', self.headers.get('Cookie', ''))
+        return cookie.group(1) if cookie else None
+
+    def reply(self, status, body, headers=None):
+        if isinstance(body, bytes):
+            data, content_type = body, 'application/zip'
+        elif body is None:
+            data, content_type = b'', 'application/json'
+        else:
+            data, content_type = json.dumps(body).encode('utf-8'), 'application/json'
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def json(self):
+        return json.loads(self.body or b'{}')
+
+    def skipLimit(self, default=100):
+        return int(self.query.get('skip', 0)), int(self.query.get('limit', default))
+
+    # Session endpoints
+
+    def login(self):
+        user = self.json().get('username', 'mock')
+        sessionId = self.server.newSession()
+        return 200, {
+            'products': [{ 'name': 'Integration Cloud', 'baseApiUrl': self.server.url + '/saas' }],
+            'userInfo': { 'sessionId': sessionId, 'id': 'user000000', 'name': user, 'orgId': 'mockorg', 'orgName': 'Mock Org', 'status': 'Active' }
+        }
+
+    def logout(self):
+        self.server.endSession(self.sessionId())
+        return 200, None
+
+    def noContent(self, **kwargs):
+        return 204, None
+
+    # v3 core endpoints
+
+    def getUsers(self):
+        skip, limit = self.skipLimit()
+        filters = parseQuery(self.query.get('q'), { 'userId': 'id', 'userName': 'userName' })
+        return 200, self.server.data.page('users', skip, limit, filters)[1]
+
+    def createUser(self):
+        user = self.server.data.user(self.server.data.counts['users'])
+        user.update(self.json())
+        return 200, user
+
+    def getUserGroups(self):
+        skip, limit = self.skipLimit()
+        filters = parseQuery(self.query.get('q'), { 'userGroupId': 'id', 'userGroupName': 'userGroupName' })
+        return 200, self.server.data.page('groups', skip, limit, filters)[1]
+
+    def getRoles(self):
+        filters = parseQuery(self.query.get('q'), { 'roleId': 'id', 'roleName': 'roleName' })
+        roles = self.server.data.page('roles', 0, self.server.data.counts['roles'], filters)[1]
+        if self.query.get('expand') == 'privileges':
+            for role in roles:
+                role['privileges'] = self.getPrivileges()[1][:3]
+        return 200, roles
+
+    def createRole(self):
+        role = self.server.data.role(self.server.data.counts['roles'])
+        role.update(self.json())
+        return 200, role
+
+    def getPrivileges(self):
+        return 200, [{ 'id': f'priv{ i:04d}', 'name': f'privilege.{ i }', 'service': 'Admin', 'status': 'Enabled' } for i in range(20)]
+
+    def getObjects(self):
+        skip, limit = self.skipLimit()
+        filters = parseQuery(self.query.get('q'), { 'type': 'type' })
+
+        # Support the incremental listing of the objects updated since a date/time
+        since = re.search(r'updateTime\s*>=\s*"?([^\s"]+)', self.query.get('q') or '')
+        if since:
+            indexes = [i for i in self.server.data.select('objects', frozenset(filters)) if self.server.data.object(i)['updateTime'] >= since.group(1)]
+            return 200, { 'count': len(indexes), 'objects': [self.server.data.object(i) for i in indexes[skip:skip + limit]] }
+
+        count, objects = self.server.data.page('objects', skip, limit, filters)
+        return 200, { 'count': count, 'objects': objects }
+
+    def getReferences(self, id):
+        skip, limit = self.skipLimit(50)
+        total = int(re.sub(r'\D', '', id) or 0) % 120
+        references = [{ 'id': f'obj{ i:019d}', 'path': f'Project0/Folder0/asset{ i }', 'type': 'MTT', 'refType': 'Uses' } for i in range(skip, min(total, skip + min(limit, 50)))]
+        return 200, { 'count': total, 'references': references }
+
+    def lookup(self):
+        objects = []
+        for item in self.json().get('objects', []):
+            match = re.search(r'(\d+)$', item.get('id') or item.get('path') or '')
+            index = int(match.group(1)) if match else -1
+            if 0 <= index < self.server.data.counts['objects']:
+                found = self.server.data.object(index)
+                objects.append({ key: found[key] for key in ['id', 'path', 'type', 'description', 'updateTime'] })
+        return 200, { 'objects': objects }
+
+    def getSecurityLog(self):
+        skip, limit = self.skipLimit()
+        return 200, { 'entries': self.server.data.page('logs', skip, limit)[1] }
+
+    def getCommitHistory(self):
+        perPage, page = int(self.query.get('perPage', 100)), int(self.query.get('page', 1))
+        commits = [{ 'hash': f'{ i:040x}', 'summary': f'Commit { i }', 'committedBy': 'user0@example.com', 'date': timestamp(i * 600) } for i in range((page - 1) * perPage, min(250, page * perPage))]
+        return 200, { 'commits': commits }
+
+    def startExport(self):
+        return 200, { 'id': self.server.newId('export'), 'name': self.json().get('name'), 'status': { 'state': 'IN_PROGRESS' } }
+
+    def getExport(self, id):
+        return 200, { 'id': id, 'status': { 'state': 'SUCCESSFUL', 'message': 'Export completed successfully' }, 'objects': [] }
+
+    def getExportPackage(self, id):
+        package = io.BytesIO()
+        with zipfile.ZipFile(package, 'w') as archive:
+            archive.writestr('exportMetadata.v2.json', json.dumps({ 'id': id }))
+        return 200, package.getvalue()
+
+    def uploadImport(self):
+        return 200, { 'jobId': self.server.newId('import'), 'jobStatus': { 'state': 'NOT_STARTED' } }
+
+    def startImport(self, id):
+        return 200, { 'id': id, 'status': { 'state': 'IN_PROGRESS' } }
+
+    def getImport(self, id):
+        return 200, { 'id': id, 'status': { 'state': 'SUCCESSFUL', 'message': 'Import completed successfully' }, 'objects': [] }
+
+    # v2 endpoints
+
+    def getOrg(self):
+        return 200, [{ 'id': 'mockorg', 'orgUUID': 'mockorg-uuid', 'name': 'Mock Org' }]
+
+    def startJob(self):
+        body = self.json()
+        runId = self.server.newRun(body.get('taskFederatedId'))
+        return 200, { '@type': 'job', 'taskId': body.get('taskFederatedId'), 'taskFederatedId': body.get('taskFederatedId'), 'taskType': body.get('taskType'), 'runId': runId }
+
+    def stopJob(self):
+        return 200, None
+
+    def getActivityLog(self):
+        offset, rowLimit = int(self.query.get('offset', 0)), int(self.query.get('rowLimit', 100))
+
+        # Started jobs complete straight away
+        if self.query.get('runId'):
+            run = (self.query.get('taskId'), int(self.query.get('runId')))
+            return 200, [dict(self.server.data.job(run[1]), taskId=run[0], runId=run[1])] if run in self.server.runs else []
+
+        filters = [('taskId', self.query['taskId'])] if self.query.get('taskId') else []
+        return 200, self.server.data.page('jobs', offset, rowLimit, filters)[1]
+
+    def getActivityLogEntry(self, id):
+        match = re.search(r'(\d+)$', id)
+        return 200, self.server.data.job(int(match.group(1)) if match else 0)
+
+    def getActivityMonitor(self):
+        return 200, [dict(self.server.data.job(i), executionState='RUNNING') for i in range(min(5, self.server.data.counts['jobs']))]
+
+    def getAgents(self):
+        return 200, [self.server.data.agent(i) for i in range(self.server.data.counts['agents'])]
+
+    def getAgent(self, id):
+        match = re.search(r'(\d+)$', id)
+        return 200, self.server.data.agent(int(match.group(1)) if match else 0)
+
+    def getAgentGroups(self):
+        return 200, [self.server.data.agentGroup(i) for i in range(self.server.data.counts['agents'])]
+
+    def getAgentGroup(self, id):
+        match = re.search(r'(\d+)$', id)
+        return 200, self.server.data.agentGroup(int(match.group(1)) if match else 0)
+
+    # Job log and taskflow endpoints
+
+    def getJobLogEntries(self, org):
+        skip, top = int(self.query.get('$skip', 0)), int(self.query.get('$top', 100))
+        count = self.server.data.counts['jobs']
+        return 200, { 'value': [self.server.data.jobLogEntry(i) for i in range(skip, min(count, skip + top))] }
+
+    def startTaskflow(self, name):
+        return 200, { 'RunId': self.server.newId('tf') }
+
+    def getTaskflowStatus(self, id):
+        return 200, { 'status': 'SUCCESS', 'runId': id }
+
+
+class MockServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server standing in for IDMC.
+
+    Every request waits `latency` seconds, a `throttle` fraction is rejected with
+    429 and a Retry-After of `retryAfter` seconds, and an `errors` fraction fails
+    with 503. Sessions expire after `sessionTimeout` seconds when it is set.
+    Request, connection and fault counts are kept in `stats`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), data=None, latency=0, throttle=0, errors=0, retryAfter=0, sessionTimeout=None, seed=0, verbose=False):
+        super().__init__(address, MockHandler)
+        self.data = data or MockData()
+        self.latency = latency
+        self.throttle = throttle
+        self.errors = errors
+        self.retry_after = retryAfter
+        self.session_timeout = sessionTimeout
+        self.verbose = verbose
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self.sessions = {}
+        self.runs = set()
+        self.ids = Counter()
+        self.thread = None
+
+    @property
+    def url(self):
+        return f'http://{ self.server_address[0] }:{ self.server_address[1] }'
+
+    def start(self):
+        """This function serves requests on a background thread"""
+
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def fault(self):
+        with self.lock:
+            roll = self.random.random()
+        if roll < self.throttle:
+            return 'throttle'
+        elif roll < self.throttle + self.errors:
+            return 'error'
+        return None
+
+    def newId(self, prefix):
+        with self.lock:
+            self.ids[prefix] += 1
+            return f'{ prefix }{ self.ids[prefix]:06d}'
+
+    def newSession(self):
+        sessionId = self.newId('session')
+        with self.lock:
+            self.sessions[sessionId] = time.time()
+        return sessionId
+
+    def endSession(self, sessionId):
+        with self.lock:
+            self.sessions.pop(sessionId, None)
+
+    def validSession(self, sessionId):
+        with self.lock:
+            started = self.sessions.get(sessionId)
+        if started is None:
+            return False
+        return self.session_timeout is None or time.time() - started < self.session_timeout
+
+    def newRun(self, taskId):
+        with self.lock:
+            self.ids['run'] += 1
+            runId = self.ids['run']
+            self.runs.add((taskId, runId))
+        return runId
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8080, help='Port to listen on')
+    parser.add_argument('--users', type=int, default=100, help='Number of synthetic users')
+    parser.add_argument('--roles', type=int, default=20, help='Number of synthetic roles')
+    parser.add_argument('--objects', type=int, default=1000, help='Number of synthetic objects')
+    parser.add_argument('--logs', type=int, default=1000, help='Number of synthetic security log entries')
+    parser.add_argument('--jobs', type=int, default=1000, help='Number of synthetic activity log and job log entries')
+    parser.add_argument('--agents', type=int, default=5, help='Number of synthetic secure agents')
+    parser.add_argument('--latency', type=float, default=0, help='Delay added to every request in seconds')
+    parser.add_argument('--throttle', type=float, default=0, help='Fraction of requests rejected with 429')
+    parser.add_argument('--errors', type=float, default=0, help='Fraction of requests failing with 503')
+    parser.add_argument('--retry-after', type=float, default=0, help='Retry-After sent with 429 responses in seconds')
+    parser.add_argument('--session-timeout', type=float, default=None, help='Expire sessions after this many seconds')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the injected faults')
+    parser.add_argument('--verbose', action='store_true', help='Log every request')
+    args = parser.parse_args()
+
+    data = MockData(users=args.users, roles=args.roles, objects=args.objects, logs=args.logs, jobs=args.jobs, agents=args.agents)
+    server = MockServer((args.host, args.port), data, latency=args.latency, throttle=args.throttle, errors=args.errors, retryAfter=args.retry_after, sessionTimeout=args.session_timeout, seed=args.seed, verbose=args.verbose)
+    print(f'Mock IDMC listening on { server.url }')
+    print(f'Set "loginUrl" and "baseUrl" to "{ server.url }" in ~/.idmc-cli/config.json to use it')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(dict(server.stats), indent=4))
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import contextvars
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count as counter, islice
+from idmc_cli.stats import context
+from idmc_cli.trace import tracer
+
+class PageStyle:
+    """Describes how a list endpoint addresses its pages in the query string"""
+
+    def __init__(self, limit, offset, numbered=False):
+        self.limit = limit
+        self.offset = offset
+        self.numbered = numbered
+
+    def params(self, index, pageSize):
+        """This function returns the query parameters requesting the page at a zero based index"""
+
+        if self.numbered:
+            return { self.limit: pageSize, self.offset: index + 1 }
+        else:
+            return { self.limit: pageSize, self.offset: index * pageSize }
+
+
+# v3 core APIs, e.g. users and objects
+SKIP_LIMIT = PageStyle('limit', 'skip')
+
+# v2 activity log
+OFFSET_ROW_LIMIT = PageStyle('rowLimit', 'offset')
+
+# OData APIs, e.g. the job log
+ODATA = PageStyle('$top', '$skip')
+
+# Numbered pages, e.g. the source control commit history
+PAGE_PER_PAGE = PageStyle('perPage', 'page', numbered=True)
+
+
+class PageError(RuntimeError):
+    """Raised when a page of a list could not be fetched, so that a partial list is never mistaken for the whole"""
+
+    def __init__(self, page):
+        super().__init__(f'Unable to fetch page { page } of the results')
+        self.page = page
+
+
+class Paginator:
+    """
+    Fetches the pages of a list endpoint and yields the records of each page in order.
+
+    fetchPage(params) executes the API call with the paging parameters of the style
+    added to `params` and returns the decoded page, or None when the call failed, and
+    records(page) extracts the list of records from it. The first page is fetched on its
+    own; when count(page) reports the total number of records only the remaining pages
+    that exist are requested, otherwise pages are requested until the first empty page.
+    Up to `window` pages are in flight at once, so at most window - 1 pages past the end
+    are requested when the total is unknown. A PageError is raised when a page could not
+    be fetched, rather than ending the records early. The timing and size of every fetched
+    page is recorded in `metrics`.
+    """
+
+    def __init__(self, fetchPage, records, style=SKIP_LIMIT, pageSize=100, window=1, count=None):
+        self.fetchPage = fetchPage
+        self.records = records
+        self.style = style
+        self.page_size = pageSize
+        self.window = max(1, window)
+        self.count = count
+        self.metrics = []
+
+    def fetch(self, index):
+        """This function fetches a single page and records its metrics"""
+
+        # Tag the requests of this page with its number
+        context.page = index + 1
+        start = time.perf_counter()
+        with tracer.span('page', page=index + 1) as span:
+            try:
+                page = self.fetchPage(self.style.params(index, self.page_size))
+            finally:
+                context.page = None
+            items = self.records(page) if page is not None else None
+            if span:
+                span.set(records=len(items) if items is not None else None)
+        self.metrics.append({
+            'page': index + 1,
+            'records': len(items) if items is not None else None,
+            'seconds': round(time.perf_counter() - start, 3)
+        })
+
+        return page, items
+
+    def __iter__(self):
+
+        # Probe the result size with the first page
+        page, items = self.fetch(0)
+        if items is None:
+            raise PageError(1)
+        elif not items:
+            return
+        yield items
+
+        total = self.count(page) if self.count else None
+        if total is not None:
+            indexes = iter(range(1, -(-total // self.page_size)))
+        else:
+            indexes = counter(1)
+
+        with ThreadPoolExecutor(max_workers=self.window) as executor:
+
+            # Keep a sliding window of requests in flight and consume them in order,
+            # each within the context of the consumer so that it is traced as its child
+            futures = deque((index, executor.submit(contextvars.copy_context().run, self.fetch, index)) for index in islice(indexes, self.window))
+            while futures:
+                index, future = futures.popleft()
+                page, items = future.result()
+
+                # Stop at the first empty page, and fail at the first failed one
+                if not items:
+                    for _, future in futures:
+                        future.cancel()
+                    if items is None:
+                        raise PageError(index + 1)
+                    return
+
+                yield items
+
+                for index in islice(indexes, 1):
+                    futures.append((index, executor.submit(contextvars.copy_context().run, self.fetch, index)))
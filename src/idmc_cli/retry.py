@@ -0,0 +1,70 @@
+import random
+import requests
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+class RetryPolicy:
+    """Describes which failed API calls are retried and how long to wait between attempts"""
+
+    def __init__(self, statuses=(429, 502, 503, 504), errors=(requests.ConnectionError, requests.Timeout), relogin=(401,), maxAttempts=None, backoff=0.5, maxBackoff=30):
+        self.statuses = statuses
+        self.errors = errors
+        self.relogin = relogin
+        self.max_attempts = maxAttempts
+        self.backoff = backoff
+        self.max_backoff = maxBackoff
+
+    def delay(self, attempts, r=None):
+        """This function returns the number of seconds to wait before the next attempt"""
+
+        # Honour the server when it tells us how long to back off for
+        if r is not None:
+            retry_after = parseRetryAfter(r.headers.get('Retry-After'))
+            if retry_after is not None:
+                return retry_after
+
+        # Otherwise use exponential backoff with full jitter
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempts)))
+
+
+def parseRetryAfter(value):
+    """This function converts a Retry-After header (seconds or HTTP date) to seconds"""
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Reads and idempotent updates can be repeated on any transient failure
+IDEMPOTENT = RetryPolicy()
+
+# Writes that may already have been applied are only repeated when the server rejected them outright
+NON_IDEMPOTENT = RetryPolicy(statuses=(429, 503), errors=(requests.ConnectTimeout,))
+
+# Status polling of long running jobs tolerates any failure until the attempts run out
+POLLING = RetryPolicy(statuses=range(400, 600))
+
+# Login and logout calls must never trigger another login, but are repeated when throttled
+SESSION = RetryPolicy(statuses=(429, 502, 503, 504), relogin=())
+
+
+def policyFor(method):
+    """This function returns the default retry policy for an HTTP method"""
+
+    if method in ['GET', 'HEAD', 'PUT', 'DELETE']:
+        return IDEMPOTENT
+    else:
+        return NON_IDEMPOTENT
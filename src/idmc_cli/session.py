@@ -0,0 +1,80 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from idmc_cli.config import CONFIG_DIR
+from idmc_cli.utils import FileLock, atomicWrite
+
+SESSION_FILE = CONFIG_DIR / 'session.json'
+
+class SessionStore:
+    """
+    Session token shared by every thread and process of the CLI.
+
+    Tokens are saved per user and org together with their expiry time, and are
+    considered stale `margin` seconds before they expire so that they are refreshed
+    before IDMC rejects them. Refreshes happen under a re-entrant thread lock and
+    a file lock, so only one caller logs in however many hit an expired session
+    at the same time.
+    """
+
+    def __init__(self, owner, timeout=1800, margin=60, path=SESSION_FILE):
+        self.owner = owner
+        self.timeout = timeout
+        self.margin = margin
+        self.path = path
+        self.file_lock = FileLock(path.with_suffix('.lock'))
+        self.thread_lock = threading.RLock()
+        self.depth = 0
+        self.session_id = None
+        self.expires = 0
+        self.load()
+
+    @contextmanager
+    def lock(self):
+        """Holds the session exclusively across threads and processes"""
+
+        with self.thread_lock:
+            if self.depth == 0:
+                self.file_lock.acquire()
+            self.depth += 1
+            try:
+                yield self
+            finally:
+                self.depth -= 1
+                if self.depth == 0:
+                    self.file_lock.release()
+
+    def read(self):
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def load(self):
+        """This function reads the latest shared session of this user and org"""
+
+        session = self.read().get(self.owner, {})
+        self.session_id = session.get('sessionId')
+        self.expires = session.get('expires', 0)
+
+    def save(self, sessionId):
+        """This function shares a new session with other threads and processes"""
+
+        with self.lock():
+            self.session_id = sessionId
+            self.expires = time.time() + self.timeout if sessionId else 0
+
+            # Keep the sessions of any other users or orgs
+            data = self.read()
+            if sessionId:
+                data[self.owner] = { 'sessionId': self.session_id, 'expires': self.expires }
+            else:
+                data.pop(self.owner, None)
+            atomicWrite(self.path, json.dumps(data, indent=4))
+
+    def valid(self):
+        """This function checks if the session can still be used without refreshing it"""
+
+        return self.session_id is not None and time.time() < self.expires - self.margin
@@ -0,0 +1,190 @@
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# Details of the request in progress on each thread, i.e. the timings of any new
+# connection it opened and the page of a paginated list it is fetching
+context = threading.local()
+
+
+class TimedConnection:
+    """Records how long DNS resolution, the TCP connect and the TLS handshake of a new connection take"""
+
+    def _new_conn(self):
+        host = self._dns_host
+
+        start = time.perf_counter()
+        try:
+            address = socket.getaddrinfo(host, self.port, 0, socket.SOCK_STREAM)[0][4][0]
+        except OSError:
+            # Let urllib3 raise its usual error for the failed lookup
+            address = host
+        resolved = time.perf_counter()
+
+        # Connect to the resolved address so that the host is not looked up twice,
+        # falling back to every address of the host if it is unreachable
+        try:
+            self._dns_host = address
+            sock = super()._new_conn()
+        except Exception:
+            if address == host:
+                raise
+            self._dns_host = host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = host
+
+        context.connection = { 'dns': resolved - start, 'connect': time.perf_counter() - resolved, 'tls': 0 }
+        return sock
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+
+        # Whatever connect spent beyond opening the socket was the TLS handshake
+        timings = getattr(context, 'connection', None)
+        if timings is not None:
+            timings['tls'] = max(0, time.perf_counter() - start - timings['dns'] - timings['connect'])
+
+
+class TimedHTTPConnection(TimedConnection, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnection, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Pooled adapter whose connections record their setup timings"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = { 'http': TimedHTTPConnectionPool, 'https': TimedHTTPSConnectionPool }
+
+
+def endpointOf(method, url):
+    """This function returns the endpoint of a URL, with the IDs in its path replaced by {id}"""
+
+    path = re.sub(r"\('[^']*'\)", "('{id}')", urlparse(url).path)
+    segments = ['{id}' if re.search(r'\d', segment) and not re.fullmatch(r'v\d+', segment) else segment for segment in path.split('/')]
+    return f'{ method } { "/".join(segments) }'
+
+
+class RequestStats:
+    """
+    Timings of every HTTP call made by the API client, aggregated per endpoint.
+
+    Each attempt of a call is recorded with the DNS, connect and TLS time of any new
+    connection it opened, the time to the first byte of the response and in total, the
+    bytes sent and received, whether it was retried or caused a re-login, and the page
+    it fetched when part of a paginated list. Nothing is recorded until enabled, which
+    --stats does for every client before the command builds one.
+    """
+
+    enabled = False
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []
+
+    def start(self):
+        """This function clears the timings left on the current thread by an earlier request"""
+
+        context.connection = None
+
+    def record(self, method, url, started, r=None, outcome='ok'):
+        """This function records an attempt of a call once its response has been read"""
+
+        if not self.enabled:
+            return
+
+        total = time.perf_counter() - started
+        connection = getattr(context, 'connection', None) or { 'dns': 0, 'connect': 0, 'tls': 0 }
+        setup = connection['dns'] + connection['connect'] + connection['tls']
+        body = r.request.body if r is not None else None
+
+        record = {
+            'endpoint': endpointOf(method, url),
+            'status': r.status_code if r is not None else None,
+            'outcome': outcome,
+            'page': getattr(context, 'page', None),
+            'dns': connection['dns'],
+            'connect': connection['connect'],
+            'tls': connection['tls'],
+            'ttfb': max(0, r.elapsed.total_seconds() - setup) if r is not None else None,
+            'total': total,
+            'bytesOut': len(body) if body else 0,
+            'bytesIn': len(r.content) if r is not None else 0
+        }
+        with self.lock:
+            self.records.append(record)
+
+    def summary(self):
+        """This function aggregates the recorded attempts per endpoint"""
+
+        with self.lock:
+            records = list(self.records)
+
+        endpoints = defaultdict(list)
+        for record in records:
+            endpoints[record['endpoint']].append(record)
+
+        rows = []
+        for endpoint, items in sorted(endpoints.items(), key=lambda item: -sum(record['total'] for record in item[1])):
+            totals = sorted(record['total'] for record in items)
+            ttfbs = [record['ttfb'] for record in items if record['ttfb'] is not None]
+            opened = [record for record in items if record['connect']]
+            rows.append({
+                'endpoint': endpoint,
+                'calls': len(items),
+                'retries': sum(1 for record in items if record['outcome'] == 'retry'),
+                'relogins': sum(1 for record in items if record['outcome'] == 'relogin'),
+                'errors': sum(1 for record in items if record['status'] is None or record['status'] >= 400),
+                'pages': max((record['page'] or 0 for record in items), default=0),
+                'connections': len(opened),
+                'dns': sum(record['dns'] for record in opened) / len(opened) if opened else 0,
+                'connect': sum(record['connect'] for record in opened) / len(opened) if opened else 0,
+                'tls': sum(record['tls'] for record in opened) / len(opened) if opened else 0,
+                'ttfb': sum(ttfbs) / len(ttfbs) if ttfbs else 0,
+                'avg': sum(totals) / len(totals),
+                'p95': totals[max(0, -(-len(totals) * 95 // 100) - 1)],
+                'total': sum(totals),
+                'bytesOut': sum(record['bytesOut'] for record in items),
+                'bytesIn': sum(record['bytesIn'] for record in items)
+            })
+
+        return rows
+
+    def format(self):
+        """
+        This function formats the summary as a table, with times in milliseconds.
+
+        The dns, connect and tls columns are averaged over the new connections opened,
+        ttfb and avg over every attempt, and total is the time spent on the endpoint.
+        """
+
+        columns = ['calls', 'retries', 'relogins', 'errors', 'pages', 'connections', 'dns', 'connect', 'tls', 'ttfb', 'avg', 'p95', 'total', 'bytesOut', 'bytesIn']
+        times = ['dns', 'connect', 'tls', 'ttfb', 'avg', 'p95', 'total']
+
+        rows = self.summary()
+        width = max([len('endpoint')] + [len(row['endpoint']) for row in rows])
+        lines = [f'{ "endpoint":<{ width }}' + ''.join(f'{ column:>12}' for column in columns)]
+        for row in rows:
+            lines.append(f'{ row["endpoint"]:<{ width }}' + ''.join(f'{ round(row[column] * 1000, 1) if column in times else row[column]:>12}' for column in columns))
+
+        return '\n'.join(lines)
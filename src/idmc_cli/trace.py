@@ -0,0 +1,164 @@
+import contextvars
+import functools
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+
+# The span in progress, inherited by threads that copy the context of their caller
+current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    """A timed operation within the span tree of a command"""
+
+    def __init__(self, name, traceId, parentId=None, kind='internal', attributes=None, start=None):
+        self.name = name
+        self.trace_id = traceId
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parentId
+        self.kind = kind
+        self.attributes = dict(attributes or {})
+        self.start = start or time.time_ns()
+        self.end = None
+        self.error = None
+        self.thread = threading.get_ident()
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+
+class Tracer:
+    """
+    Collects the spans of a command so they can be written as a trace file.
+
+    Spans nest under the span in progress in the calling context, including across the
+    worker threads of the paginator and the async client which copy their caller's
+    context. Nothing is recorded until enabled.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_id = secrets.token_hex(16)
+        self.lock = threading.Lock()
+        self.spans = []
+
+    @contextmanager
+    def span(self, name, kind='internal', **attributes):
+        """Records the enclosed block as a child of the span in progress"""
+
+        if not self.enabled:
+            yield None
+            return
+
+        parent = current_span.get()
+        span = Span(name, self.trace_id, parent.span_id if parent else None, kind, attributes)
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f'{ type(e).__name__ }: { e }'
+            raise
+        finally:
+            current_span.reset(token)
+            span.end = time.time_ns()
+            with self.lock:
+                self.spans.append(span)
+
+    def record(self, name, started, kind='internal', **attributes):
+        """This function records an operation that started at a perf_counter time and has just finished"""
+
+        if not self.enabled:
+            return
+
+        end = time.time_ns()
+        parent = current_span.get()
+        span = Span(name, self.trace_id, parent.span_id if parent else None, kind, attributes, start=end - int((time.perf_counter() - started) * 1e9))
+        span.end = end
+        with self.lock:
+            self.spans.append(span)
+
+    def chromeTrace(self):
+        """This function returns the spans as Chrome trace events, viewable in chrome://tracing or Perfetto"""
+
+        threads = {}
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            args = dict(span.attributes, spanId=span.span_id, parentId=span.parent_id)
+            if span.error:
+                args['error'] = span.error
+            events.append({
+                'name': span.name,
+                'cat': span.kind,
+                'ph': 'X',
+                'ts': span.start / 1000,
+                'dur': (span.end - span.start) / 1000,
+                'pid': os.getpid(),
+                'tid': threads.setdefault(span.thread, len(threads) + 1),
+                'args': args
+            })
+
+        return { 'traceEvents': events, 'displayTimeUnit': 'ms' }
+
+    def otlpTrace(self):
+        """This function returns the spans in the OTLP JSON encoding of OpenTelemetry"""
+
+        kinds = { 'internal': 1, 'client': 3 }
+        spans = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            item = {
+                'traceId': span.trace_id,
+                'spanId': span.span_id,
+                'name': span.name,
+                'kind': kinds.get(span.kind, 1),
+                'startTimeUnixNano': str(span.start),
+                'endTimeUnixNano': str(span.end),
+                'attributes': [{ 'key': key, 'value': otlpValue(value) } for key, value in span.attributes.items() if value is not None],
+                'status': { 'code': 2, 'message': span.error } if span.error else { 'code': 0 }
+            }
+            if span.parent_id:
+                item['parentSpanId'] = span.parent_id
+            spans.append(item)
+
+        return {
+            'resourceSpans': [{
+                'resource': { 'attributes': [{ 'key': 'service.name', 'value': { 'stringValue': 'idmc-cli' } }] },
+                'scopeSpans': [{ 'scope': { 'name': 'idmc_cli' }, 'spans': spans }]
+            }]
+        }
+
+    def write(self, path, format='chrome'):
+        """This function writes the recorded spans to a trace file"""
+
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.otlpTrace() if format == 'otlp' else self.chromeTrace(), file)
+
+
+def otlpValue(value):
+    if isinstance(value, bool):
+        return { 'boolValue': value }
+    elif isinstance(value, int):
+        return { 'intValue': str(value) }
+    elif isinstance(value, float):
+        return { 'doubleValue': value }
+    else:
+        return { 'stringValue': str(value) }
+
+
+def traced(name, func):
+    """This function wraps an API method so that each call is recorded as a span"""
+
+    @functools.wraps(func)
+    def method(*args, **kwargs):
+        if not tracer.enabled:
+            return func(*args, **kwargs)
+        with tracer.span(name):
+            return func(*args, **kwargs)
+
+    return method
+
+
+# Expose the class as a variable
+tracer = Tracer()
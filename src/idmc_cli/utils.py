@@ -0,0 +1,129 @@
+import io
+import os
+import queue
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class FileLock:
+    """Exclusive advisory lock on a file, shared between processes"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.file = None
+
+    def acquire(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'a+')
+
+        if fcntl:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            # Windows only supports a non blocking lock of a byte range, so keep trying
+            self.file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(0.05)
+
+    def release(self):
+        if fcntl:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+
+        self.file.close()
+        self.file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def atomicWrite(path, text):
+    """This function replaces the contents of a file with text or bytes so that readers never see a partial write"""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f'.{ path.name }.', suffix='.tmp')
+    try:
+        with (os.fdopen(fd, 'wb') if isinstance(text, bytes) else os.fdopen(fd, 'w', encoding='utf-8')) as file:
+            file.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def compressedFile(compression):
+    """This function returns a function that wraps a binary file to compress what is written to it, by the suffix of the compression"""
+
+    if compression == '.gz':
+        import gzip
+        return lambda file: gzip.GzipFile(fileobj=file, mode='wb')
+
+    # Zstandard is in the standard library from Python 3.14, and otherwise needs the zstandard package
+    try:
+        from compression import zstd
+        return lambda file: zstd.ZstdFile(file, mode='wb')
+    except ImportError:
+        import zstandard
+        return lambda file: zstandard.ZstdCompressor().stream_writer(file)
+
+
+class CompressedWriter(io.RawIOBase):
+    """
+    Binary file that compresses what is written to it on a background thread, so that the
+    compression overlaps with fetching the records being written. Writes wait while too many
+    chunks are queued, and any error of the thread is raised by the next write or by close.
+    """
+
+    def __init__(self, path, compression, queueSize=64):
+        self.compress = compressedFile(compression)
+        self.queue = queue.Queue(maxsize=queueSize)
+        self.error = None
+        self.thread = threading.Thread(target=self.run, args=(path,), daemon=True)
+        self.thread.start()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.error:
+            raise self.error
+        self.queue.put(bytes(data))
+        return len(data)
+
+    def run(self, path):
+        try:
+            with open(path, 'wb') as file, self.compress(file) as stream:
+                while (data := self.queue.get()) is not None:
+                    stream.write(data)
+        except Exception as e:
+            self.error = e
+
+            # Keep taking chunks so that writes do not wait forever
+            while self.queue.get() is not None:
+                pass
+
+    def close(self):
+        if not self.closed:
+            self.queue.put(None)
+            self.thread.join()
+        super().close()
+        if self.error:
+            raise self.error
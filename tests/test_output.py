@@ -0,0 +1,70 @@
+import click
+import polars as pl
+import pytest
+from click.testing import CliRunner
+from idmc_cli.cli import output_options, write_output
+
+
+def makeRecords(count=2000):
+    return [{ 'id': f'obj{ i:019d}', 'path': f'Project{ i % 10 }/asset{ i }', 'tags': [f'tag{ i % 5 }'] } for i in range(count)]
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow', '.feather'])
+def test_columnar_compression(tmp_path, suffix):
+    sizes = {}
+    for compression in ['lz4', 'uncompressed']:
+        out_path = tmp_path / f'{ compression }{ suffix }'
+        write_output(str(out_path), None, makeRecords(), compression=compression)
+        read = pl.read_parquet if suffix == '.parquet' else pl.read_ipc
+        assert read(out_path).to_dicts() == makeRecords()
+        sizes[compression] = out_path.stat().st_size
+
+    assert sizes['lz4'] < sizes['uncompressed']
+
+
+def test_parquet_compression(tmp_path):
+    sizes = set()
+    for compression in ['zstd', 'gzip', 'uncompressed']:
+        out_path = tmp_path / f'{ compression }.parquet'
+        write_output(str(out_path), None, iter(makeRecords()), compression=compression)
+        sizes.add(out_path.stat().st_size)
+
+    assert len(sizes) == 3
+
+
+@pytest.mark.parametrize('suffix', ['.arrow', '.feather'])
+def test_arrow_unsupported_compression(tmp_path, suffix):
+    with pytest.raises(click.BadParameter):
+        write_output(str(tmp_path / f'out{ suffix }'), None, makeRecords(), compression='gzip')
+
+
+@click.command()
+@click.option('--output', '-O', 'output', default=None, required=False, type=click.STRING)
+@output_options
+def getRecords(output, ndjson, compression, row_group_size, unnest):
+    write_output(output, None, iter(makeRecords()), compression=compression, row_group_size=row_group_size, unnest=unnest)
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow', '.feather'])
+def test_compression_option(tmp_path, suffix):
+    sizes = {}
+    for compression in ['lz4', 'uncompressed']:
+        out_path = tmp_path / f'{ compression }{ suffix }'
+        result = CliRunner().invoke(getRecords, ['-O', str(out_path), '-C', compression, '-R', '500'])
+        assert result.exit_code == 0, result.output
+        sizes[compression] = out_path.stat().st_size
+
+    assert sizes['lz4'] < sizes['uncompressed']
+
+
+def test_late_fields(tmp_path, monkeypatch):
+    import idmc_cli.cli
+    monkeypatch.setattr(idmc_cli.cli, 'write_batch_size', 2)
+    records = [{ 'id': 1 }, { 'id': 2 }, { 'id': 3, 'extra': 'x' }, { 'id': 4, 'tags': ['a'] }, { 'id': 5 }]
+
+    write_output(str(tmp_path / 'list.csv'), None, records)
+    write_output(str(tmp_path / 'stream.csv'), None, iter(records))
+
+    streamed = pl.read_csv(tmp_path / 'stream.csv')
+    assert streamed.columns == ['id', 'extra', 'tags']
+    assert streamed.equals(pl.read_csv(tmp_path / 'list.csv'))
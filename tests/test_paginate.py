@@ -0,0 +1,24 @@
+import pytest
+from idmc_cli.paginate import Paginator, PageError
+
+
+def makeFetchPage(total, failed=()):
+    def fetchPage(params):
+        if params['skip'] // params['limit'] + 1 in failed:
+            return None
+        return list(range(params['skip'], min(params['skip'] + params['limit'], total)))
+    return fetchPage
+
+
+@pytest.mark.parametrize('window', [1, 4])
+def test_all_pages(window):
+    pages = list(Paginator(makeFetchPage(95), lambda page: page, pageSize=10, window=window))
+    assert [item for page in pages for item in page] == list(range(95))
+
+
+@pytest.mark.parametrize('window', [1, 4])
+@pytest.mark.parametrize('failed', [1, 2, 6])
+def test_failed_page(window, failed):
+    with pytest.raises(PageError) as e:
+        list(Paginator(makeFetchPage(95, failed=[failed]), lambda page: page, pageSize=10, window=window))
+    assert e.value.page == failed